@@ -6,6 +6,7 @@ import { StatusBar } from 'expo-status-bar';
 import { StyleSheet } from 'react-native';
 import HomeScreen from './src/screens/HomeScreen';
 import LogWorkoutScreen from './src/screens/LogWorkoutScreen';
+import LoginScreen from './src/screens/LoginScreen';
 
 const Stack = createStackNavigator();
 
@@ -20,6 +21,11 @@ export default function App() {
             component={HomeScreen} 
             options={{ title: 'FitBro' }}
           />
+          <Stack.Screen 
+            name="Login" 
+            component={LoginScreen} 
+            options={{ title: 'Log In' }}
+          />
           <Stack.Screen 
             name="LogWorkout" 
             component={LogWorkoutScreen} 
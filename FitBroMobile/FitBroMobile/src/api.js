@@ -0,0 +1,116 @@
+// src/api.js
+// Backend access for the app: the logged-in session and authenticated requests.
+// Access tokens are short-lived; a request that gets a 401 renews the session with
+// the refresh token and is retried once. The session lives in memory, so the app
+// asks for a login again after it is restarted.
+
+export const API_BASE = "http://192.168.0.110:8000"; // Replace with your actual IP
+// Find your IP with: ipconfig (Windows) or ifconfig (Mac/Linux)
+
+const PAGE_LIMIT = 50;
+
+let session = null; // { accessToken, refreshToken, role, name, gymId }
+let renewing = null;
+
+export async function login(mobile, password) {
+  const response = await fetch(`${API_BASE}/auth/login`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/x-www-form-urlencoded' },
+    body: new URLSearchParams({ username: mobile, password }).toString(),
+  });
+  if (!response.ok) throw new Error('Invalid mobile or password');
+  const data = await response.json();
+  session = { gymId: data.gym_id ?? null };
+  saveTokens(data);
+  return session;
+}
+
+export function logout() {
+  if (session) {
+    fetch(`${API_BASE}/auth/logout`, {
+      method: 'POST',
+      headers: { ...getAuthHeaders(), 'Content-Type': 'application/json' },
+      body: JSON.stringify({ refresh_token: session.refreshToken }),
+    }).catch(() => {});
+  }
+  session = null;
+}
+
+export function getAuthHeaders() {
+  return session ? { Authorization: `Bearer ${session.accessToken}` } : {};
+}
+
+export function getSession() {
+  return session;
+}
+
+function saveTokens(data) {
+  session = {
+    ...session,
+    accessToken: data.access_token,
+    refreshToken: data.refresh_token,
+    role: data.role,
+    name: data.name,
+  };
+}
+
+// Each refresh token works once (presenting it twice revokes the session), so
+// concurrent requests share a single in-flight renewal
+function refreshSession() {
+  if (!renewing) {
+    renewing = renew().finally(() => { renewing = null; });
+  }
+  return renewing;
+}
+
+async function renew() {
+  if (!session) return false;
+  const response = await fetch(`${API_BASE}/auth/refresh`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ refresh_token: session.refreshToken }),
+  });
+  if (!response.ok) {
+    session = null;
+    return false;
+  }
+  saveTokens(await response.json());
+  return true;
+}
+
+export class SessionExpiredError extends Error {
+  constructor() {
+    super('Your session has expired. Please log in again.');
+  }
+}
+
+// fetch() against the API with the session's token; renews it once on a 401
+export async function apiFetch(path, options = {}) {
+  const send = () => fetch(`${API_BASE}${path}`, {
+    ...options,
+    headers: { ...options.headers, ...getAuthHeaders() },
+  });
+  let response = await send();
+  if (response.status === 401) {
+    if (!(await refreshSession())) throw new SessionExpiredError();
+    response = await send();
+  }
+  return response;
+}
+
+export class NoGymError extends Error {
+  constructor() {
+    super('This account is not linked to a gym.');
+  }
+}
+
+// List endpoints return { items, next_cursor } pages scoped to the logged-in user's
+// gym; fetches one page, pass the previous page's next_cursor for the one after it
+export async function fetchPage(path, params = {}, cursor = null) {
+  if (!session?.gymId) throw new NoGymError();
+  const query = new URLSearchParams({ gym_id: session.gymId, limit: PAGE_LIMIT, ...params });
+  if (cursor) query.set('cursor', cursor);
+  const response = await apiFetch(`${path}?${query}`);
+  if (!response.ok) throw new Error(`Request failed: ${response.status}`);
+  return response.json();
+}
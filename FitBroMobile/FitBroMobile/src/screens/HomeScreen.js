@@ -11,6 +11,7 @@ import {
 } from 'react-native';
 import { LinearGradient } from 'expo-linear-gradient';
 import { Ionicons } from '@expo/vector-icons';
+import { getSession } from '../api';
 
 const { width, height } = Dimensions.get('window');
 
@@ -64,7 +65,7 @@ const HomeScreen = ({ navigation }) => {
           
           <TouchableOpacity
             style={styles.ctaButton}
-            onPress={() => navigation.navigate('LogWorkout')}
+            onPress={() => navigation.navigate(getSession() ? 'LogWorkout' : 'Login')}
           >
             <Ionicons name="fitness" size={24} color="#fff" />
             <Text style={styles.ctaButtonText}>Start Workout</Text>
@@ -135,7 +136,7 @@ const HomeScreen = ({ navigation }) => {
         </Text>
         <TouchableOpacity
           style={styles.ctaSecondaryButton}
-          onPress={() => navigation.navigate('LogWorkout')}
+          onPress={() => navigation.navigate(getSession() ? 'LogWorkout' : 'Login')}
         >
           <Text style={styles.ctaSecondaryButtonText}>Log Your Workout</Text>
           <Ionicons name="arrow-forward" size={20} color="#667eea" />
@@ -13,43 +13,45 @@ import {
 } from 'react-native';
 import { Picker } from '@react-native-picker/picker';
 import { Ionicons } from '@expo/vector-icons';
+import { apiFetch, NoGymError, SessionExpiredError } from '../api';
+import { usePagedList } from '../usePagedList';
 
 const { width } = Dimensions.get('window');
-const API_BASE = "http://192.168.0.110:8000"; // Replace with your actual IP
-
-// Note: Replace with your actual server IP address
-// Find your IP with: ipconfig (Windows) or ifconfig (Mac/Linux)
-
-function getAuthHeaders() {
-  // For mobile app, we'll use a simple token storage
-  // In production, use secure storage like AsyncStorage
-  const token = "your-auth-token-here"; // Replace with actual token
-  return token ? { Authorization: `Bearer ${token}` } : {};
-}
 
 function isTimeBased(entry) {
   return entry && entry.planned_minutes !== null && entry.planned_minutes !== undefined;
 }
 
-const LogWorkoutScreen = () => {
-  const [members, setMembers] = useState([]);
+const LogWorkoutScreen = ({ navigation }) => {
+  const memberList = usePagedList();
   const [selectedMember, setSelectedMember] = useState("");
   const [cycles, setCycles] = useState([]);
   const [selectedCycle, setSelectedCycle] = useState("");
-  const [planEntries, setPlanEntries] = useState([]);
-  const [logs, setLogs] = useState([]);
+  const planEntryList = usePagedList();
+  const logList = usePagedList();
   const [loading, setLoading] = useState(false);
 
+  const members = memberList.items;
+  const planEntries = planEntryList.items;
+  const setLogs = logList.setItems;
+  const logs = logList.items.filter(l =>
+    l.member_id === Number(selectedMember) &&
+    l.cycle_number === Number(selectedCycle)
+  );
+
+  // Back to the login screen when the session is gone or has no gym to log for
+  function onSessionExpired(error) {
+    Alert.alert(error instanceof NoGymError ? 'No gym' : 'Session expired', error.message);
+    navigation.replace('Login');
+  }
+
   // Load members
   useEffect(() => {
     const loadMembers = async () => {
       try {
-        const response = await fetch(`${API_BASE}/members/`, { 
-          headers: getAuthHeaders() 
-        });
-        const data = await response.json();
-        setMembers(data);
+        await memberList.load('/members/');
       } catch (error) {
+        if (error instanceof SessionExpiredError || error instanceof NoGymError) return onSessionExpired(error);
         Alert.alert('Error', 'Failed to load members. Please check your connection.');
         console.error('Error loading members:', error);
       }
@@ -72,13 +74,12 @@ const LogWorkoutScreen = () => {
     
     const loadPlanEntries = async () => {
       try {
-        const response = await fetch(
-          `${API_BASE}/workout-plan-entries/?member_id=${selectedMember}&cycle_number=${selectedCycle}`,
-          { headers: getAuthHeaders() }
-        );
-        const data = await response.json();
-        setPlanEntries(data);
+        await planEntryList.load('/workout-plan-entries/', {
+          member_id: selectedMember,
+          cycle_number: selectedCycle,
+        });
       } catch (error) {
+        if (error instanceof SessionExpiredError) return onSessionExpired(error);
         Alert.alert('Error', 'Failed to load workout plan');
         console.error('Error loading plan entries:', error);
       } finally {
@@ -96,16 +97,9 @@ const LogWorkoutScreen = () => {
     
     const loadLogs = async () => {
       try {
-        const response = await fetch(`${API_BASE}/workout-logs/`, { 
-          headers: getAuthHeaders() 
-        });
-        const data = await response.json();
-        const filtered = data.filter(l =>
-          l.member_id === Number(selectedMember) &&
-          l.cycle_number === Number(selectedCycle)
-        );
-        setLogs(filtered);
+        await logList.load('/workout-logs/', { member_id: selectedMember });
       } catch (error) {
+        if (error instanceof SessionExpiredError) return onSessionExpired(error);
         Alert.alert('Error', 'Failed to load workout logs');
         console.error('Error loading logs:', error);
       } finally {
@@ -183,15 +177,12 @@ const LogWorkoutScreen = () => {
     try {
       const method = log.id ? "PATCH" : "POST";
       const url = log.id 
-        ? `${API_BASE}/workout-logs/${log.id}` 
-        : `${API_BASE}/workout-logs/`;
+        ? `/workout-logs/${log.id}` 
+        : `/workout-logs/`;
       
-      const response = await fetch(url, {
+      const response = await apiFetch(url, {
         method,
-        headers: { 
-          ...getAuthHeaders(), 
-          "Content-Type": "application/json" 
-        },
+        headers: { "Content-Type": "application/json" },
         body: JSON.stringify(log)
       });
       
@@ -200,16 +191,9 @@ const LogWorkoutScreen = () => {
       Alert.alert('Success', 'Marked as completed!');
       
       // Refresh logs
-      const logsResponse = await fetch(`${API_BASE}/workout-logs/`, { 
-        headers: getAuthHeaders() 
-      });
-      const logsData = await logsResponse.json();
-      const filtered = logsData.filter(l =>
-        l.member_id === Number(selectedMember) &&
-        l.cycle_number === Number(selectedCycle)
-      );
-      setLogs(filtered);
+      await logList.load('/workout-logs/', { member_id: selectedMember });
     } catch (error) {
+      if (error instanceof SessionExpiredError) return onSessionExpired(error);
       Alert.alert('Error', error.message);
     }
   };
@@ -229,15 +213,12 @@ const LogWorkoutScreen = () => {
     try {
       const method = log.id ? "PATCH" : "POST";
       const url = log.id 
-        ? `${API_BASE}/workout-logs/${log.id}` 
-        : `${API_BASE}/workout-logs/`;
+        ? `/workout-logs/${log.id}` 
+        : `/workout-logs/`;
       
-      const response = await fetch(url, {
+      const response = await apiFetch(url, {
         method,
-        headers: { 
-          ...getAuthHeaders(), 
-          "Content-Type": "application/json" 
-        },
+        headers: { "Content-Type": "application/json" },
         body: JSON.stringify(log)
       });
       
@@ -246,20 +227,34 @@ const LogWorkoutScreen = () => {
       Alert.alert('Success', 'Marked as skipped.');
       
       // Refresh logs
-      const logsResponse = await fetch(`${API_BASE}/workout-logs/`, { 
-        headers: getAuthHeaders() 
-      });
-      const logsData = await logsResponse.json();
-      const filtered = logsData.filter(l =>
-        l.member_id === Number(selectedMember) &&
-        l.cycle_number === Number(selectedCycle)
-      );
-      setLogs(filtered);
+      await logList.load('/workout-logs/', { member_id: selectedMember });
     } catch (error) {
+      if (error instanceof SessionExpiredError) return onSessionExpired(error);
       Alert.alert('Error', error.message);
     }
   };
 
+  const renderLoadMore = (list, label) => {
+    if (!list.hasMore) return null;
+    const handlePress = async () => {
+      try {
+        await list.loadMore();
+      } catch (error) {
+        if (error instanceof SessionExpiredError) return onSessionExpired(error);
+        Alert.alert('Error', 'Failed to load more');
+      }
+    };
+    return (
+      <TouchableOpacity style={styles.loadMoreButton} onPress={handlePress} disabled={list.loadingMore}>
+        {list.loadingMore ? (
+          <ActivityIndicator color="#667eea" />
+        ) : (
+          <Text style={styles.loadMoreText}>{label}</Text>
+        )}
+      </TouchableOpacity>
+    );
+  };
+
   const renderActualFields = (row, rowIdx, isDone) => {
     if (isTimeBased(row)) {
       return (
@@ -338,6 +333,7 @@ const LogWorkoutScreen = () => {
                 ))}
               </Picker>
             </View>
+            {renderLoadMore(memberList, 'Load more members')}
             
             <View style={styles.pickerContainer}>
               <Text style={styles.pickerLabel}>Select Cycle</Text>
@@ -428,6 +424,8 @@ const LogWorkoutScreen = () => {
               </View>
             );
           })}
+          {renderLoadMore(planEntryList, 'Load more of the plan')}
+          {renderLoadMore(logList, 'Load more logs')}
         </View>
       </ScrollView>
     </View>
@@ -623,6 +621,19 @@ const styles = StyleSheet.create({
     borderRadius: 8,
     gap: 6,
   },
+  loadMoreButton: {
+    borderWidth: 1,
+    borderColor: '#667eea',
+    borderRadius: 8,
+    padding: 12,
+    alignItems: 'center',
+    marginVertical: 8,
+  },
+  loadMoreText: {
+    color: '#667eea',
+    fontSize: 16,
+    fontWeight: '600',
+  },
   buttonText: {
     color: '#fff',
     fontSize: 16,
@@ -0,0 +1,45 @@
+// src/usePagedList.js
+import { useCallback, useRef, useState } from 'react';
+import { fetchPage } from './api';
+
+// A list loaded a page at a time: load() replaces it with the first page of a
+// query and loadMore() appends the next one while next_cursor is set.
+// setItems is there for local edits (adding, updating or removing a row).
+export function usePagedList() {
+  const [items, setItems] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const request = useRef(null);
+
+  const load = useCallback(async (path, params = {}) => {
+    const current = { path, params };
+    request.current = current;
+    const page = await fetchPage(path, params);
+    if (request.current !== current) return page.items; // a newer load() replaced this query
+    setItems(page.items);
+    setNextCursor(page.next_cursor);
+    return page.items;
+  }, []);
+
+  const loadMore = useCallback(async () => {
+    const current = request.current;
+    if (!current || !nextCursor) return;
+    setLoadingMore(true);
+    try {
+      const page = await fetchPage(current.path, current.params, nextCursor);
+      if (request.current !== current) return;
+      setItems((prev) => [...prev, ...page.items]);
+      setNextCursor(page.next_cursor);
+    } finally {
+      setLoadingMore(false);
+    }
+  }, [nextCursor]);
+
+  const clear = useCallback(() => {
+    request.current = null;
+    setItems([]);
+    setNextCursor(null);
+  }, []);
+
+  return { items, setItems, hasMore: !!nextCursor, loadingMore, load, loadMore, clear };
+}
@@ -0,0 +1,193 @@
+# fitbro_backend/adherence.py
+# Daily plan-vs-actual adherence (daily_adherence): one row per cycle day that has
+# plan entries, with planned / completed / skipped entry counts, adherence % and the
+# streak of fully completed planned days ending on that day. Days without entries are
+# rest days: they have no row and don't break a streak.
+#
+# An entry counts as completed if it has any non-skipped log and as skipped if all of
+# its logs are skipped, wherever the log is dated. Writes to plan entries and logs
+# call refresh_adherence() / refresh_for_entries() with the (cycle, day)s they touched,
+# in the same transaction. Those days are recounted and upserted on their unique key
+# (so concurrent writers on one day don't collide), then streaks are re-derived from
+# the earliest touched day to the end of the cycle.
+#
+#   python -m fitbro_backend.adherence --rebuild     # recompute every row
+
+import argparse
+import time
+from collections import defaultdict
+
+from sqlalchemy import and_, bindparam, case, exists, func, select
+
+from .models import CyclePlan, DailyAdherence, WorkoutLog, WorkoutPlanEntry
+from .upsert import upsert
+
+REBUILD_CYCLES_PER_BLOCK = 1000
+DAY_KEY = ("cycle_plan_id", "day_date")  # uq_daily_adherence_cycle_day
+
+_table = DailyAdherence.__table__
+
+
+def _day_counts():
+    # (cycle_plan_id, member_id, day_date, planned, completed, skipped) for live cycles
+    done = exists().where(
+        WorkoutLog.workout_plan_entry_id == WorkoutPlanEntry.id,
+        func.lower(func.coalesce(WorkoutLog.status, "")) != "skipped",
+    )
+    logged = exists().where(WorkoutLog.workout_plan_entry_id == WorkoutPlanEntry.id)
+    return select(
+        WorkoutPlanEntry.cycle_plan_id, CyclePlan.member_id, WorkoutPlanEntry.day_date,
+        func.count(WorkoutPlanEntry.id),
+        func.sum(case((done, 1), else_=0)),
+        func.sum(case((and_(logged, ~done), 1), else_=0)),
+    ).join(CyclePlan, WorkoutPlanEntry.cycle_plan_id == CyclePlan.id).where(
+        CyclePlan.is_deleted == False
+    ).group_by(WorkoutPlanEntry.cycle_plan_id, CyclePlan.member_id, WorkoutPlanEntry.day_date)
+
+
+def percent(completed, planned):
+    return round(100.0 * completed / planned, 1) if planned else 0.0
+
+
+def _row(cycle_plan_id, member_id, day, planned, completed, skipped):
+    return {
+        "cycle_plan_id": cycle_plan_id, "member_id": member_id, "day_date": day,
+        "planned": planned, "completed": completed, "skipped": skipped,
+        "adherence": percent(completed, planned), "streak": 0,
+    }
+
+
+def _next_streak(run, planned, completed):
+    return run + 1 if completed >= planned else 0
+
+
+def _refresh_streaks(conn, cycle_plan_id, since):
+    prev = conn.execute(
+        select(DailyAdherence.streak).where(DailyAdherence.cycle_plan_id == cycle_plan_id,
+                                            DailyAdherence.day_date < since)
+        .order_by(DailyAdherence.day_date.desc()).limit(1)
+    ).scalar()
+    rows = conn.execute(
+        select(DailyAdherence.id, DailyAdherence.planned, DailyAdherence.completed, DailyAdherence.streak)
+        .where(DailyAdherence.cycle_plan_id == cycle_plan_id, DailyAdherence.day_date >= since)
+        .order_by(DailyAdherence.day_date)
+    ).all()
+    run, changes = prev or 0, []
+    for row in rows:
+        run = _next_streak(run, row.planned, row.completed)
+        if run != row.streak:
+            changes.append({"r_id": row.id, "r_streak": run})
+    if changes:
+        conn.execute(_table.update().where(_table.c.id == bindparam("r_id")).values(streak=bindparam("r_streak")),
+                     changes)
+
+
+def _write_days(conn, cycle_plan_id, rows, days=None):
+    # Upsert on (cycle_plan_id, day_date) rather than DELETE + INSERT, so concurrent writers
+    # on the same day can't collide on the unique key; then drop the days (of `days`, or of
+    # the whole cycle) that no longer have entries
+    upsert(conn, _table, rows, DAY_KEY)
+    kept = [r["day_date"] for r in rows]
+    stale = _table.delete().where(_table.c.cycle_plan_id == cycle_plan_id, _table.c.day_date.notin_(kept))
+    if days is not None:
+        stale = stale.where(_table.c.day_date.in_(list(days)))
+    conn.execute(stale)
+
+
+def refresh_adherence(conn, touched):
+    """Recount the (cycle_plan_id, day_date) pairs in `touched`; conn is a Session or Connection."""
+    days_by_cycle = defaultdict(set)
+    for cycle_plan_id, day in touched:
+        if cycle_plan_id is not None and day is not None:
+            days_by_cycle[cycle_plan_id].add(day)
+
+    for cycle_plan_id, days in days_by_cycle.items():
+        counts = conn.execute(_day_counts().where(
+            WorkoutPlanEntry.cycle_plan_id == cycle_plan_id, WorkoutPlanEntry.day_date.in_(list(days))
+        )).all()
+        _write_days(conn, cycle_plan_id, [_row(*c) for c in counts], days)
+        _refresh_streaks(conn, cycle_plan_id, min(days))
+
+
+def refresh_for_entries(conn, entry_ids):
+    """refresh_adherence for the days the given plan entries are on (e.g. after logging them)."""
+    entry_ids = {e for e in entry_ids if e is not None}
+    if entry_ids:
+        refresh_adherence(conn, conn.execute(
+            select(WorkoutPlanEntry.cycle_plan_id, WorkoutPlanEntry.day_date).where(WorkoutPlanEntry.id.in_(entry_ids))
+        ).all())
+
+
+def refresh_cycle(conn, cycle_plan_id):
+    """Recount a whole cycle (generated, regenerated, soft-deleted...)."""
+    counts = conn.execute(_day_counts().where(WorkoutPlanEntry.cycle_plan_id == cycle_plan_id)).all()
+    _write_days(conn, cycle_plan_id, _with_streaks(counts))
+
+
+def _with_streaks(counts):
+    rows = sorted((_row(*c) for c in counts), key=lambda r: (r["cycle_plan_id"], r["day_date"]))
+    run, cycle = 0, None
+    for r in rows:
+        if r["cycle_plan_id"] != cycle:
+            run, cycle = 0, r["cycle_plan_id"]
+        run = r["streak"] = _next_streak(run, r["planned"], r["completed"])
+    return rows
+
+
+def rebuild_adherence(conn):
+    """Recompute every row from workout_plan_entries / workout_logs, a block of cycles at a time; returns rows written."""
+    conn.execute(_table.delete())
+    cycle_ids = [c for (c,) in conn.execute(select(CyclePlan.id).where(CyclePlan.is_deleted == False)
+                                            .order_by(CyclePlan.id))]
+    written = 0
+    for i in range(0, len(cycle_ids), REBUILD_CYCLES_PER_BLOCK):
+        block = cycle_ids[i:i + REBUILD_CYCLES_PER_BLOCK]
+        rows = _with_streaks(conn.execute(
+            _day_counts().where(WorkoutPlanEntry.cycle_plan_id.between(block[0], block[-1]))
+        ).all())
+        if rows:
+            conn.execute(_table.insert(), rows)
+            written += len(rows)
+    return written
+
+
+def summarize(days, as_of):
+    """AdherenceSummary fields for day rows in date order."""
+    past = [d for d in days if d.day_date <= as_of]
+    planned = sum(d.planned for d in past)
+    completed = sum(d.completed for d in past)
+    return {
+        "planned": planned, "completed": completed, "skipped": sum(d.skipped for d in past),
+        "adherence": percent(completed, planned), "current_streak": current_streak(past, as_of),
+        "best_streak": max((d.streak for d in past), default=0),
+    }
+
+
+def current_streak(days, as_of):
+    # days: rows with day_date / planned / completed / streak in date order. Today still
+    # counts as in progress, so an unfinished today falls back to the day before.
+    current = 0
+    for d in days:
+        if d.day_date > as_of:
+            break
+        if d.day_date < as_of or d.completed >= d.planned:
+            current = d.streak
+    return current
+
+
+def main():
+    from .database import engine
+
+    parser = argparse.ArgumentParser(description="Daily plan-vs-actual adherence")
+    parser.add_argument("--rebuild", action="store_true", help="recompute every row from plan entries and logs")
+    args = parser.parse_args()
+    if not args.rebuild:
+        parser.error("nothing to do (use --rebuild)")
+    start = time.perf_counter()
+    with engine.begin() as conn:
+        written = rebuild_adherence(conn)
+    print(f"rebuilt {written} adherence rows in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,2 @@
+# Benchmarks for the FitBro backend, run as modules, e.g.
+#   python -m fitbro_backend.benchmarks.db_writes
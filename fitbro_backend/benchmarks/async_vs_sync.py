@@ -0,0 +1,127 @@
+# fitbro_backend/benchmarks/async_vs_sync.py
+# Load-test the async hot endpoints against sync twins of the same handlers
+# (the pre-async implementation), driven in-process through the ASGI app.
+#
+#   python -m fitbro_backend.benchmarks.async_vs_sync --concurrency 32 --requests 4000
+#
+# Keep concurrency under the threadpool size (40) for the sync side: past that, sync
+# handlers block on pool checkout while session cleanup waits for a free thread.
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+# Point the app at a throwaway database before fitbro_backend builds its engines
+_tmp = tempfile.mkdtemp()
+os.environ.setdefault("FITBRO_DATABASE_URL", f"sqlite:///{os.path.join(_tmp, 'bench.db')}")
+
+import httpx
+from datetime import date
+from fastapi import Depends, FastAPI, Query
+from sqlalchemy.orm import Session
+
+from fitbro_backend.database import Base, engine, get_db
+from fitbro_backend.main import app as async_app
+from fitbro_backend.models import CyclePlan, Gym, Member, MembershipPlan, WorkoutLog
+from fitbro_backend.pagination import Page, PageParams, paginate
+from fitbro_backend.schemas import WorkoutLogCreate, WorkoutLogRead
+
+# ---- sync twins of the ported handlers ----
+sync_app = FastAPI()
+
+@sync_app.get("/workout-logs/", response_model=Page[WorkoutLogRead])
+def list_logs_sync(gym_id: int = Query(...), page: PageParams = Depends(), db: Session = Depends(get_db)):
+    q = db.query(WorkoutLog).join(Member, WorkoutLog.member_id == Member.id).filter(Member.gym_id == gym_id)
+    return paginate(q, page, WorkoutLog.id)
+
+@sync_app.post("/workout-logs/", response_model=WorkoutLogRead)
+def create_log_sync(payload: WorkoutLogCreate, db: Session = Depends(get_db)):
+    log = WorkoutLog(**payload.dict())
+    db.add(log)
+    db.commit()
+    db.refresh(log)
+    return log
+
+
+def seed(members=50, logs_per_member=100):
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(Gym.__table__.insert(), [{"id": 1, "name": "Bench Gym", "owner_mobile": "0", "owner_name": "o", "owner_email": "o@x"}])
+        conn.execute(MembershipPlan.__table__.insert(), [{"id": 1, "name": "Std", "duration_months": 1, "price": 1.0, "gym_id": 1}])
+        conn.execute(Member.__table__.insert(), [
+            {"id": m, "name": f"m{m}", "mobile": f"9{m:09d}", "email": "x", "photo_url": "x", "dob": date(1990, 1, 1),
+             "gender": "M", "address": "x", "join_date": date(2024, 1, 1), "gym_id": 1, "membership_plan_id": 1,
+             "active": True, "membership_start_date": date(2024, 1, 1), "membership_end_date": date(2025, 1, 1)}
+            for m in range(1, members + 1)
+        ])
+        conn.execute(CyclePlan.__table__.insert(), [
+            {"id": m, "member_id": m, "cycle_number": 1, "start_date": date(2024, 1, 1), "end_date": date(2024, 1, 30),
+             "duration": 30, "status": "Active", "is_deleted": False}
+            for m in range(1, members + 1)
+        ])
+        conn.execute(WorkoutLog.__table__.insert(), [
+            {"member_id": m, "cycle_plan_id": m, "workout_plan_entry_id": 1, "actual_sets": 3, "actual_reps": 10,
+             "actual_weight": 40, "status": "Completed", "workout_date": date(2024, 1, 1 + i % 28)}
+            for m in range(1, members + 1) for i in range(logs_per_member)
+        ])
+
+
+def _log_body(i):
+    return {"member_id": 1 + i % 50, "cycle_plan_id": 1 + i % 50, "workout_plan_entry_id": 1, "actual_sets": 3,
+            "actual_reps": 10, "actual_weight": 40, "actual_minutes": None, "actual_rpe": None,
+            "actual_notes": None, "status": "Completed", "workout_date": "2024-01-15"}
+
+
+async def drive(app, method, path, total, concurrency, **kw):
+    latencies = []
+    counter = iter(range(total))
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def worker():
+            for i in counter:
+                start = time.perf_counter()
+                if method == "GET":
+                    r = await client.get(path, params=kw["params"])
+                else:
+                    r = await client.post(path, json=kw["body"](i))
+                r.raise_for_status()
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    return total / elapsed, statistics.median(latencies) * 1000, p99 * 1000
+
+
+async def run_all(cases, total, concurrency):
+    # One event loop for every case: the async engine's pool is bound to it
+    for label, method, path, kw in cases:
+        for name, app in (("sync", sync_app), ("async", async_app)):
+            rps, p50, p99 = await drive(app, method, path, total, concurrency, **kw)
+            print(f"{label:22s} {name:6s} {rps:8.0f} {p50:8.1f} {p99:8.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Async vs sync hot-endpoint load test")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    seed()
+    cases = [
+        ("GET  /workout-logs/", "GET", "/workout-logs/", {"params": {"gym_id": 1, "limit": 50}}),
+        ("POST /workout-logs/", "POST", "/workout-logs/", {"body": _log_body}),
+    ]
+    print(f"{args.requests} requests, concurrency {args.concurrency}")
+    print(f"{'endpoint':22s} {'path':6s} {'req/s':>8s} {'p50 ms':>8s} {'p99 ms':>8s}")
+    asyncio.run(run_all(cases, args.requests, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+# fitbro_backend/benchmarks/dataset.py
+# Synthetic dataset for the load tests, written by bulk_seed: gyms with an owner
+# login and a catalog, members on an active cycle with daily plan entries, logs for
+# the days already trained, and visitors. Dataset indexes it so the request mix can
+# address any member/cycle/entry without reading ids back.
+
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+from fitbro_backend.bulk_seed import PASSWORD, Scale, load
+
+__all__ = ["PASSWORD", "Scale", "Dataset", "seed"]
+
+
+@dataclass
+class Dataset:
+    scale: Scale
+    counts: dict = field(default_factory=dict)
+    owners: List[Tuple[str, int]] = field(default_factory=list)                 # (mobile, gym_id)
+    members: List[Tuple[int, int, int, int]] = field(default_factory=list)      # (member_id, gym_id, cycle_id, first_entry_id)
+
+    def entry_id(self, member_index, day, slot=0):
+        return self.members[member_index][3] + day * self.scale.entries_per_day + slot
+
+    def rows(self):
+        return sum(self.counts.values())
+
+
+def seed(eng, scale: Scale, workers=1) -> Dataset:
+    """Insert the dataset into an empty, migrated database."""
+    ds = Dataset(scale, counts=load(eng, scale, workers=workers))
+    ds.owners = [(scale.owner_mobile(g), g) for g in range(1, scale.gyms + 1)]
+    # cycle ids match member ids in bulk_seed
+    ds.members = [(m, scale.gym_of(m), m, scale.first_entry_id(m)) for m in range(1, scale.members + 1)]
+    return ds
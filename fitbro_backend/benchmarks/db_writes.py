@@ -0,0 +1,78 @@
+# fitbro_backend/benchmarks/db_writes.py
+# Concurrent write throughput: N threads each commit M single-row inserts,
+# the same shape as a burst of create_log calls.
+#
+#   python -m fitbro_backend.benchmarks.db_writes                      # SQLite: default vs tuned profile
+#   python -m fitbro_backend.benchmarks.db_writes --url postgresql+psycopg2://...
+
+import argparse
+import os
+import tempfile
+import threading
+import time
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, create_engine, func
+
+from fitbro_backend.database import build_engine
+
+metadata = MetaData()
+bench_writes = Table(
+    "bench_writes", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("member_id", Integer, nullable=False),
+    Column("payload", String(64)),
+    Column("created_at", DateTime, server_default=func.now()),
+)
+
+
+def run(eng, threads, writes):
+    metadata.drop_all(eng)
+    metadata.create_all(eng)
+    errors = []
+
+    def worker(n):
+        for i in range(writes):
+            try:
+                with eng.begin() as conn:
+                    conn.execute(bench_writes.insert(), {"member_id": n, "payload": f"set {i}"})
+            except Exception as e:
+                errors.append(e)
+
+    pool = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    start = time.perf_counter()
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    elapsed = time.perf_counter() - start
+    metadata.drop_all(eng)
+    eng.dispose()
+    done = threads * writes - len(errors)
+    return done / elapsed, len(errors)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent write throughput benchmark")
+    parser.add_argument("--url", help="database URL; omit to compare SQLite profiles in a temp file")
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--writes", type=int, default=200, help="commits per thread")
+    args = parser.parse_args()
+
+    if args.url:
+        profiles = [("configured", build_engine(args.url))]
+    else:
+        tmp = tempfile.mkdtemp()
+        profiles = [
+            ("sqlite default", create_engine(f"sqlite:///{os.path.join(tmp, 'default.db')}",
+                                             connect_args={"check_same_thread": False})),
+            ("sqlite tuned", build_engine(f"sqlite:///{os.path.join(tmp, 'tuned.db')}")),
+        ]
+
+    print(f"{args.threads} threads x {args.writes} committed inserts")
+    for name, eng in profiles:
+        rate, errors = run(eng, args.threads, args.writes)
+        print(f"{name:16s} {rate:10.0f} commits/s   errors: {errors}")
+
+
+if __name__ == "__main__":
+    main()
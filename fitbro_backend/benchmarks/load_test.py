@@ -0,0 +1,207 @@
+# fitbro_backend/benchmarks/load_test.py
+# Seeds a synthetic dataset (benchmarks/dataset.py) into a throwaway database and
+# drives the real ASGI app in-process with a weighted mix of the app's everyday
+# requests, then reports throughput and p50/p95/p99 per endpoint.
+#
+#   python -m fitbro_backend.benchmarks.load_test --gyms 4 --members 100 --requests 5000
+#   python -m fitbro_backend.benchmarks.load_test --out before.json
+#   python -m fitbro_backend.benchmarks.load_test --baseline before.json   # exit 1 on a p95 regression
+#
+# The dataset is deterministic and each worker's request stream is seeded from --seed,
+# so runs with the same arguments are comparable.
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import timedelta
+
+# Point the app at a throwaway database before fitbro_backend builds its engines
+_tmp = tempfile.mkdtemp()
+os.environ.setdefault("FITBRO_DATABASE_URL", f"sqlite:///{os.path.join(_tmp, 'load.db')}")
+os.environ.setdefault("FITBRO_LOG_LEVEL", "ERROR")
+
+import httpx
+
+from fitbro_backend.benchmarks.dataset import PASSWORD, Scale, seed
+from fitbro_backend.database import engine
+from fitbro_backend.main import app
+from fitbro_backend.migrate import upgrade
+
+DEFAULT_MIX = "calendar=5,log_set=3,history=2,visitor=1,login=1"
+
+
+# ---- request mix: each op returns (method, path, kwargs) for one request ----
+def op_calendar(ds, rng, n):
+    member_id, _, cycle_id, _ = rng.choice(ds.members)
+    return "GET", f"/members/{member_id}/cycles/{cycle_id}/calendar", {}
+
+
+def op_log_set(ds, rng, n):
+    i = rng.randrange(len(ds.members))
+    member_id, _, cycle_id, _ = ds.members[i]
+    day = rng.randrange(ds.scale.cycle_days)
+    body = {"member_id": member_id, "cycle_plan_id": cycle_id,
+            "workout_plan_entry_id": ds.entry_id(i, day, rng.randrange(ds.scale.entries_per_day)),
+            "actual_sets": 3, "actual_reps": rng.randint(6, 12), "actual_weight": rng.randint(20, 80),
+            "actual_minutes": None, "actual_rpe": None, "actual_notes": None, "status": "Completed",
+            "workout_date": (ds.scale.start + timedelta(days=day)).isoformat()}
+    return "POST", "/workout-logs/", {"json": body}
+
+
+def op_history(ds, rng, n):
+    member_id, gym_id, _, _ = rng.choice(ds.members)
+    return "GET", "/workout-logs/", {"params": {"gym_id": gym_id, "member_id": member_id, "limit": 50}}
+
+
+def op_visitor(ds, rng, n):
+    _, gym_id = rng.choice(ds.owners)
+    body = {"first_name": f"Walk-in {n}", "mobile": f"6{n:09d}", "gym_id": gym_id, "fitness_goal": "Strength"}
+    return "POST", "/visitors/", {"json": body}
+
+
+def op_login(ds, rng, n):
+    mobile, _ = rng.choice(ds.owners)
+    return "POST", "/auth/login", {"data": {"username": mobile, "password": PASSWORD}}
+
+
+OPS = {
+    "calendar": op_calendar,
+    "log_set": op_log_set,
+    "history": op_history,
+    "visitor": op_visitor,
+    "login": op_login,
+}
+
+
+def parse_mix(text):
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        if name not in OPS:
+            raise SystemExit(f"unknown op {name!r}; choose from {', '.join(OPS)}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, max(0, math.ceil(p * len(sorted_values)) - 1))]
+
+
+async def drive(ds, mix, total, concurrency, seed_value):
+    names, weights = list(mix), list(mix.values())
+    latencies = {name: [] for name in names}
+    errors = {name: 0 for name in names}
+    counter = iter(range(total))
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        mobile, _ = ds.owners[0]
+        r = await client.post("/auth/login", data={"username": mobile, "password": PASSWORD})
+        r.raise_for_status()
+        client.headers["Authorization"] = f"Bearer {r.json()['access_token']}"
+
+        async def worker(w):
+            rng = random.Random(seed_value * 1000 + w)
+            for n in counter:
+                name = rng.choices(names, weights)[0]
+                method, path, kw = OPS[name](ds, rng, n)
+                start = time.perf_counter()
+                r = await client.request(method, path, **kw)
+                latencies[name].append(time.perf_counter() - start)
+                if r.status_code >= 400:
+                    errors[name] += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(w) for w in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    return latencies, errors, elapsed
+
+
+def summarize(latencies, errors, elapsed):
+    results = {}
+    everything = []
+    for name, values in latencies.items():
+        values.sort()
+        everything.extend(values)
+        results[name] = {
+            "requests": len(values), "errors": errors[name], "rps": len(values) / elapsed,
+            "p50_ms": percentile(values, 0.50) * 1000, "p95_ms": percentile(values, 0.95) * 1000,
+            "p99_ms": percentile(values, 0.99) * 1000,
+        }
+    everything.sort()
+    results["total"] = {
+        "requests": len(everything), "errors": sum(errors.values()), "rps": len(everything) / elapsed,
+        "p50_ms": percentile(everything, 0.50) * 1000, "p95_ms": percentile(everything, 0.95) * 1000,
+        "p99_ms": percentile(everything, 0.99) * 1000,
+    }
+    return results
+
+
+def report(results):
+    print(f"{'endpoint':10s} {'requests':>8s} {'errors':>6s} {'req/s':>8s} {'p50 ms':>8s} {'p95 ms':>8s} {'p99 ms':>8s}")
+    for name, r in results.items():
+        print(f"{name:10s} {r['requests']:8d} {r['errors']:6d} {r['rps']:8.0f} "
+              f"{r['p50_ms']:8.1f} {r['p95_ms']:8.1f} {r['p99_ms']:8.1f}")
+
+
+def compare(results, baseline, max_regression):
+    # Only p95 is compared: p50 hides regressions, p99 is too noisy for short runs
+    failures = 0
+    for name, r in results.items():
+        before = baseline.get(name)
+        if not before or not before["p95_ms"]:
+            continue
+        change = r["p95_ms"] / before["p95_ms"] - 1
+        regressed = change > max_regression
+        failures += regressed
+        print(f"{'FAIL' if regressed else 'ok':4s}  {name}: p95 {before['p95_ms']:.1f} -> {r['p95_ms']:.1f} ms ({change:+.0%})")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FitBro load test")
+    parser.add_argument("--gyms", type=int, default=2)
+    parser.add_argument("--members", type=int, default=50, help="members per gym")
+    parser.add_argument("--days", type=int, default=30, help="cycle length in days")
+    parser.add_argument("--entries", type=int, default=3, help="plan entries per day")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"weighted ops (default {DEFAULT_MIX})")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--out", help="write results as JSON")
+    parser.add_argument("--baseline", help="JSON from an earlier --out run to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.25, help="allowed p95 slowdown (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    scale = Scale(gyms=args.gyms, members_per_gym=args.members, cycle_days=args.days,
+                  entries_per_day=args.entries, logged_days=args.days // 2)
+    upgrade(engine)
+    t = time.perf_counter()
+    ds = seed(engine, scale)
+    print(f"seeded {ds.rows()} rows in {time.perf_counter() - t:.1f}s "
+          f"({scale.gyms} gyms x {scale.members_per_gym} members x {scale.cycle_days} days)")
+
+    latencies, errors, elapsed = asyncio.run(drive(ds, parse_mix(args.mix), args.requests, args.concurrency, args.seed))
+    results = summarize(latencies, errors, elapsed)
+    print(f"{args.requests} requests, concurrency {args.concurrency}, {elapsed:.1f}s")
+    report(results)
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            failures = compare(results, json.load(f), args.max_regression)
+        sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
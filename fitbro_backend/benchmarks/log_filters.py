@@ -0,0 +1,112 @@
+# fitbro_backend/benchmarks/log_filters.py
+# Payload size and latency of the old "fetch every log and filter in the browser"
+# flow versus the server-side filtered /workout-logs/ query.
+#
+#   python -m fitbro_backend.benchmarks.log_filters --rows 1000000
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+_tmp = tempfile.mkdtemp()
+os.environ.setdefault("FITBRO_DATABASE_URL", f"sqlite:///{os.path.join(_tmp, 'bench.db')}")
+
+from datetime import date, timedelta
+from typing import List
+
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+
+from fitbro_backend.database import SessionLocal, engine
+from fitbro_backend.main import app
+from fitbro_backend.migrate import upgrade
+from fitbro_backend.models import CyclePlan, Gym, Member, MembershipPlan, WorkoutLog
+from fitbro_backend.schemas import WorkoutLogRead
+
+GYMS = 10
+MEMBERS_PER_GYM = 100
+CHUNK = 50000
+
+
+def seed(rows):
+    upgrade(engine)
+    members = GYMS * MEMBERS_PER_GYM
+    with engine.begin() as conn:
+        conn.execute(Gym.__table__.insert(), [
+            {"id": g, "name": f"Gym {g}", "owner_mobile": str(g), "owner_name": "o", "owner_email": "o@x"} for g in range(1, GYMS + 1)
+        ])
+        conn.execute(MembershipPlan.__table__.insert(), [
+            {"id": g, "name": "Std", "duration_months": 1, "price": 1.0, "gym_id": g} for g in range(1, GYMS + 1)
+        ])
+        conn.execute(Member.__table__.insert(), [
+            {"id": m, "name": f"m{m}", "mobile": f"9{m:09d}", "email": "x", "photo_url": "x", "dob": date(1990, 1, 1),
+             "gender": "M", "address": "x", "join_date": date(2024, 1, 1), "gym_id": 1 + m % GYMS,
+             "membership_plan_id": 1 + m % GYMS, "active": True,
+             "membership_start_date": date(2024, 1, 1), "membership_end_date": date(2025, 1, 1)}
+            for m in range(1, members + 1)
+        ])
+        conn.execute(CyclePlan.__table__.insert(), [
+            {"id": m, "member_id": m, "cycle_number": 1, "start_date": date(2024, 1, 1), "end_date": date(2024, 12, 31),
+             "duration": 365, "status": "Active", "is_deleted": False}
+            for m in range(1, members + 1)
+        ])
+    start = date(2024, 1, 1)
+    for offset in range(0, rows, CHUNK):
+        with engine.begin() as conn:
+            conn.execute(WorkoutLog.__table__.insert(), [
+                {"member_id": 1 + i % members, "cycle_plan_id": 1 + i % members, "workout_plan_entry_id": 1 + i % 5000,
+                 "actual_sets": 3, "actual_reps": 10, "actual_weight": 40, "status": "Completed",
+                 "workout_date": start + timedelta(days=(i // members) % 365)}
+                for i in range(offset, min(offset + CHUNK, rows))
+            ])
+
+
+def timed(fn, repeat):
+    samples, size = [], 0
+    for _ in range(repeat):
+        t = time.perf_counter()
+        size = fn()
+        samples.append((time.perf_counter() - t) * 1000)
+    return statistics.median(samples), size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Workout-log filter benchmark")
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    t = time.perf_counter()
+    seed(args.rows)
+    print(f"seeded {args.rows} logs in {time.perf_counter() - t:.1f}s")
+
+    adapter = TypeAdapter(List[WorkoutLogRead])
+
+    def fetch_all():
+        # What GET /workout-logs/ used to return: the whole table
+        db = SessionLocal()
+        try:
+            return len(adapter.dump_json(adapter.validate_python(db.query(WorkoutLog).all(), from_attributes=True)))
+        finally:
+            db.close()
+
+    client = TestClient(app)
+    member = 42
+    params = {"gym_id": 1 + member % GYMS, "member_id": member, "cycle_plan_id": member,
+              "date_from": "2024-03-01", "date_to": "2024-03-31", "limit": 200}
+
+    def filtered():
+        r = client.get("/workout-logs/", params=params)
+        r.raise_for_status()
+        return len(r.content)
+
+    print(f"{'flow':34s} {'median ms':>10s} {'bytes':>14s}")
+    for label, fn, repeat in (("fetch all (old)", fetch_all, 1), ("member + cycle + month (new)", filtered, args.repeat)):
+        ms, size = timed(fn, repeat)
+        print(f"{label:34s} {ms:10.1f} {size:14,d}")
+
+
+if __name__ == "__main__":
+    main()
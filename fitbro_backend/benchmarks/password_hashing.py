@@ -0,0 +1,39 @@
+# fitbro_backend/benchmarks/password_hashing.py
+# Login verification throughput at different scrypt cost factors.
+#
+#   python -m fitbro_backend.benchmarks.password_hashing --workers 4 --logins 200
+
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from fitbro_backend.passwords import hash_password, verify_password
+
+
+def main():
+    parser = argparse.ArgumentParser(description="scrypt login throughput")
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1))
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--costs", default="12,13,14,15", help="log2(N) values to try")
+    args = parser.parse_args()
+
+    print(f"{args.logins} logins, {args.workers} hashing threads")
+    print(f"{'N':>8s} {'ms/verify':>10s} {'logins/s':>10s}")
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        for log_n in (int(x) for x in args.costs.split(",")):
+            n = 2 ** log_n
+            stored = hash_password("correct horse", n=n)
+            start = time.perf_counter()
+            verify_password("correct horse", stored)
+            single = (time.perf_counter() - start) * 1000
+
+            start = time.perf_counter()
+            results = list(pool.map(lambda _: verify_password("correct horse", stored)[0], range(args.logins)))
+            elapsed = time.perf_counter() - start
+            assert all(results)
+            print(f"{n:8d} {single:10.1f} {args.logins / elapsed:10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# fitbro_backend/benchmarks/serialization.py
+# Per-row cost of building a list page two ways, fetch included:
+#   orm:  ORM objects -> Pydantic validation (from_attributes) -> JSON, what FastAPI
+#         does with response_model=Page[...Read]
+#   fast: Core rows of the schema's columns -> dicts -> orjson (fast_json.py)
+# and checks that both produce the same JSON.
+#
+#   python -m fitbro_backend.benchmarks.serialization --rows 200 --repeat 200
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+# Point the app at a throwaway database before fitbro_backend builds its engines
+_tmp = tempfile.mkdtemp()
+os.environ.setdefault("FITBRO_DATABASE_URL", f"sqlite:///{os.path.join(_tmp, 'serialization.db')}")
+os.environ.setdefault("FITBRO_LOG_LEVEL", "ERROR")
+
+from pydantic import TypeAdapter
+from sqlalchemy import select
+
+from fitbro_backend.benchmarks.dataset import Scale, seed
+from fitbro_backend.database import SessionLocal, engine
+from fitbro_backend.fast_json import dumps, orjson, read_columns
+from fitbro_backend.migrate import upgrade
+from fitbro_backend.models import CyclePlan, Member, WorkoutLog, WorkoutPlanEntry
+from fitbro_backend.pagination import Page
+from fitbro_backend.schemas import CyclePlanRead, MemberRead, WorkoutLogRead, WorkoutPlanEntryRead
+
+CASES = [
+    ("workout-plan-entries", WorkoutPlanEntry, WorkoutPlanEntryRead),
+    ("workout-logs", WorkoutLog, WorkoutLogRead),
+    ("members", Member, MemberRead),
+    ("cycle-plans", CyclePlan, CyclePlanRead),
+]
+
+
+def orm_page(db, model, adapter, rows):
+    items = db.query(model).order_by(model.id).limit(rows).all()
+    body = adapter.dump_json(adapter.validate_python({"items": items, "next_cursor": None}, from_attributes=True))
+    db.expunge_all()  # a request gets a fresh session, so don't let the identity map warm up
+    return body
+
+
+def fast_page(db, model, schema, rows):
+    fields = tuple(schema.model_fields)
+    items = db.execute(select(*read_columns(model, schema)).order_by(model.id).limit(rows)).all()
+    return dumps({"items": [dict(zip(fields, row)) for row in items], "next_cursor": None})
+
+
+def timed(fn, repeat):
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            fn()
+        best = min(best, time.perf_counter() - start)
+    return best / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="List-page serialization cost, ORM+Pydantic vs Core+orjson")
+    parser.add_argument("--rows", type=int, default=200, help="rows per page (the API's max page size)")
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    upgrade(engine)
+    seed(engine, Scale(gyms=1, members_per_gym=args.rows, cycle_days=30, entries_per_day=4, logged_days=15))
+    print(f"encoder: {'orjson' if orjson is not None else 'json (orjson not installed)'}, {args.rows} rows per page")
+    print(f"{'endpoint':22s} {'orm us/row':>10s} {'fast us/row':>11s} {'speedup':>8s}")
+
+    db = SessionLocal()
+    try:
+        for name, model, schema in CASES:
+            adapter = TypeAdapter(Page[schema])
+            before = orm_page(db, model, adapter, args.rows)
+            after = fast_page(db, model, schema, args.rows)
+            if json.loads(before) != json.loads(after):
+                raise SystemExit(f"{name}: fast path output differs from the Pydantic one")
+            t_orm = timed(lambda: orm_page(db, model, adapter, args.rows), args.repeat)
+            t_fast = timed(lambda: fast_page(db, model, schema, args.rows), args.repeat)
+            print(f"{name:22s} {t_orm / args.rows * 1e6:10.1f} {t_fast / args.rows * 1e6:11.1f} {t_orm / t_fast:7.1f}x")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
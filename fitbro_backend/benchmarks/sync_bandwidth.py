@@ -0,0 +1,118 @@
+# fitbro_backend/benchmarks/sync_bandwidth.py
+# Bytes on the wire for the mobile app's sync flow (calendar, plan entries, log history,
+# members, cycles, exercise catalog) against a synthetic dataset:
+#   * a cold sync with identity, gzip and br encodings
+#   * a revalidation pass sending back every ETag (If-None-Match), nothing changed
+#   * the same pass after the member logs one set
+#
+#   python -m fitbro_backend.benchmarks.sync_bandwidth --members 50 --days 30 --entries 4
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+# Point the app at a throwaway database before fitbro_backend builds its engines
+_tmp = tempfile.mkdtemp()
+os.environ.setdefault("FITBRO_DATABASE_URL", f"sqlite:///{os.path.join(_tmp, 'sync.db')}")
+os.environ.setdefault("FITBRO_LOG_LEVEL", "ERROR")
+
+import httpx
+
+from fitbro_backend.benchmarks.dataset import PASSWORD, Scale, seed
+from fitbro_backend.compression import brotli
+from fitbro_backend.database import engine
+from fitbro_backend.main import app
+from fitbro_backend.migrate import upgrade
+
+
+def sync_flow(ds, member_index):
+    member_id, gym_id, cycle_id, _ = ds.members[member_index]
+    return [
+        ("calendar", f"/members/{member_id}/cycles/{cycle_id}/calendar", {}),
+        ("entries", "/workout-plan-entries/", {"gym_id": gym_id, "cycle_plan_id": cycle_id, "limit": 200}),
+        ("logs", "/workout-logs/", {"gym_id": gym_id, "member_id": member_id, "limit": 200}),
+        ("members", "/members/", {"gym_id": gym_id, "limit": 200}),
+        ("cycles", "/cycle-plans/", {"gym_id": gym_id, "member_id": member_id}),
+        ("exercises", "/exercises/", {"gym_id": gym_id, "limit": 200}),
+    ]
+
+
+async def run_flow(client, flow, encoding, etags=None):
+    # -> {name: (status, wire bytes, decoded bytes, ms)}; fills etags when given a dict
+    results = {}
+    for name, path, params in flow:
+        headers = {"Accept-Encoding": encoding}
+        if etags is not None and name in etags:
+            headers["If-None-Match"] = etags[name]
+        start = time.perf_counter()
+        async with client.stream("GET", path, params=params, headers=headers) as r:
+            body = await r.aread()
+            wire = r.num_bytes_downloaded
+        elapsed = (time.perf_counter() - start) * 1000
+        if r.status_code not in (200, 304):
+            raise SystemExit(f"{name}: HTTP {r.status_code} {body[:200]!r}")
+        if etags is not None and r.headers.get("etag"):
+            etags[name] = r.headers["etag"]
+        results[name] = (r.status_code, wire, len(body), elapsed)
+    return results
+
+
+def report(title, results, baseline=None):
+    total = sum(wire for _, wire, _, _ in results.values())
+    print(f"\n{title}")
+    for name, (status, wire, decoded, ms) in results.items():
+        ratio = f"{wire / baseline[name][1]:6.1%}" if baseline else ""
+        print(f"  {name:10s} {status:4d} {wire:10,d} B wire {decoded:10,d} B body {ms:7.1f} ms {ratio}")
+    ratio = f" ({total / sum(b[1] for b in baseline.values()):.1%} of identity)" if baseline else ""
+    print(f"  {'total':10s}      {total:10,d} B{ratio}")
+    return total
+
+
+async def drive(ds):
+    flow = sync_flow(ds, 0)
+    encodings = ["identity", "gzip"] + (["br"] if brotli is not None else [])
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        mobile, _ = ds.owners[0]
+        r = await client.post("/auth/login", data={"username": mobile, "password": PASSWORD})
+        r.raise_for_status()
+        client.headers["Authorization"] = f"Bearer {r.json()['access_token']}"
+
+        await run_flow(client, flow, "identity")  # warm caches
+        identity = await run_flow(client, flow, "identity")
+        report("cold sync, identity", identity)
+        best = encodings[-1]
+        for encoding in encodings[1:]:
+            report(f"cold sync, {encoding}", await run_flow(client, flow, encoding), identity)
+
+        etags = {}
+        await run_flow(client, flow, best, etags)
+        report(f"revalidate, nothing changed ({best})", await run_flow(client, flow, best, dict(etags)), identity)
+
+        # One set logged on today's entry: only the views containing that log change
+        logs = await client.get(flow[2][1], params=flow[2][2])
+        log = logs.json()["items"][0]
+        r = await client.patch(f"/workout-logs/{log['id']}", json={"actual_reps": (log["actual_reps"] or 0) + 1})
+        r.raise_for_status()
+        report(f"revalidate after one log update ({best})", await run_flow(client, flow, best, dict(etags)), identity)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mobile sync bandwidth with compression and ETags")
+    parser.add_argument("--gyms", type=int, default=2)
+    parser.add_argument("--members", type=int, default=50, help="members per gym")
+    parser.add_argument("--days", type=int, default=30, help="cycle length in days")
+    parser.add_argument("--entries", type=int, default=4, help="plan entries per day")
+    args = parser.parse_args()
+
+    scale = Scale(gyms=args.gyms, members_per_gym=args.members, cycle_days=args.days,
+                  entries_per_day=args.entries, logged_days=args.days // 2)
+    upgrade(engine)
+    ds = seed(engine, scale)
+    print(f"seeded {ds.rows()} rows; member 1 has {args.days * args.entries} plan entries")
+    asyncio.run(drive(ds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+# fitbro_backend/bulk_seed.py
+# Bulk generator for large synthetic datasets (millions of plan entries / logs).
+# Unlike reset_and_seed_db.py it never builds ORM objects: rows are plain tuples with
+# precomputed ids, written with executemany in chunked transactions. Secondary indexes
+# on the big tables are dropped for the load and rebuilt once at the end, and with
+# --workers > 1 row generation runs in worker processes while this one writes.
+#
+#   python -m fitbro_backend.bulk_seed --url sqlite:///./big.db --gyms 100 --members 1000 --workers 4
+#
+# The target database is migrated first and must not contain gyms yet.
+
+import argparse
+import multiprocessing
+import sys
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+
+from .config import DATABASE_URL
+from .database import Base, build_engine
+from .migrate import upgrade
+from .models import Gym, RoleEnum, WorkoutLog, WorkoutPlanEntry
+from .passwords import hash_password
+from .adherence import rebuild_adherence
+from .progress import rebuild_progress
+
+PASSWORD = "bench-pass"  # every generated owner login uses it
+WORKOUTS_PER_GYM = 3
+EXERCISES_PER_WORKOUT = 2
+CHUNK_SIZE = 50000
+MEMBERS_PER_BLOCK = 200
+
+# Only these get their secondary indexes deferred; everything else is small
+DEFERRED_INDEX_TABLES = (WorkoutPlanEntry.__table__, WorkoutLog.__table__)
+
+COLUMNS = {
+    "gyms": ("id", "name", "address", "owner_mobile", "owner_name", "owner_email", "contract_start", "is_active"),
+    "users": ("id", "name", "mobile", "password", "role", "gym_id", "is_active"),
+    "programs": ("id", "name", "gym_id", "is_master", "status"),
+    "workouts": ("id", "name", "program_id", "gym_id", "is_master", "active"),
+    "exercises": ("id", "name", "workout_id", "gym_id", "is_master", "is_time_based", "is_enabled"),
+    "membership_plans": ("id", "name", "duration_months", "price", "plan_type", "status", "gym_id"),
+    "members": ("id", "name", "mobile", "email", "photo_url", "dob", "gender", "address", "join_date",
+                "active", "gym_id", "membership_plan_id", "membership_start_date", "membership_end_date"),
+    "cycle_plans": ("id", "member_id", "cycle_number", "start_date", "end_date", "duration", "status", "is_deleted"),
+    "workout_plan_entries": ("id", "cycle_plan_id", "day_date", "workout_id", "exercise_id", "planned_sets",
+                             "planned_reps", "planned_weight"),
+    "workout_logs": ("member_id", "cycle_plan_id", "workout_plan_entry_id", "actual_sets", "actual_reps",
+                     "actual_weight", "status", "workout_date"),
+    "visitors": ("first_name", "mobile", "gym_id", "status", "fitness_goal", "created_at", "updated_at"),
+}
+
+
+@dataclass
+class Scale:
+    gyms: int = 2
+    members_per_gym: int = 50
+    cycle_days: int = 30
+    entries_per_day: int = 3
+    logged_days: int = 15         # days at the start of each cycle that already have logs
+    visitors_per_gym: int = 100
+    start: date = date(2024, 1, 1)
+
+    @property
+    def members(self):
+        return self.gyms * self.members_per_gym
+
+    @property
+    def entries_per_cycle(self):
+        return self.cycle_days * self.entries_per_day
+
+    @property
+    def exercises_per_gym(self):
+        return WORKOUTS_PER_GYM * EXERCISES_PER_WORKOUT
+
+    # Ids are pure functions of the scale, so callers can address rows without reading them back
+    def gym_of(self, member_id):
+        return (member_id - 1) // self.members_per_gym + 1
+
+    def first_entry_id(self, member_id):
+        return (member_id - 1) * self.entries_per_cycle + 1
+
+    def owner_mobile(self, gym_id):
+        return f"7{gym_id:09d}"
+
+    def exercise(self, gym_id, n):
+        # n-th (workout_id, exercise_id) of a gym's catalog
+        n %= self.exercises_per_gym
+        workout_id = (gym_id - 1) * WORKOUTS_PER_GYM + n // EXERCISES_PER_WORKOUT + 1
+        return workout_id, (workout_id - 1) * EXERCISES_PER_WORKOUT + n % EXERCISES_PER_WORKOUT + 1
+
+
+# ===== ROW GENERATORS =====
+# (table name, rows): tuples in COLUMNS order with dates as ISO strings, so worker
+# processes can pickle them cheaply
+def _catalog_rows(scale, password_hash):
+    gyms, users, programs, workouts, exercises, plans = [], [], [], [], [], []
+    for g in range(1, scale.gyms + 1):
+        mobile = scale.owner_mobile(g)
+        gyms.append((g, f"Bench Gym {g}", "Bangalore", mobile, f"Owner {g}", f"owner{g}@bench.test",
+                     scale.start.isoformat(), True))
+        users.append((g, f"Owner {g}", mobile, password_hash, RoleEnum.GYM_OWNER.name, g, True))
+        programs.append((g, f"Strength {g}", g, False, "Active"))
+        plans.append((g, "Monthly", 1, 1500.0, "Regular", "Active", g))
+        for n in range(0, scale.exercises_per_gym, EXERCISES_PER_WORKOUT):
+            workout_id, _ = scale.exercise(g, n)
+            workouts.append((workout_id, f"Workout {workout_id}", g, g, False, True))
+        for n in range(scale.exercises_per_gym):
+            workout_id, exercise_id = scale.exercise(g, n)
+            exercises.append((exercise_id, f"Exercise {exercise_id}", workout_id, g, False, False, True))
+    return [("gyms", gyms), ("users", users), ("programs", programs),
+            ("workouts", workouts), ("exercises", exercises), ("membership_plans", plans)]
+
+
+def _member_rows(args):
+    # Members first..last with their cycle, plan entries and logs; runs in worker processes
+    scale, first, last = args
+    members, cycles, entries, logs = [], [], [], []
+    start = scale.start.isoformat()
+    end = (scale.start + timedelta(days=scale.cycle_days - 1)).isoformat()
+    membership_end = (scale.start + timedelta(days=30)).isoformat()
+    days = [(scale.start + timedelta(days=d)).isoformat() for d in range(scale.cycle_days)]
+    for m in range(first, last + 1):
+        g = scale.gym_of(m)
+        members.append((m, f"Member {m}", f"9{m:09d}", f"m{m}@bench.test", "", "1990-01-01", "M" if m % 2 else "F",
+                        "Bangalore", start, True, g, g, start, membership_end))
+        cycles.append((m, m, 1, start, end, scale.cycle_days, "Active", False))
+        entry_id = scale.first_entry_id(m)
+        for d, day in enumerate(days):
+            for slot in range(scale.entries_per_day):
+                workout_id, exercise_id = scale.exercise(g, d + slot)
+                entries.append((entry_id, m, day, workout_id, exercise_id, 3, 10, 40.0))
+                if d < scale.logged_days:
+                    logs.append((m, m, entry_id, 3, 10, 40 + d % 5, "Completed", day))
+                entry_id += 1
+    return [("members", members), ("cycle_plans", cycles),
+            ("workout_plan_entries", entries), ("workout_logs", logs)]
+
+
+def _visitor_rows(scale):
+    base = datetime.combine(scale.start, datetime.min.time())
+    for g in range(1, scale.gyms + 1):
+        rows = []
+        for v in range(scale.visitors_per_gym):
+            created = (base + timedelta(minutes=v)).strftime("%Y-%m-%d %H:%M:%S.%f")
+            rows.append((f"Visitor {v}", f"8{g:03d}{v:06d}", g, "Contacted", "Weight loss", created, created))
+        yield "visitors", rows
+
+
+# ===== WRITER =====
+class _Writer:
+    def __init__(self, conn, chunk_size):
+        self.conn = conn
+        self.chunk_size = chunk_size
+        self.sqlite = conn.dialect.name == "sqlite"
+        self.counts = {}
+        self._sql = {}
+
+    def write(self, name, rows):
+        table = Base.metadata.tables[name]
+        cols = COLUMNS[name]
+        for i in range(0, len(rows), self.chunk_size):
+            chunk = rows[i:i + self.chunk_size]
+            if self.sqlite:
+                # Straight to the driver: tuples, no per-row bind processing
+                sql = self._sql.get(name)
+                if sql is None:
+                    sql = self._sql[name] = f"INSERT INTO {name} ({', '.join(cols)}) VALUES ({', '.join('?' * len(cols))})"
+                self.conn.exec_driver_sql(sql, chunk)
+            else:
+                self.conn.execute(table.insert(), [dict(zip(cols, row)) for row in chunk])
+            self.conn.commit()
+        self.counts[name] = self.counts.get(name, 0) + len(rows)
+
+
+def _drop_indexes(conn):
+    for table in DEFERRED_INDEX_TABLES:
+        for index in table.indexes:
+            conn.exec_driver_sql(f"DROP INDEX IF EXISTS {index.name}")
+    conn.commit()
+
+
+def _create_indexes(conn):
+    for table in DEFERRED_INDEX_TABLES:
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+    conn.commit()
+
+
+def load(eng, scale: Scale, workers=1, chunk_size=CHUNK_SIZE, defer_indexes=True):
+    """Write the dataset into a migrated, empty database; returns rows written per table."""
+    blocks = [(scale, lo, min(lo + MEMBERS_PER_BLOCK - 1, scale.members))
+              for lo in range(1, scale.members + 1, MEMBERS_PER_BLOCK)]
+    with eng.connect() as conn:
+        sqlite = conn.dialect.name == "sqlite"
+        if sqlite:
+            # Per-connection: a crash mid-load just means reseeding
+            conn.exec_driver_sql("PRAGMA synchronous=OFF")
+        writer = _Writer(conn, chunk_size)
+        if defer_indexes:
+            _drop_indexes(conn)
+        try:
+            for name, rows in _catalog_rows(scale, hash_password(PASSWORD)):
+                writer.write(name, rows)
+            if workers > 1:
+                with multiprocessing.get_context().Pool(workers) as pool:
+                    for tables in pool.imap(_member_rows, blocks):
+                        for name, rows in tables:
+                            writer.write(name, rows)
+            else:
+                for block in blocks:
+                    for name, rows in _member_rows(block):
+                        writer.write(name, rows)
+            for name, rows in _visitor_rows(scale):
+                writer.write(name, rows)
+        finally:
+            if defer_indexes:
+                _create_indexes(conn)
+            if sqlite:
+                conn.exec_driver_sql("PRAGMA synchronous=NORMAL")
+        # Derived tables, built from the rows above once the indexes are back
+        writer.counts["exercise_progress"] = rebuild_progress(conn)
+        writer.counts["daily_adherence"] = rebuild_adherence(conn)
+        conn.commit()
+    return writer.counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk-generate a synthetic FitBro dataset")
+    parser.add_argument("--url", default=DATABASE_URL, help="database URL (default: FITBRO_DATABASE_URL)")
+    parser.add_argument("--gyms", type=int, default=10)
+    parser.add_argument("--members", type=int, default=500, help="members per gym")
+    parser.add_argument("--days", type=int, default=30, help="cycle length in days")
+    parser.add_argument("--entries", type=int, default=4, help="plan entries per day")
+    parser.add_argument("--logged-days", type=int, default=20, help="days per cycle that already have logs")
+    parser.add_argument("--visitors", type=int, default=1000, help="visitors per gym")
+    parser.add_argument("--workers", type=int, default=1, help="row-generation processes")
+    parser.add_argument("--chunk", type=int, default=CHUNK_SIZE, help="rows per transaction")
+    parser.add_argument("--keep-indexes", action="store_true", help="don't defer index builds on the big tables")
+    args = parser.parse_args()
+
+    scale = Scale(gyms=args.gyms, members_per_gym=args.members, cycle_days=args.days, entries_per_day=args.entries,
+                  logged_days=args.logged_days, visitors_per_gym=args.visitors)
+    eng = build_engine(args.url)
+    upgrade(eng)
+    with eng.connect() as conn:
+        if conn.execute(Gym.__table__.select().limit(1)).first():
+            sys.exit("target database already has gyms; seed into an empty database")
+
+    start = time.perf_counter()
+    counts = load(eng, scale, workers=args.workers, chunk_size=args.chunk, defer_indexes=not args.keep_indexes)
+    elapsed = time.perf_counter() - start
+    total = sum(counts.values())
+    for name, count in counts.items():
+        print(f"{name:24s} {count:12,d}")
+    print(f"{'total':24s} {total:12,d} rows in {elapsed:.1f}s ({total / elapsed:,.0f} rows/s, indexes included)")
+    eng.dispose()
+
+
+if __name__ == "__main__":
+    main()
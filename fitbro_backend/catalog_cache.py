@@ -0,0 +1,54 @@
+# fitbro_backend/catalog_cache.py
+# Read-through cache for the catalog list endpoints (workouts, exercises, equipment,
+# programs). A page is serialized once and kept with its ETag; repeat requests skip
+# the database and serialization, and a matching If-None-Match gets a bodiless 304.
+#
+# Invalidation is by version: every key carries the gym's catalog version and the
+# master-catalog version, and a write bumps one of them, so stale pages are never
+# looked up again and simply age out of the LRU.
+
+import threading
+
+from fastapi import Request
+from pydantic import TypeAdapter
+
+from .cache import TTLCache
+from .conditional import conditional_body, etag_for
+from .config import CATALOG_CACHE_SIZE, CATALOG_CACHE_TTL
+from .pagination import Page
+
+MASTER = None  # gym_id of the FitBro master catalog, visible to every gym
+
+_cache = TTLCache(maxsize=CATALOG_CACHE_SIZE, ttl=CATALOG_CACHE_TTL)
+_versions = {}
+_versions_lock = threading.Lock()
+_adapters = {}
+
+
+def invalidate_catalog(*gym_ids):
+    # Catalog lists embed each other (programs list workout ids, deleting a workout
+    # cascades to its exercises), so a write drops every catalog page of the gym
+    with _versions_lock:
+        for gym_id in set(gym_ids):
+            _versions[gym_id] = _versions.get(gym_id, 0) + 1
+
+
+def _adapter(schema):
+    adapter = _adapters.get(schema)
+    if adapter is None:
+        adapter = _adapters[schema] = TypeAdapter(Page[schema])
+    return adapter
+
+
+def cached_page(request: Request, kind: str, schema, gym_id: int, page, load):
+    """Serve a catalog list page; load() runs the query and returns the page dict on a miss."""
+    with _versions_lock:
+        key = (kind, gym_id, _versions.get(MASTER, 0), _versions.get(gym_id, 0), page.cursor, page.limit)
+    entry = _cache.get(key)
+    if entry is None:
+        adapter = _adapter(schema)
+        body = adapter.dump_json(adapter.validate_python(load(), from_attributes=True))
+        entry = (body, etag_for(body))
+        _cache.set(key, entry)
+    body, etag = entry
+    return conditional_body(request, body, etag)
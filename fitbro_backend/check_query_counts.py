@@ -0,0 +1,147 @@
+# fitbro_backend/check_query_counts.py
+# Calls every list endpoint against a small and a larger seeded gym and fails
+# (exit 1) if the number of SQL statements a page takes grows with the row count,
+# i.e. a relationship is being lazy-loaded per row (N+1).
+#
+#   python -m fitbro_backend.check_query_counts
+
+import os
+import sys
+import tempfile
+
+# Point the app at a throwaway database before fitbro_backend builds its engines
+_tmp = tempfile.mkdtemp()
+os.environ.setdefault("FITBRO_DATABASE_URL", f"sqlite:///{os.path.join(_tmp, 'counts.db')}")
+
+from contextlib import contextmanager
+from datetime import date
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from fitbro_backend.catalog_cache import MASTER, invalidate_catalog
+from fitbro_backend.database import SessionLocal, engine, get_async_engine
+from fitbro_backend.jwt_handler import create_access_token
+from fitbro_backend.main import app
+from fitbro_backend.migrate import upgrade
+from fitbro_backend.models import (
+    AssessmentResult, AssessmentTemplate, CyclePlan, Equipment, Exercise, Gym, Member,
+    MembershipPlan, Program, RoleEnum, User, Visitor, VisitorFollowUp, Workout, WorkoutLog, WorkoutPlanEntry,
+)
+
+GYM_ID = 1
+VISITOR_ID = 1
+SMALL, LARGE = 3, 30  # both below the default page size, so every row is serialized
+
+ENDPOINTS = [
+    "/gyms/",
+    "/users/",
+    "/members/",
+    "/membership-plans/",
+    "/programs/",
+    "/workouts/",
+    "/exercises/",
+    "/equipment/",
+    "/assessment-templates/",
+    "/assessment-results/",
+    "/cycle-plans/",
+    "/workout-plan-entries/",
+    "/workout-logs/",
+    "/visitors/",
+    f"/visitor-followup/{VISITOR_ID}/",
+    # /announcements/ is left out: AnnouncementRead expects gym_id/posted_at/created_by,
+    # which the announcements table doesn't have yet, so it can't serialize seeded rows
+]
+
+
+def seed(n):
+    # Adds n rows of everything to the gym, each with a couple of related rows
+    db = SessionLocal()
+    gym = db.get(Gym, GYM_ID)
+    if gym is None:
+        gym = Gym(id=GYM_ID, name="Counts Gym", owner_mobile="0", owner_name="o", owner_email="o@x")
+        db.add(gym)
+        db.add(Visitor(id=VISITOR_ID, first_name="v", mobile="v", gym_id=GYM_ID))
+        db.add(User(name="owner", mobile="0", password="x", role=RoleEnum.GYM_OWNER, gym_id=GYM_ID))
+    db.flush()
+    start = db.query(Member).count()
+    for i in range(start, start + n):
+        db.add(Gym(name=f"Gym {i}", owner_mobile=str(i), owner_name="o", owner_email="o@x"))
+        db.add(User(name=f"u{i}", mobile=f"u{i}", password="x", role=RoleEnum.GYM_INSTRUCTOR, gym_id=GYM_ID))
+        program = Program(name=f"P{i}", gym_id=GYM_ID)
+        workouts = [Workout(name=f"W{i}.{k}", gym_id=GYM_ID, program=program) for k in range(2)]
+        exercise = Exercise(name=f"E{i}", gym_id=GYM_ID, workout=workouts[0])
+        plan = MembershipPlan(name=f"MP{i}", duration_months=1, price=1.0, gym_id=GYM_ID, programs=[program])
+        member = Member(name=f"m{i}", mobile=f"m{i}", email="x", photo_url="x", dob=date(1990, 1, 1), gender="M",
+                        address="x", join_date=date(2024, 1, 1), gym_id=GYM_ID, membership_plan=plan,
+                        membership_start_date=date(2024, 1, 1), membership_end_date=date(2024, 2, 1))
+        cycle = CyclePlan(member=member, cycle_number=1, start_date=date(2024, 1, 1), end_date=date(2024, 1, 30),
+                          status="Active")
+        entry = WorkoutPlanEntry(cycle_plan=cycle, day_date=date(2024, 1, 1), workout=workouts[0], exercise=exercise)
+        template = AssessmentTemplate(name=f"T{i}", template_json="[]", gym_id=GYM_ID)
+        db.add_all([
+            program, *workouts, exercise, plan, member, cycle, entry, template,
+            Equipment(name=f"Eq{i}", gym_id=GYM_ID),
+            AssessmentResult(member=member, template=template, taken_at=date(2024, 1, 1), result_json="{}"),
+            WorkoutLog(member=member, cycle_plan=cycle, workout_plan_entry=entry, workout_date=date(2024, 1, 1)),
+            Visitor(first_name=f"v{i}", mobile=f"v{i}", gym_id=GYM_ID,
+                    followups=[VisitorFollowUp(comment="x"), VisitorFollowUp(comment="y")]),
+            VisitorFollowUp(visitor_id=VISITOR_ID, comment="x"),
+        ])
+    db.commit()
+    db.close()
+
+
+@contextmanager
+def count_statements():
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engines = [engine, get_async_engine().sync_engine]
+    for eng in engines:
+        event.listen(eng, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        for eng in engines:
+            event.remove(eng, "before_cursor_execute", record)
+
+
+def measure(client):
+    counts = {}
+    for path in ENDPOINTS:
+        # Warm the token cache so auth doesn't count against the first endpoint only
+        client.get(path, params={"gym_id": GYM_ID})
+        # seed() writes behind the catalog cache's back, and a cache hit would count 0 anyway
+        invalidate_catalog(GYM_ID, MASTER)
+        with count_statements() as statements:
+            r = client.get(path, params={"gym_id": GYM_ID})
+        r.raise_for_status()
+        counts[path] = (len(statements), len(r.json()["items"]))
+    return counts
+
+
+def main():
+    upgrade(engine)
+    client = TestClient(app)
+    client.headers["Authorization"] = f"Bearer {create_access_token('0', 'GYM_OWNER', 'owner')}"
+
+    seed(SMALL)
+    small = measure(client)
+    seed(LARGE - SMALL)
+    large = measure(client)
+
+    failures = 0
+    for path in ENDPOINTS:
+        (q_small, rows_small), (q_large, rows_large) = small[path], large[path]
+        grew = q_large > q_small
+        failures += grew
+        print(f"{'FAIL' if grew else 'ok':4s}  {path}: {q_small} queries / {rows_small} rows, "
+              f"{q_large} queries / {rows_large} rows")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
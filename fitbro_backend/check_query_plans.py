@@ -0,0 +1,62 @@
+# fitbro_backend/check_query_plans.py
+# Runs EXPLAIN QUERY PLAN for the hot filters on a freshly migrated SQLite
+# database and fails (exit 1) if any of them falls back to a full table scan.
+#
+#   python -m fitbro_backend.check_query_plans
+
+import os
+import sys
+import tempfile
+from datetime import date, datetime
+
+from sqlalchemy import select, text
+
+from fitbro_backend.database import build_engine
+from fitbro_backend.migrate import upgrade
+from fitbro_backend.models import CyclePlan, Member, Visitor, VisitorFollowUp, WorkoutLog, WorkoutPlanEntry
+
+CHECKS = [
+    ("plan entries for a cycle day", "workout_plan_entries",
+     select(WorkoutPlanEntry).where(WorkoutPlanEntry.cycle_plan_id == 1, WorkoutPlanEntry.day_date == date(2024, 1, 1))),
+    ("active cycle for a member", "cycle_plans",
+     select(CyclePlan).where(CyclePlan.member_id == 1, CyclePlan.status == "Active", CyclePlan.is_deleted == False)),
+    ("visitor duplicate check", "visitors",
+     select(Visitor).where(Visitor.gym_id == 1, Visitor.mobile == "9000000000").order_by(Visitor.created_at.desc()).limit(1)),
+    ("visitor list page", "visitors",
+     select(Visitor).where(Visitor.gym_id == 1).order_by(Visitor.created_at.desc(), Visitor.id.desc()).limit(51)),
+    ("visitor follow-ups", "visitor_followups",
+     select(VisitorFollowUp).where(VisitorFollowUp.visitor_id == 1).order_by(VisitorFollowUp.created_at.desc())),
+    ("member logs in a date range", "workout_logs",
+     select(WorkoutLog).where(WorkoutLog.member_id == 1, WorkoutLog.workout_date.between(date(2024, 1, 1), date(2024, 1, 31)))),
+    ("cycle logs in a date range", "workout_logs",
+     select(WorkoutLog).where(WorkoutLog.cycle_plan_id == 1, WorkoutLog.workout_date >= date(2024, 1, 1))),
+    ("logs for a plan entry", "workout_logs",
+     select(WorkoutLog).where(WorkoutLog.workout_plan_entry_id == 1)),
+    ("gym members page", "members",
+     select(Member).where(Member.gym_id == 1).order_by(Member.id).limit(51)),
+]
+
+
+def explain(conn, stmt):
+    compiled = stmt.compile(dialect=conn.dialect)
+    rows = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + str(compiled), tuple(compiled.params[k] for k in compiled.positiontup))
+    return [row[-1] for row in rows]
+
+
+def main():
+    path = os.path.join(tempfile.mkdtemp(), "plans.db")
+    eng = build_engine(f"sqlite:///{path}")
+    upgrade(eng)
+    failures = 0
+    with eng.connect() as conn:
+        for label, table, stmt in CHECKS:
+            plan = explain(conn, stmt)
+            full_scan = any(d.startswith(f"SCAN {table}") and "INDEX" not in d for d in plan)
+            failures += full_scan
+            print(f"{'FAIL' if full_scan else 'ok':4s}  {label}: {' | '.join(plan)}")
+    eng.dispose()
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+# fitbro_backend/check_write_paths.py
+# Runs the write endpoints (and the job status they hand back) through edge cases against a
+# small seeded dataset and fails (exit 1) if one of them regresses, e.g. regenerating a cycle
+# duplicating the entries it kept or a batch sync accepting logs against another member's plan.
+#
+#   python -m fitbro_backend.check_write_paths
+
+import datetime
+import os
+import sys
+import tempfile
+import traceback
+
+# Point the app at a throwaway database before fitbro_backend builds its engines
+_tmp = tempfile.mkdtemp()
+os.environ.setdefault("FITBRO_DATABASE_URL", f"sqlite:///{os.path.join(_tmp, 'writes.db')}")
+os.environ.setdefault("FITBRO_LOG_LEVEL", "ERROR")
+
+from collections import Counter
+
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import IntegrityError
+
+from fitbro_backend import dependencies, jwt_handler
+from fitbro_backend.benchmarks.dataset import PASSWORD, Scale, seed
+from fitbro_backend.database import SessionLocal, engine
+from fitbro_backend.jwt_handler import decode_refresh_token
+from fitbro_backend.main import app
+from fitbro_backend.migrate import upgrade
+from fitbro_backend.models import DailyAdherence, RevokedToken, User, WorkoutLog, WorkoutPlanEntry
+from fitbro_backend.routers import workout_log
+
+SCALE = Scale(gyms=1, members_per_gym=4, cycle_days=14, entries_per_day=1, logged_days=3)
+
+
+def check_regenerate_keeps_logged_entries(client, ds):
+    # The template puts the day-0 exercise on every weekday, so day 0 (logged) would get it twice
+    member_id, gym_id, cycle_id, _ = ds.members[0]
+    workout_id, exercise_id = SCALE.exercise(gym_id, 0)
+    items = [{"weekday": d, "workout_id": workout_id, "exercise_id": exercise_id, "planned_sets": 4} for d in range(7)]
+    for _ in range(2):  # regenerating twice must give the same plan
+        r = client.post(f"/cycle-plans/{cycle_id}/generate", json={"items": items, "replace_existing": True})
+        assert r.status_code == 200, r.text
+        assert r.json()["kept"] == SCALE.logged_days, r.json()
+        assert r.json()["skipped"] == 1, r.json()
+
+    db = SessionLocal()
+    try:
+        entries = db.query(WorkoutPlanEntry.day_date, WorkoutPlanEntry.workout_id, WorkoutPlanEntry.exercise_id).filter(
+            WorkoutPlanEntry.cycle_plan_id == cycle_id).all()
+        dupes = [k for k, n in Counter(tuple(e) for e in entries).items() if n > 1]
+        assert not dupes, f"duplicate entries after regenerating: {dupes}"
+        logged = db.query(WorkoutLog).filter(WorkoutLog.cycle_plan_id == cycle_id).count()
+        assert logged == SCALE.logged_days, f"{logged} logs left, expected {SCALE.logged_days}"
+        first = db.query(DailyAdherence).filter(DailyAdherence.cycle_plan_id == cycle_id).order_by(
+            DailyAdherence.day_date).first()
+        assert (first.planned, first.completed) == (1, 1), f"day 0 adherence {first.planned}/{first.completed}"
+    finally:
+        db.close()
+
+
+def _log_item(key, member_id, cycle_id, entry_id):
+    return {"client_key": key, "member_id": member_id, "cycle_plan_id": cycle_id, "workout_plan_entry_id": entry_id,
+            "workout_date": "2024-01-01", "status": "Completed", "actual_sets": 3, "actual_reps": 10,
+            "actual_weight": None, "actual_minutes": None, "actual_rpe": None, "actual_notes": None}
+
+
+def check_batch_rejects_foreign_entries(client, ds):
+    member_id, _, cycle_id, entry_id = ds.members[0]
+    other_member, _, other_cycle, other_entry = ds.members[1]
+    payload = [
+        _log_item("wp-cycle", member_id, cycle_id, other_entry),        # entry from another cycle
+        _log_item("wp-member", other_member, cycle_id, entry_id),       # someone else's cycle
+        _log_item("wp-missing", member_id, cycle_id, 10 ** 9),
+        _log_item("wp-ok", other_member, other_cycle, other_entry),
+    ]
+    r = client.post("/workout-logs/batch", json=payload)
+    assert r.status_code == 200, r.text
+    status = {res["client_key"]: res["status"] for res in r.json()}
+    assert status == {"wp-cycle": "rejected", "wp-member": "rejected", "wp-missing": "rejected", "wp-ok": "created"}, status
+
+
+def check_batch_conflicting_retry_is_409(client, ds):
+    member_id, _, cycle_id, entry_id = ds.members[2]
+
+    def conflict(db, items):
+        raise IntegrityError("INSERT INTO workout_logs", {}, Exception("UNIQUE constraint failed"))
+
+    original, workout_log._insert_batch = workout_log._insert_batch, conflict
+    try:
+        r = client.post("/workout-logs/batch", json=[_log_item("wp-race", member_id, cycle_id, entry_id)])
+    finally:
+        workout_log._insert_batch = original
+    assert r.status_code == 409, r.text
+
+
+def check_gym_owner_cannot_read_jobs(client, ds):
+    # Role checks are off in dev; turn them on for this one
+    dependencies.ENABLE_ROLE_CHECKS = True
+    try:
+        r = client.get("/jobs/1")
+    finally:
+        dependencies.ENABLE_ROLE_CHECKS = False
+    assert r.status_code == 403, r.text
+
+
+def check_exports_scoped_to_callers_gym(client, ds):
+    _, gym_id = ds.owners[0]
+    dependencies.ENABLE_ROLE_CHECKS = True
+    try:
+        for path in ("/visitors/export", "/workout-logs/export"):
+            assert client.get(path, params={"gym_id": gym_id}).status_code == 200
+            r = client.get(path, params={"gym_id": gym_id + 1})
+            assert r.status_code == 403, f"{path}: {r.status_code}"
+            r = client.get(path, params={"gym_id": gym_id}, headers={"Authorization": ""})
+            assert r.status_code == 401, f"{path} without a token: {r.status_code}"
+    finally:
+        dependencies.ENABLE_ROLE_CHECKS = False
+
+
+def check_deactivated_user_loses_cached_token(client, ds):
+    # A second user, so deactivating them doesn't lock the other checks out
+    mobile, gym_id = "check-deactivate", ds.members[0][1]
+    db = SessionLocal()
+    try:
+        owner = db.query(User).filter(User.mobile == ds.owners[0][0]).one()
+        user = User(name="deactivate me", mobile=mobile, password=owner.password, role=owner.role, gym_id=gym_id, is_active=True)
+        db.add(user)
+        db.commit()
+        token = client.post("/auth/login", data={"username": mobile, "password": PASSWORD}).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        assert client.get(f"/gyms/{gym_id}/dashboard", headers=headers).status_code == 200  # caches the Principal
+        user.is_active = False
+        db.commit()
+    finally:
+        db.close()
+    r = client.get(f"/gyms/{gym_id}/dashboard", headers=headers)
+    assert r.status_code == 401, r.text
+
+
+def check_replayed_refresh_revokes_newest_rotation(client, ds):
+    mobile, _ = ds.owners[0]
+    # An older login: its token expires well before the rotation issued from it
+    days, jwt_handler.REFRESH_TOKEN_EXPIRE_DAYS = jwt_handler.REFRESH_TOKEN_EXPIRE_DAYS, 1
+    try:
+        first = client.post("/auth/login", data={"username": mobile, "password": PASSWORD}).json()["refresh_token"]
+    finally:
+        jwt_handler.REFRESH_TOKEN_EXPIRE_DAYS = days
+    second = client.post("/auth/refresh", json={"refresh_token": first}).json()["refresh_token"]
+    assert client.post("/auth/refresh", json={"refresh_token": first}).status_code == 401  # replay
+    assert client.post("/auth/refresh", json={"refresh_token": second}).status_code == 401
+    claims = decode_refresh_token(second)
+    db = SessionLocal()
+    try:
+        row = db.query(RevokedToken).filter(RevokedToken.jti == claims["fam"]).one()
+        until = row.expires_at.replace(tzinfo=datetime.timezone.utc).timestamp()
+        assert until >= claims["exp"], "family revocation expires before its newest token"
+    finally:
+        db.close()
+
+
+def check_logout_seen_by_other_workers(client, ds):
+    # A second RevocationList stands in for another uvicorn worker process
+    other = jwt_handler.RevocationList()
+    mobile, _ = ds.owners[0]
+    token = client.post("/auth/login", data={"username": mobile, "password": PASSWORD}).json()["refresh_token"]
+    family = decode_refresh_token(token)["fam"]
+    db = SessionLocal()
+    try:
+        assert not other.is_revoked(db, family)
+        assert client.post("/auth/logout", json={"refresh_token": token}).status_code == 200
+        assert other.is_revoked(db, family), "logout not seen by another worker"
+    finally:
+        db.close()
+
+
+CHECKS = [
+    check_regenerate_keeps_logged_entries,
+    check_batch_rejects_foreign_entries,
+    check_batch_conflicting_retry_is_409,
+    check_gym_owner_cannot_read_jobs,
+    check_exports_scoped_to_callers_gym,
+    check_deactivated_user_loses_cached_token,
+    check_replayed_refresh_revokes_newest_rotation,
+    check_logout_seen_by_other_workers,
+]
+
+
+def main():
+    upgrade(engine)
+    ds = seed(engine, SCALE)
+    client = TestClient(app)
+    mobile, _ = ds.owners[0]
+    r = client.post("/auth/login", data={"username": mobile, "password": PASSWORD})
+    client.headers["Authorization"] = f"Bearer {r.json()['access_token']}"
+
+    failures = 0
+    for check in CHECKS:
+        try:
+            check(client, ds)
+            print(f"ok    {check.__name__}")
+        except Exception:
+            failures += 1
+            print(f"FAIL  {check.__name__}\n{traceback.format_exc()}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
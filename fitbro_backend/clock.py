@@ -0,0 +1,16 @@
+# fitbro_backend/clock.py
+# The server's notion of "now" and "today". Timestamps are stored as naive UTC
+# (datetime.utcnow()), so dates derived from the clock (the dashboard's day, the
+# nightly rollover, adherence as_of defaults, cron slots) are UTC too; otherwise the
+# date would flip at local midnight on some code paths and at UTC midnight on others.
+
+import datetime
+
+
+def utc_now():
+    """Naive UTC datetime, comparable with the stored timestamps."""
+    return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+
+def utc_today():
+    return utc_now().date()
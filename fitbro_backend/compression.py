@@ -0,0 +1,138 @@
+# fitbro_backend/compression.py
+# Response compression for the mobile clients. Pure ASGI (like MetricsMiddleware) so it
+# sees the final headers: picks br or gzip from Accept-Encoding, leaves small bodies,
+# already-encoded bodies and 204/304 alone, and streams chunked bodies (CSV exports)
+# through an incremental compressor instead of buffering them.
+#
+# brotli is optional: without the package only gzip is offered.
+
+import zlib
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from .config import BROTLI_QUALITY, COMPRESSION_MIN_BYTES, GZIP_LEVEL
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "application/xml", "image/svg+xml")
+SKIP_STATUSES = (204, 304)
+
+
+def choose_encoding(accept_encoding):
+    # Highest q wins; on a tie prefer br (smaller) over gzip. q=0 means "not acceptable".
+    offered = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        offered[name.strip().lower()] = q
+    wildcard = offered.get("*", 0.0)
+    candidates = ["br", "gzip"] if brotli is not None else ["gzip"]
+    best, best_q = None, 0.0
+    for encoding in candidates:
+        q = offered.get(encoding, wildcard)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+class _Gzip:
+    def __init__(self):
+        self._z = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data):
+        return self._z.compress(data)
+
+    def flush(self):
+        return self._z.flush()
+
+
+class _Brotli:
+    def __init__(self):
+        self._c = brotli.Compressor(quality=BROTLI_QUALITY)
+
+    def compress(self, data):
+        return self._c.process(data)
+
+    def flush(self):
+        return self._c.finish()
+
+
+COMPRESSORS = {"gzip": _Gzip, "br": _Brotli}
+
+
+def _compressible(headers):
+    if "content-encoding" in headers:
+        return False
+    content_type = headers.get("content-type", "")
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+class CompressionMiddleware:
+    def __init__(self, app, minimum_size=COMPRESSION_MIN_BYTES):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start = None        # held back until we know the body size
+        compressor = None   # set once we've decided to compress
+
+        async def send_compressed(message):
+            nonlocal start, compressor
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if message["type"] != "http.response.body" or start is None:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more = message.get("more_body", False)
+
+            if compressor is None:
+                headers = MutableHeaders(scope=start)
+                headers.add_vary_header("Accept-Encoding")
+                if (start["status"] in SKIP_STATUSES or not _compressible(headers)
+                        or (not more and len(body) < self.minimum_size)):
+                    await send(start)
+                    start = None
+                    await send(message)
+                    return
+                compressor = COMPRESSORS[encoding]()
+                headers["Content-Encoding"] = encoding
+                etag = headers.get("etag")
+                if etag and not etag.startswith("W/"):
+                    # The compressed bytes differ from the identity ones
+                    headers["ETag"] = "W/" + etag
+                if more:
+                    del headers["Content-Length"]
+                    await send(start)
+                else:
+                    data = compressor.compress(body) + compressor.flush()
+                    headers["Content-Length"] = str(len(data))
+                    await send(start)
+                    await send({"type": "http.response.body", "body": data})
+                    return
+            data = compressor.compress(body)
+            if not more:
+                data += compressor.flush()
+            if data or not more:
+                await send({"type": "http.response.body", "body": data, "more_body": more})
+
+        await self.app(scope, receive, send_compressed)
@@ -0,0 +1,59 @@
+# fitbro_backend/conditional.py
+# Weak ETags and If-None-Match handling. List endpoints derive the ETag from the
+# rows' (id, updated_at) rather than from the serialized body, so a revalidation
+# that ends in 304 costs the query but no serialization and no payload.
+
+import hashlib
+
+from fastapi import Request, Response
+
+CACHE_CONTROL = "private, no-cache"  # clients may keep responses but must revalidate
+
+
+def etag_for(body: bytes):
+    # Weak: the same representation may be sent compressed or not
+    return f'W/"{hashlib.blake2b(body, digest_size=12).hexdigest()}"'
+
+
+def rows_etag(rows, *extra):
+    # rows are ORM objects or Core rows with id (and updated_at) columns
+    h = hashlib.blake2b(digest_size=12)
+    for row in rows:
+        h.update(f"{getattr(row, '__tablename__', '')}:{row.id}:{getattr(row, 'updated_at', None)}|".encode())
+    for value in extra:
+        h.update(f"{value!r}|".encode())
+    return f'W/"{h.hexdigest()}"'
+
+
+def _opaque(tag):
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(request: Request, etag: str):
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # Weak comparison (RFC 9110 13.1.2): W/"x" matches "x"
+    return any(_opaque(t) == _opaque(etag) for t in header.split(","))
+
+
+def not_modified(etag: str):
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+
+
+def conditional(request: Request, response: Response, etag: str):
+    """304 response if the client already has this version, else None (and tags `response`)."""
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    return None
+
+
+def conditional_body(request: Request, body: bytes, etag: str, media_type="application/json"):
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    return Response(body, media_type=media_type, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
@@ -0,0 +1,137 @@
+# fitbro_backend/dashboard.py
+# Gym owner dashboard KPIs: members (active, expiring, lapsed), visitor funnel, active
+# cycles, today's logged sessions and last week's plan adherence. Each group is one
+# aggregate query (SUM(CASE ...) over an indexed slice of the gym), so the whole
+# dashboard is five statements however large the gym is.
+#
+# The serialized body is cached per gym and day with its ETag. As with the catalog
+# cache, writes bump the gym's version after they commit (members, visitors, cycles,
+# logs); the short TTL bounds staleness across worker processes, for plan entry edits
+# (which only move adherence_7d) and for changes that only the passing of time makes
+# (a membership crossing its end date).
+
+import threading
+from datetime import datetime, timedelta
+
+from fastapi import Request
+from pydantic import TypeAdapter
+from sqlalchemy import and_, case, func, select
+
+from .adherence import percent
+from .cache import TTLCache
+from .clock import utc_now, utc_today
+from .conditional import conditional_body, etag_for
+from .config import DASHBOARD_CACHE_SIZE, DASHBOARD_CACHE_TTL
+from .models import CyclePlan, DailyAdherence, Member, Visitor, WorkoutLog
+from .schemas.dashboard import GymDashboard
+
+_cache = TTLCache(maxsize=DASHBOARD_CACHE_SIZE, ttl=DASHBOARD_CACHE_TTL)
+_versions = {}
+_versions_lock = threading.Lock()
+_adapter = TypeAdapter(GymDashboard)
+
+
+def invalidate_dashboard(*gym_ids):
+    with _versions_lock:
+        for gym_id in set(gym_ids):
+            if gym_id is not None:
+                _versions[gym_id] = _versions.get(gym_id, 0) + 1
+
+
+def invalidate_all_dashboards():
+    # Set-based jobs that touch every gym at once (maintenance.py)
+    _cache.clear()
+
+
+def gyms_of_members(conn, member_ids):
+    """Gym ids of the given members, for invalidating after a write that only knows members."""
+    member_ids = {m for m in member_ids if m is not None}
+    if not member_ids:
+        return set()
+    return {g for (g,) in conn.execute(select(Member.gym_id).where(Member.id.in_(member_ids)).distinct())}
+
+
+def _count_if(*conditions):
+    return func.coalesce(func.sum(case((and_(*conditions), 1), else_=0)), 0)
+
+
+def _member_kpis(conn, gym_id, today):
+    current = and_(Member.active == True, Member.membership_end_date >= today)
+    row = conn.execute(select(
+        func.count(Member.id),
+        _count_if(current),
+        _count_if(current, Member.membership_end_date <= today + timedelta(days=7)),
+        _count_if(current, Member.membership_end_date <= today + timedelta(days=30)),
+        _count_if(Member.active == True, Member.membership_end_date < today),
+        _count_if(Member.membership_start_date > today - timedelta(days=30)),
+    ).where(Member.gym_id == gym_id)).one()
+    return dict(zip(("total", "active", "expiring_7d", "expiring_30d", "lapsed", "joined_30d"), row))
+
+
+def _visitor_kpis(conn, gym_id, today):
+    # created_at is a timestamp; the window starts at midnight 30 days back (ix_visitors_gym_created)
+    since_30 = datetime.combine(today - timedelta(days=29), datetime.min.time())
+    since_7 = datetime.combine(today - timedelta(days=6), datetime.min.time())
+    new_30, new_7, converted_30 = conn.execute(select(
+        func.count(Visitor.id),
+        _count_if(Visitor.created_at >= since_7),
+        _count_if(Visitor.status == "Converted"),
+    ).where(Visitor.gym_id == gym_id, Visitor.created_at >= since_30)).one()
+    return {"new_7d": new_7, "new_30d": new_30, "converted_30d": converted_30,
+            "conversion_rate_30d": percent(converted_30, new_30)}
+
+
+def _cycle_kpis(conn, gym_id, today):
+    active, ending_7 = conn.execute(select(
+        func.count(CyclePlan.id),
+        _count_if(CyclePlan.end_date <= today + timedelta(days=7)),
+    ).join(Member, CyclePlan.member_id == Member.id).where(
+        Member.gym_id == gym_id, CyclePlan.status == "Active", CyclePlan.is_deleted == False
+    )).one()
+    return {"active": active, "ending_7d": ending_7}
+
+
+def _today_kpis(conn, gym_id, today):
+    # Member-first join so SQLite probes ix_workout_logs_member_date per gym member
+    sessions, logs = conn.execute(select(
+        func.count(func.distinct(WorkoutLog.member_id)), func.count(WorkoutLog.id),
+    ).select_from(Member).join(WorkoutLog, WorkoutLog.member_id == Member.id).where(
+        Member.gym_id == gym_id, WorkoutLog.workout_date == today
+    )).one()
+    return {"sessions": sessions, "logs": logs}
+
+
+def _adherence_kpis(conn, gym_id, today):
+    # The 7 days before today; today is still in progress
+    planned, completed = conn.execute(select(
+        func.coalesce(func.sum(DailyAdherence.planned), 0), func.coalesce(func.sum(DailyAdherence.completed), 0),
+    ).join(Member, DailyAdherence.member_id == Member.id).where(
+        Member.gym_id == gym_id,
+        DailyAdherence.day_date >= today - timedelta(days=7), DailyAdherence.day_date < today,
+    )).one()
+    return {"planned": planned, "completed": completed, "adherence": percent(completed, planned)}
+
+
+def compute_dashboard(conn, gym_id, today):
+    """The dashboard dict for a gym; conn is a Session or Connection."""
+    return {
+        "gym_id": gym_id, "as_of": today, "generated_at": utc_now(),
+        "members": _member_kpis(conn, gym_id, today),
+        "visitors": _visitor_kpis(conn, gym_id, today),
+        "cycles": _cycle_kpis(conn, gym_id, today),
+        "today": _today_kpis(conn, gym_id, today),
+        "adherence_7d": _adherence_kpis(conn, gym_id, today),
+    }
+
+
+def cached_dashboard(request: Request, db, gym_id: int):
+    today = utc_today()
+    with _versions_lock:
+        key = (gym_id, _versions.get(gym_id, 0), today)
+    entry = _cache.get(key)
+    if entry is None:
+        body = _adapter.dump_json(_adapter.validate_python(compute_dashboard(db, gym_id, today)))
+        entry = (body, etag_for(body))
+        _cache.set(key, entry)
+    body, etag = entry
+    return conditional_body(request, body, etag)
@@ -4,16 +4,82 @@
 # It also provides a dependency to get the database session for use in FastAPI routes.
 # fix the issue - ImportError: cannot import name 'datetime' from 'fitbro_backend.database' (D:\FitBro\fitbro_backend\database.py)
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import datetime
 
-DATABASE_URL = "sqlite:///./fitbro.db"
-
-engine = create_engine(
-    DATABASE_URL, connect_args={"check_same_thread": False}
+from .config import (
+    DATABASE_URL, ASYNC_DATABASE_URL, DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE,
+    SQLITE_WAL, SQLITE_BUSY_TIMEOUT_MS, SQLITE_MMAP_SIZE, SQLITE_CACHE_SIZE_KB,
 )
+from .metrics import instrument_engine
+
+
+def _set_sqlite_pragmas(dbapi_conn, connection_record):
+    cursor = dbapi_conn.cursor()
+    if SQLITE_WAL:
+        # WAL lets readers run alongside the single writer; NORMAL only fsyncs at checkpoints
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+    cursor.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+    cursor.execute(f"PRAGMA cache_size=-{SQLITE_CACHE_SIZE_KB}")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+def _pool_kwargs():
+    return {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": True,
+    }
+
+
+def build_engine(url=DATABASE_URL, **overrides):
+    if make_url(url).get_backend_name() == "sqlite":
+        kwargs = {"connect_args": {"check_same_thread": False}}
+        kwargs.update(overrides)
+        eng = create_engine(url, **kwargs)
+        event.listen(eng, "connect", _set_sqlite_pragmas)
+    else:
+        kwargs = _pool_kwargs()
+        kwargs.update(overrides)
+        eng = create_engine(url, **kwargs)
+    instrument_engine(eng)
+    return eng
+
+
+# ===== ASYNC ENGINE (hot endpoints) =====
+ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+
+
+def async_url(url=DATABASE_URL):
+    u = make_url(url)
+    return u.set(drivername=ASYNC_DRIVERS.get(u.get_backend_name(), u.drivername))
+
+
+def build_async_engine(url=None, **overrides):
+    # Needs aiosqlite (SQLite) or asyncpg (PostgreSQL) installed
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    url = url or ASYNC_DATABASE_URL or async_url()
+    if make_url(url).get_backend_name() == "sqlite":
+        eng = create_async_engine(url, **overrides)
+        event.listen(eng.sync_engine, "connect", _set_sqlite_pragmas)
+    else:
+        kwargs = _pool_kwargs()
+        kwargs.update(overrides)
+        eng = create_async_engine(url, **kwargs)
+    instrument_engine(eng.sync_engine)
+    return eng
+
+
+engine = build_engine()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
@@ -22,4 +88,23 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+# Created on first use so the sync app runs without an async driver installed
+_async_engine = None
+_AsyncSessionLocal = None
+
+def get_async_engine():
+    global _async_engine, _AsyncSessionLocal
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import AsyncSession
+        _async_engine = build_async_engine()
+        # expire_on_commit=False: returned rows stay loaded after commit, no lazy reload
+        _AsyncSessionLocal = sessionmaker(bind=_async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+    return _async_engine
+
+async def get_async_db():
+    get_async_engine()
+    async with _AsyncSessionLocal() as db:
+        yield db
+
@@ -1,21 +1,39 @@
 # fitbro_backend/dependencies.py
 
-from fastapi import Depends, HTTPException
+import logging
+
+from fastapi import Depends, HTTPException, Query
 from .jwt_handler import get_current_user
 
+logger = logging.getLogger(__name__)
+
 # ===== TOGGLE THIS FOR DEV/PROD =====
 ENABLE_ROLE_CHECKS = False  # Set to True in prod, False in dev
 
+# Staff of the platform itself; they can act on any gym
+PLATFORM_ROLES = ("FitBro Admin", "FitBro Officer")
+
 def require_roles(*roles):
     def role_checker(current_user=Depends(get_current_user)):
         if not ENABLE_ROLE_CHECKS:
-            print("-------------------------------- dependencies.py ---- returning true")
+            logger.debug("role check skipped", extra={"required_roles": ",".join(roles)})
             # Skip check in dev, allow all
             return True
         user_role = current_user.get("role") if isinstance(current_user, dict) else getattr(current_user, "role", None)
-        print(f"DEBUG: Current user role: {user_role}, Required roles: {roles}")
         if user_role not in roles:
-            print("-------------------------------- dependencies.py ---- returning an exception that roles is not in expected roles ------")
+            logger.warning("role check failed", extra={"role": user_role, "required_roles": ",".join(roles)})
             raise HTTPException(status_code=403, detail="Insufficient privileges")
         return current_user
     return role_checker
+
+# require_roles for endpoints taking a gym_id query parameter: gym staff may only
+# pass their own gym, platform roles any gym
+def require_gym_roles(*roles):
+    def gym_checker(gym_id: int = Query(...), current_user=Depends(require_roles(*roles))):
+        if not ENABLE_ROLE_CHECKS:
+            return current_user
+        if current_user.get("role") not in PLATFORM_ROLES and current_user.get("gym_id") != gym_id:
+            logger.warning("gym check failed", extra={"role": current_user.get("role"), "gym_id": gym_id})
+            raise HTTPException(status_code=403, detail="Not a member of this gym")
+        return current_user
+    return gym_checker
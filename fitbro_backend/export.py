@@ -0,0 +1,70 @@
+# fitbro_backend/export.py
+# Streaming NDJSON/CSV exports for large tables.
+# Rows are read as plain column tuples in batches (yield_per) and written out
+# chunk by chunk, so memory stays flat no matter how many rows are exported.
+
+import csv
+import io
+import json
+from enum import Enum
+
+from fastapi.responses import StreamingResponse
+
+from .database import SessionLocal
+
+EXPORT_BATCH_SIZE = 1000
+
+
+class ExportFormat(str, Enum):
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+def _iter_rows(build_query, columns):
+    # The stream outlives the request's get_db session, so it owns its own
+    db = SessionLocal()
+    try:
+        query = build_query(db).with_entities(*columns)
+        for row in query.yield_per(EXPORT_BATCH_SIZE):
+            yield row
+    finally:
+        db.close()
+
+
+def _ndjson_lines(rows, names):
+    buf = []
+    for row in rows:
+        buf.append(json.dumps(dict(zip(names, row)), default=str))
+        if len(buf) >= EXPORT_BATCH_SIZE:
+            yield "\n".join(buf) + "\n"
+            buf = []
+    if buf:
+        yield "\n".join(buf) + "\n"
+
+
+def _csv_lines(rows, names):
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(names)
+    for i, row in enumerate(rows, 1):
+        writer.writerow(row)
+        if i % EXPORT_BATCH_SIZE == 0:
+            yield out.getvalue()
+            out.seek(0)
+            out.truncate()
+    yield out.getvalue()
+
+
+def export_response(build_query, columns, fmt: ExportFormat, filename: str):
+    # build_query(db) returns the filtered ORM query; columns are model attributes
+    names = [c.key for c in columns]
+    rows = _iter_rows(build_query, columns)
+    if fmt == ExportFormat.csv:
+        body, media_type = _csv_lines(rows, names), "text/csv"
+    else:
+        body, media_type = _ndjson_lines(rows, names), "application/x-ndjson"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{fmt.value}"'},
+    )
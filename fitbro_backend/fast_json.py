@@ -0,0 +1,65 @@
+# fitbro_backend/fast_json.py
+# Opt-in fast path for big list endpoints: select only the columns the Read schema
+# exposes as Core rows, zip them into dicts and encode with orjson, skipping ORM
+# identity-map work and per-row Pydantic validation. Endpoints keep their
+# response_model, so the OpenAPI schema is unchanged; returning a Response directly
+# just tells FastAPI not to validate it.
+#
+# Only for schemas whose fields are all plain columns of one table. orjson is
+# optional; without it the stdlib encoder is used.
+
+import json
+from datetime import date, datetime
+
+from fastapi import Response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+_columns = {}
+
+
+def _default(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def dumps(content) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, default=_default, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+class FastJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return dumps(content)
+
+
+def read_columns(model, schema, *extra):
+    """The model columns behind `schema`'s fields, in field order, then `extra` (e.g. updated_at)."""
+    key = (model, schema)
+    columns = _columns.get(key)
+    if columns is None:
+        table = model.__table__.columns
+        missing = [f for f in schema.model_fields if f not in table]
+        if missing:
+            raise ValueError(f"{schema.__name__} fields {missing} are not columns of {model.__tablename__}")
+        columns = _columns[key] = tuple(getattr(model, f) for f in schema.model_fields)
+    return columns + extra
+
+
+def page_response(result, schema, response: Response = None):
+    # result is a paginate_rows page of read_columns(...) rows; extra trailing columns are dropped
+    fields = tuple(schema.model_fields)
+    content = {
+        "items": [dict(zip(fields, row)) for row in result["items"]],
+        "next_cursor": result["next_cursor"],
+    }
+    # Headers set on the injected Response (ETag, Cache-Control) aren't merged into a returned one
+    headers = dict(response.headers) if response is not None else None
+    return FastJSONResponse(content, headers=headers)
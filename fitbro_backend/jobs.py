@@ -0,0 +1,228 @@
+# fitbro_backend/jobs.py
+# Durable background jobs: a `jobs` table used as a queue, tasks registered by kind,
+# and cron schedules. Request handlers enqueue() inside their own transaction, so a job
+# exists exactly when the write that asked for it committed, and return immediately;
+# worker.py runs the jobs, in the app process or in separate
+# `python -m fitbro_backend.worker` processes.
+#
+# A worker claims a job with one UPDATE ... WHERE id = (oldest due job) RETURNING, so
+# any number of workers can share the queue: SQLite serializes the writes and
+# PostgreSQL skips rows locked by another claim. Failed jobs are retried with
+# exponential backoff until max_attempts; jobs whose worker died are re-queued after
+# JOB_LOCK_TIMEOUT. Cron slots are enqueued with a unique key, so every process can
+# run the scheduler and each slot still runs once.
+#
+#   @task("rebuild_progress")
+#   def rebuild_progress_task(db):            # db: Session, committed by the worker
+#       return {"rows": rebuild_progress(db)}  # JSON-able result, kept on the job
+#
+#   enqueue(db, "rebuild_progress")            # then db.commit()
+
+import datetime
+import json
+import random
+import threading
+from dataclasses import dataclass
+
+from sqlalchemy import delete, event, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from .config import (
+    JOB_LOCK_TIMEOUT, JOB_MAX_ATTEMPTS, JOB_RETENTION_DAYS, JOB_RETRY_BASE, JOB_RETRY_MAX,
+)
+from .models import Job
+
+FINISHED = ("done", "failed", "cancelled")
+
+
+@dataclass
+class Task:
+    kind: str
+    fn: object
+    max_attempts: int
+    schedule: "Cron" = None
+
+
+_tasks = {}
+# Set when a session that enqueued commits, so idle in-process workers don't wait out a poll
+wake = threading.Event()
+
+
+def task(kind, max_attempts=JOB_MAX_ATTEMPTS, schedule=None):
+    """Register fn(db, **payload) as the handler for `kind`; schedule is a cron expression."""
+    def register(fn):
+        if kind in _tasks:
+            raise ValueError(f"Task {kind!r} is already registered")
+        _tasks[kind] = Task(kind, fn, max_attempts, Cron(schedule) if schedule else None)
+        return fn
+    return register
+
+
+def registered():
+    return dict(_tasks)
+
+
+def enqueue(db, kind, payload=None, run_at=None, unique_key=None, max_attempts=None):
+    """Add a job to the caller's Session (visible once it commits); returns the Job.
+
+    From an AsyncSession: await db.run_sync(lambda s: enqueue(s, kind, ...)).
+    """
+    if kind not in _tasks:
+        raise ValueError(f"Unknown job kind {kind!r}")
+    job = Job(
+        kind=kind, payload=json.dumps(payload or {}), status="queued", attempts=0,
+        max_attempts=max_attempts or _tasks[kind].max_attempts,
+        run_at=run_at or datetime.datetime.utcnow(), unique_key=unique_key,
+    )
+    db.add(job)
+    db.flush()
+    if not event.contains(db, "after_commit", _notify):
+        event.listen(db, "after_commit", _notify)
+    return job
+
+
+def _notify(session):
+    wake.set()
+
+
+def to_json(value):
+    # Task results often hold dates; anything else unusual is stored as its str()
+    return json.dumps(value, default=str)
+
+
+# ===== WORKER SIDE =====
+# Each function runs in its own short transaction on a Connection
+
+def claim(conn, worker_id, now=None):
+    """Mark the oldest due job of a registered kind as running; returns its row or None."""
+    now = now or datetime.datetime.utcnow()
+    oldest = select(Job.id).where(
+        Job.status == "queued", Job.run_at <= now, Job.kind.in_(list(_tasks))
+    ).order_by(Job.run_at, Job.id).limit(1).with_for_update(skip_locked=True).scalar_subquery()
+    return conn.execute(
+        update(Job).where(Job.id == oldest, Job.status == "queued")
+        .values(status="running", attempts=Job.attempts + 1, started_at=now, finished_at=None, locked_by=worker_id)
+        .returning(Job.id, Job.kind, Job.payload, Job.attempts, Job.max_attempts)
+    ).first()
+
+
+def finish(conn, job_id, result):
+    conn.execute(update(Job).where(Job.id == job_id).values(
+        status="done", result=to_json(result), last_error=None, locked_by=None,
+        finished_at=datetime.datetime.utcnow(),
+    ))
+
+
+def backoff(attempts):
+    # Exponential, with jitter so jobs that failed together don't retry together
+    delay = min(JOB_RETRY_MAX, JOB_RETRY_BASE * 2 ** (attempts - 1))
+    return datetime.timedelta(seconds=delay * random.uniform(0.8, 1.2))
+
+
+def fail(conn, job, error):
+    """Record a failed attempt: back to the queue after a backoff, or failed for good."""
+    now = datetime.datetime.utcnow()
+    if job.attempts >= job.max_attempts:
+        values = {"status": "failed", "finished_at": now}
+    else:
+        values = {"status": "queued", "run_at": now + backoff(job.attempts)}
+    conn.execute(update(Job).where(Job.id == job.id).values(last_error=error[-4000:], locked_by=None, **values))
+    return values["status"]
+
+
+def requeue_stale(conn, now=None):
+    """Jobs left running by a dead worker go back to the queue (or fail if out of attempts)."""
+    now = now or datetime.datetime.utcnow()
+    stale = [Job.status == "running", Job.started_at < now - datetime.timedelta(seconds=JOB_LOCK_TIMEOUT)]
+    lost = {"last_error": "worker lost (lock timeout)", "locked_by": None}
+    failed = conn.execute(update(Job).where(*stale, Job.attempts >= Job.max_attempts)
+                          .values(status="failed", finished_at=now, **lost)).rowcount
+    requeued = conn.execute(update(Job).where(*stale).values(status="queued", run_at=now, **lost)).rowcount
+    return requeued + failed
+
+
+def prune(conn, now=None, days=JOB_RETENTION_DAYS):
+    """Delete finished jobs older than `days`; returns rows deleted."""
+    cutoff = (now or datetime.datetime.utcnow()) - datetime.timedelta(days=days)
+    return conn.execute(delete(Job).where(Job.status.in_(FINISHED), Job.finished_at < cutoff)).rowcount
+
+
+# ===== CRON =====
+class Cron:
+    """Five-field cron expression (minute hour day-of-month month day-of-week) in UTC.
+
+    Fields take *, a number, a-b, */n, a-b/n and comma lists; day-of-week 0 or 7 is
+    Sunday. As in cron, when both day fields are restricted a day matching either runs.
+    """
+
+    FIELDS = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+    def __init__(self, expr):
+        parts = expr.split()
+        if len(parts) != 5:
+            raise ValueError(f"Cron expression needs 5 fields: {expr!r}")
+        self.expr = expr
+        self.minutes, self.hours, self.days, self.months, dows = (
+            self._parse(part, lo, hi) for part, (lo, hi) in zip(parts, self.FIELDS)
+        )
+        self.dows = {d % 7 for d in dows}
+        self.any_day, self.any_dow = parts[2] == "*", parts[4] == "*"
+
+    @staticmethod
+    def _parse(field, lo, hi):
+        values = set()
+        for item in field.split(","):
+            span, _, step = item.partition("/")
+            if span == "*":
+                start, end = lo, hi
+            elif "-" in span:
+                start, end = (int(v) for v in span.split("-", 1))
+            else:
+                start = int(span)
+                end = hi if step else start  # "5/15" means 5, 20, 35, 50
+            if not lo <= start <= end <= hi:
+                raise ValueError(f"Cron field {field!r} out of range {lo}-{hi}")
+            values.update(range(start, end + 1, int(step) if step else 1))
+        return values
+
+    def _day_matches(self, day):
+        in_month = day.day in self.days
+        in_week = (day.isoweekday() % 7) in self.dows
+        if self.any_day or self.any_dow:
+            return in_month and in_week
+        return in_month or in_week
+
+    def next_after(self, moment):
+        """First matching minute strictly after `moment` (naive UTC datetime)."""
+        t = moment.replace(second=0, microsecond=0) + datetime.timedelta(minutes=1)
+        limit = t + datetime.timedelta(days=366 * 5)
+        while t < limit:
+            if t.month not in self.months or not self._day_matches(t):
+                t = (t + datetime.timedelta(days=1)).replace(hour=0, minute=0)
+            elif t.hour not in self.hours:
+                t = (t + datetime.timedelta(hours=1)).replace(minute=0)
+            elif t.minute not in self.minutes:
+                t += datetime.timedelta(minutes=1)
+            else:
+                return t
+        raise ValueError(f"Cron expression never matches: {self.expr!r}")
+
+
+def cron_slot_key(kind, slot):
+    return f"cron:{kind}:{slot:%Y-%m-%dT%H:%M}"
+
+
+def enqueue_cron_slot(eng, kind, slot):
+    """Enqueue `kind` for the UTC cron `slot` unless some process already did."""
+    key = cron_slot_key(kind, slot)
+    with eng.begin() as conn:
+        if conn.execute(select(Job.id).where(Job.unique_key == key)).first():
+            return False
+    try:
+        with Session(eng) as db:
+            enqueue(db, kind, run_at=slot, unique_key=key)
+            db.commit()
+    except IntegrityError:
+        return False  # another scheduler enqueued the same slot first
+    return True
@@ -1,30 +1,221 @@
 # fitbro_backend/jwt_handler.py
 
+import datetime
+import hashlib
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Optional
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
-from .config import SECRET_KEY, ALGORITHM
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from .cache import TTLCache
+from .config import (
+    SECRET_KEY, ALGORITHM, TOKEN_CACHE_SIZE, TOKEN_CACHE_MAX_TTL,
+    ACCESS_TOKEN_EXPIRE_MINUTES, REFRESH_TOKEN_EXPIRE_DAYS,
+)
+from .database import get_db
+from .models.user import User
+from .models.revoked_token import RevokedToken
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login", auto_error=False)
+
+
+# The authenticated caller, resolved from the users table once per token
+@dataclass(frozen=True)
+class Principal:
+    id: int
+    mobile: str
+    name: Optional[str]
+    role: str
+    gym_id: Optional[int]
+
+    # dict-style access kept for callers written against the old claims dict
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+
+# sha256(token) -> (Principal, user version). Committing a change to a users row bumps
+# that user's version, so a deactivated or re-roled user is re-read on their next request
+# instead of keeping the cached Principal until the TTL.
+_token_cache = TTLCache(maxsize=TOKEN_CACHE_SIZE, ttl=TOKEN_CACHE_MAX_TTL)
+_user_versions = {}
+_versions_lock = threading.Lock()
+
+
+def _cache_key(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def invalidate_token(token: str):
+    _token_cache.pop(_cache_key(token))
+
+
+def invalidate_user(*user_ids):
+    with _versions_lock:
+        for user_id in set(user_ids):
+            _user_versions[user_id] = _user_versions.get(user_id, 0) + 1
+
+
+def _user_version(user_id):
+    with _versions_lock:
+        return _user_versions.get(user_id, 0)
+
+
+# Any ORM write to users (an admin edit, a deactivation, a password rehash) invalidates
+# after it commits; bulk query.update() calls bypass this and must call invalidate_user
+@event.listens_for(Session, "after_flush")
+def _collect_user_writes(session, flush_context):
+    changed = {o.id for o in list(session.dirty) + list(session.deleted) if isinstance(o, User)}
+    if changed:
+        session.info.setdefault("changed_users", set()).update(changed)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_user_writes(session):
+    changed = session.info.pop("changed_users", None)
+    if changed:
+        invalidate_user(*changed)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_user_writes(session):
+    session.info.pop("changed_users", None)
+
+
+def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+    key = _cache_key(token)
+    cached = _token_cache.get(key)
+    if cached is not None and cached[1] == _user_version(cached[0].id):
+        return cached[0]
+    # Taken before reading the row: a write committing in between leaves an outdated
+    # version on the entry (one extra lookup), never an outdated Principal
+    with _versions_lock:
+        versions = dict(_user_versions)
 
-def get_current_user(token: str = Depends(oauth2_scheme)):
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate token",
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        print(" ------------ inside get_current_user, token: -----------", token)
-        print("-------------------------USING SECRET KEY:", SECRET_KEY)
-        print("-------------------------USING ALGORITHM:", ALGORITHM)
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        print("DEBUG - Decoded payload:", payload)
-        mobile = payload.get("sub")
-        role = payload.get("role")
-        name = payload.get("name")
-        if mobile is None or role is None:
-            raise credentials_exception
-        return {"mobile": mobile, "role": role, "name": name}
-    except JWTError as e:
-        print("JWT decode error:", e)
+    except JWTError:
         raise credentials_exception
+    mobile = payload.get("sub")
+    if mobile is None or payload.get("role") is None or payload.get("type") == "refresh":
+        raise credentials_exception
+
+    user = db.query(User).filter(User.mobile == mobile).first()
+    if not user or user.is_active is False:
+        raise credentials_exception
+    principal = Principal(id=user.id, mobile=user.mobile, name=user.name, role=user.role.value, gym_id=user.gym_id)
+
+    exp = payload.get("exp")
+    ttl = min(exp - time.time(), TOKEN_CACHE_MAX_TTL) if exp else TOKEN_CACHE_MAX_TTL
+    _token_cache.set(key, (principal, versions.get(user.id, 0)), ttl=ttl)
+    return principal
+
+
+# ===== TOKEN ISSUING =====
+
+def create_access_token(mobile: str, role: str, name: Optional[str]) -> str:
+    exp = datetime.datetime.utcnow() + datetime.timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    claims = {"sub": mobile, "role": role, "name": name, "exp": int(exp.replace(tzinfo=datetime.timezone.utc).timestamp())}
+    return jwt.encode(claims, SECRET_KEY, algorithm=ALGORITHM)
+
+
+def create_refresh_token(mobile: str, role: str, name: Optional[str], family: Optional[str] = None) -> str:
+    # family ties every rotation of one login together, so a replay can revoke the whole chain
+    exp = datetime.datetime.utcnow() + datetime.timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+    claims = {
+        "sub": mobile, "role": role, "name": name, "type": "refresh",
+        "jti": uuid.uuid4().hex, "fam": family or uuid.uuid4().hex,
+        "exp": int(exp.replace(tzinfo=datetime.timezone.utc).timestamp()),
+    }
+    return jwt.encode(claims, SECRET_KEY, algorithm=ALGORITHM)
+
+
+def decode_refresh_token(token: str) -> dict:
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except JWTError:
+        payload = {}
+    if payload.get("type") != "refresh" or not payload.get("jti") or not payload.get("fam"):
+        raise HTTPException(status_code=401, detail="Invalid refresh token")
+    return payload
+
+
+# ===== REFRESH-TOKEN REVOCATION LIST =====
+# The revoked_tokens table is the source of truth; each process keeps the revoked ids it
+# has seen (until they expire) so repeat checks skip the database. A miss is always
+# looked up by primary key, so a logout handled by another worker counts here at once.
+
+class RevocationList:
+    PRUNE_EVERY = 500
+
+    def __init__(self):
+        self._revoked = {}  # id -> expires_at (unix seconds), revocations seen by this process
+        self._writes = 0
+        self._lock = threading.Lock()
+
+    def is_revoked(self, db: Session, *ids) -> bool:
+        now = time.time()
+        if any(self._revoked.get(i, 0) > now for i in ids):
+            return True
+        rows = db.query(RevokedToken.jti, RevokedToken.expires_at).filter(
+            RevokedToken.jti.in_(ids), RevokedToken.expires_at > datetime.datetime.utcnow()
+        ).all()
+        with self._lock:
+            for jti, expires_at in rows:
+                self._revoked[jti] = expires_at.replace(tzinfo=datetime.timezone.utc).timestamp()
+        return bool(rows)
+
+    def revoke(self, db: Session, token_id: str, exp: int) -> bool:
+        # Returns False when token_id was already revoked (possibly by another worker):
+        # the primary key insert makes "use this refresh token once" atomic across processes.
+        expires_at = datetime.datetime.utcfromtimestamp(exp)
+        try:
+            db.add(RevokedToken(jti=token_id, expires_at=expires_at))
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            with self._lock:
+                self._revoked[token_id] = exp
+            return False
+        with self._lock:
+            self._revoked[token_id] = exp
+            self._writes += 1
+            prune = self._writes % self.PRUNE_EVERY == 0
+        if prune:
+            self._prune(db)
+        return True
+
+    def revoke_family(self, db: Session, family: str):
+        # Rotation keeps the family and gives each new token a fresh exp, so the newest
+        # token can outlive the one presented; block the family until any rotation issued
+        # up to now has expired. A second revocation extends the row instead of keeping
+        # the earlier, shorter expiry.
+        exp = int(time.time()) + REFRESH_TOKEN_EXPIRE_DAYS * 24 * 3600
+        if not self.revoke(db, family, exp):
+            expires_at = datetime.datetime.utcfromtimestamp(exp)
+            db.query(RevokedToken).filter(RevokedToken.jti == family, RevokedToken.expires_at < expires_at).update(
+                {"expires_at": expires_at}, synchronize_session=False)
+            db.commit()
+
+    def _prune(self, db: Session):
+        now = time.time()
+        with self._lock:
+            self._revoked = {k: v for k, v in self._revoked.items() if v > now}
+        db.query(RevokedToken).filter(RevokedToken.expires_at <= datetime.datetime.utcnow()).delete(synchronize_session=False)
+        db.commit()
+
+
+revocations = RevocationList()
@@ -0,0 +1,32 @@
+# fitbro_backend/logs.py
+# Level-gated logging with key=value fields: pass structured data through `extra`
+# and it's appended to the line, e.g.
+#   logger.info("request", extra={"route": "/members/", "duration_ms": 12.5})
+
+import logging
+
+from .config import LOG_LEVEL
+
+# Attributes every LogRecord has; anything else came in through `extra`
+_RESERVED = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+def _quote(value):
+    text = str(value)
+    return f'"{text}"' if not text or any(c in text for c in ' "=') else text
+
+
+class KeyValueFormatter(logging.Formatter):
+    def format(self, record):
+        line = super().format(record)
+        fields = " ".join(f"{k}={_quote(v)}" for k, v in vars(record).items() if k not in _RESERVED)
+        return f"{line} {fields}" if fields else line
+
+
+def configure_logging(level=LOG_LEVEL):
+    handler = logging.StreamHandler()
+    handler.setFormatter(KeyValueFormatter("%(asctime)s %(levelname)s %(name)s %(message)s"))
+    log = logging.getLogger("fitbro_backend")
+    log.handlers[:] = [handler]
+    log.setLevel(level)
+    log.propagate = False
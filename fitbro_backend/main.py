@@ -1,8 +1,27 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fitbro_backend.routers import all_routers
 from fastapi.middleware.cors import CORSMiddleware
+from fitbro_backend.compression import CompressionMiddleware
+from fitbro_backend.config import METRICS_ENABLED
+from fitbro_backend.logs import configure_logging
+from fitbro_backend.metrics import MetricsMiddleware
+from fitbro_backend.worker import start_in_app
+
+configure_logging()
+
+
+# Background job threads live as long as the app (FITBRO_JOB_WORKERS=0 to run them separately)
+@asynccontextmanager
+async def lifespan(app):
+    worker = start_in_app()
+    yield
+    if worker is not None:
+        worker.stop()
 
-app = FastAPI()
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -10,8 +29,16 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing", "ETag"],
 )
 
+# Inside CORS so preflights skip it, outside the app so every router's JSON is covered
+app.add_middleware(CompressionMiddleware)
+
+if METRICS_ENABLED:
+    # Added last so it wraps CORS too and times the whole request
+    app.add_middleware(MetricsMiddleware)
+
 for router in all_routers:
     app.include_router(router)
 
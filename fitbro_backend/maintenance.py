@@ -0,0 +1,130 @@
+# fitbro_backend/maintenance.py
+# Nightly rollover: expire memberships past their end date and move cycle plans through
+# Future -> Active -> Completed by date, for every gym at once. Each step is a single
+# conditional UPDATE searched by an index (ix_members_active_end,
+# ix_cycle_plans_status_dates), so the job only reads the rows that actually change.
+# A step only matches rows that still need changing, so re-running for the same day
+# changes nothing, and a run after missed nights catches up in one pass.
+#
+# Every run is recorded in maintenance_runs with what it changed (or the error).
+#
+#   python -m fitbro_backend.maintenance                    # roll over to today
+#   python -m fitbro_backend.maintenance --date 2025-01-31
+#   python -m fitbro_backend.maintenance --runs 10          # show the latest runs
+
+import argparse
+import datetime
+import time
+
+from sqlalchemy import and_, exists, select, update
+
+from .clock import utc_today
+from .dashboard import invalidate_all_dashboards
+from .models import CyclePlan, MaintenanceRun, Member
+
+JOB = "nightly_rollover"
+
+_runs = MaintenanceRun.__table__
+
+
+def expire_memberships(conn, today):
+    """Deactivate members whose membership ended before `today`; returns rows changed."""
+    return conn.execute(
+        update(Member).where(Member.active == True, Member.membership_end_date < today)
+        .values(active=False).execution_options(synchronize_session=False)
+    ).rowcount
+
+
+def complete_cycles(conn, today):
+    """Active (or never started) cycles whose end_date has passed become Completed."""
+    return conn.execute(
+        update(CyclePlan).where(
+            CyclePlan.status.in_(("Active", "Future")), CyclePlan.end_date < today, CyclePlan.is_deleted == False
+        ).values(status="Completed").execution_options(synchronize_session=False)
+    ).rowcount
+
+
+def activate_cycles(conn, today):
+    """Future cycles covering `today` become Active, keeping one active cycle per member."""
+    other = CyclePlan.__table__.alias("other")
+    busy = exists().where(
+        other.c.member_id == CyclePlan.member_id, other.c.is_deleted == False, other.c.id != CyclePlan.id,
+        # Another active cycle, or an earlier-starting Future one that is due as well
+        (other.c.status == "Active") | and_(
+            other.c.status == "Future", other.c.start_date <= today, other.c.end_date >= today,
+            (other.c.start_date < CyclePlan.start_date)
+            | and_(other.c.start_date == CyclePlan.start_date, other.c.id < CyclePlan.id),
+        ),
+    )
+    return conn.execute(
+        update(CyclePlan).where(
+            CyclePlan.status == "Future", CyclePlan.start_date <= today, CyclePlan.end_date >= today,
+            CyclePlan.is_deleted == False, ~busy,
+        ).values(status="Active").execution_options(synchronize_session=False)
+    ).rowcount
+
+
+def rollover(conn, today):
+    # Completing first frees the member's active slot for a cycle starting today
+    return {
+        "members_expired": expire_memberships(conn, today),
+        "cycles_completed": complete_cycles(conn, today),
+        "cycles_activated": activate_cycles(conn, today),
+    }
+
+
+def run_rollover(eng, today=None):
+    """Roll every gym over to `today` (default: the current UTC date) in one transaction and log the run."""
+    today = today or utc_today()
+    with eng.begin() as conn:
+        run_id = conn.execute(_runs.insert().values(
+            job=JOB, as_of=today, started_at=datetime.datetime.utcnow(), status="running"
+        )).inserted_primary_key[0]
+    try:
+        with eng.begin() as conn:
+            counts = rollover(conn, today)
+    except Exception as exc:
+        with eng.begin() as conn:
+            conn.execute(_runs.update().where(_runs.c.id == run_id).values(
+                status="failed", finished_at=datetime.datetime.utcnow(), error=repr(exc)[:2000]
+            ))
+        raise
+    with eng.begin() as conn:
+        conn.execute(_runs.update().where(_runs.c.id == run_id).values(
+            status="ok", finished_at=datetime.datetime.utcnow(), **counts
+        ))
+    if any(counts.values()):
+        invalidate_all_dashboards()
+    return {"id": run_id, "as_of": today, **counts}
+
+
+def latest_runs(db, limit=20):
+    return db.execute(
+        select(MaintenanceRun).where(MaintenanceRun.job == JOB).order_by(MaintenanceRun.started_at.desc()).limit(limit)
+    ).scalars().all()
+
+
+def main():
+    from .database import engine
+
+    parser = argparse.ArgumentParser(description="Nightly membership expiry and cycle status rollover")
+    parser.add_argument("--date", type=datetime.date.fromisoformat, help="roll over to this day (default: today, UTC)")
+    parser.add_argument("--runs", type=int, metavar="N", help="show the latest N runs instead of running")
+    args = parser.parse_args()
+    if args.runs:
+        from sqlalchemy.orm import Session
+        with Session(engine) as db:
+            for r in latest_runs(db, args.runs):
+                took = f"{(r.finished_at - r.started_at).total_seconds():.1f}s" if r.finished_at else "-"
+                print(f"#{r.id} {r.as_of} {r.status:7s} {took:>7s} expired={r.members_expired} "
+                      f"activated={r.cycles_activated} completed={r.cycles_completed} {r.error or ''}")
+        return
+    start = time.perf_counter()
+    run = run_rollover(engine, args.date)
+    print(f"rolled over to {run['as_of']} in {time.perf_counter() - start:.1f}s: "
+          f"{run['members_expired']} memberships expired, {run['cycles_completed']} cycles completed, "
+          f"{run['cycles_activated']} cycles activated")
+
+
+if __name__ == "__main__":
+    main()
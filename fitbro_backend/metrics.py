@@ -0,0 +1,198 @@
+# fitbro_backend/metrics.py
+# Per-request cost accounting: SQLAlchemy cursor events add every statement's time to
+# the current request's RequestStats (held in a contextvar, so it follows the request
+# into the threadpool and the async engine's greenlet). MetricsMiddleware reports them
+# as a Server-Timing header, per-route Prometheus histograms and a log line.
+
+import contextvars
+import logging
+import threading
+import time
+
+from sqlalchemy import event
+from starlette.datastructures import MutableHeaders
+
+from .config import SLOW_REQUEST_MS
+
+logger = logging.getLogger(__name__)
+
+_current = contextvars.ContextVar("fitbro_request_stats", default=None)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 250)
+
+
+class RequestStats:
+    __slots__ = ("statements", "db_time", "slowest", "slowest_sql")
+
+    def __init__(self):
+        self.statements = 0
+        self.db_time = 0.0
+        self.slowest = 0.0
+        self.slowest_sql = None
+
+    def add(self, statement, elapsed):
+        self.statements += 1
+        self.db_time += elapsed
+        if elapsed > self.slowest:
+            self.slowest, self.slowest_sql = elapsed, statement
+
+    def server_timing(self, app_time):
+        return (
+            f'db;dur={self.db_time * 1000:.1f};desc="{self.statements} queries", '
+            f"db-slowest;dur={self.slowest * 1000:.1f}, "
+            f"app;dur={app_time * 1000:.1f}"
+        )
+
+
+# ===== SQLALCHEMY HOOKS =====
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("fitbro_query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["fitbro_query_start"].pop()
+    stats = _current.get()
+    if stats is not None:
+        stats.add(statement, elapsed)
+
+
+def instrument_engine(eng):
+    # For an AsyncEngine pass eng.sync_engine
+    event.listen(eng, "before_cursor_execute", _before_cursor_execute)
+    event.listen(eng, "after_cursor_execute", _after_cursor_execute)
+
+
+# ===== PROMETHEUS TEXT FORMAT =====
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(pairs):
+    body = ",".join(f'{k}="{_escape(v)}"' for k, v in pairs)
+    return "{" + body + "}" if body else ""
+
+
+def _num(v):
+    return "+Inf" if v == float("inf") else repr(float(v)) if isinstance(v, float) else str(v)
+
+
+class Histogram:
+    def __init__(self, name, help, buckets):
+        self.name = name
+        self.help = help
+        self.buckets = tuple(buckets) + (float("inf"),)
+        self._series = {}  # label pairs -> [bucket counts..., sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, labels, value):
+        key = tuple(labels.items())
+        with self._lock:
+            s = self._series.get(key)
+            if s is None:
+                s = self._series[key] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    s[i] += 1
+            s[-2] += value
+            s[-1] += 1
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = [(k, list(v)) for k, v in self._series.items()]
+        for key, s in sorted(series):
+            for bound, count in zip(self.buckets, s):
+                lines.append(f"{self.name}_bucket{_labels(key + (('le', _num(bound)),))} {count}")
+            lines.append(f"{self.name}_sum{_labels(key)} {s[-2]!r}")
+            lines.append(f"{self.name}_count{_labels(key)} {s[-1]}")
+        return lines
+
+
+class Counter:
+    def __init__(self, name, help):
+        self.name = name
+        self.help = help
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels, amount=1):
+        key = tuple(labels.items())
+        with self._lock:
+            self._series[key] = self._series.get(key, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            series = sorted(self._series.items())
+        lines.extend(f"{self.name}{_labels(key)} {value}" for key, value in series)
+        return lines
+
+
+REQUESTS = Counter("fitbro_http_requests_total", "HTTP requests by route and status.")
+REQUEST_SECONDS = Histogram("fitbro_http_request_duration_seconds", "Wall time per request.", LATENCY_BUCKETS)
+DB_SECONDS = Histogram("fitbro_http_request_db_seconds", "Time spent in SQL per request.", LATENCY_BUCKETS)
+DB_STATEMENTS = Histogram("fitbro_http_request_db_statements", "SQL statements per request.", QUERY_COUNT_BUCKETS)
+METRICS = [REQUESTS, REQUEST_SECONDS, DB_SECONDS, DB_STATEMENTS]
+
+
+def render_metrics():
+    lines = []
+    for metric in METRICS:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+# ===== MIDDLEWARE =====
+def _route_label(scope):
+    # The route template (/members/{member_id}), never the raw path, to keep label cardinality bounded
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _current.set(stats)
+        start = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                MutableHeaders(scope=message).append("Server-Timing", stats.server_timing(time.perf_counter() - start))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            self._record(scope, status, stats, time.perf_counter() - start)
+
+    def _record(self, scope, status, stats, elapsed):
+        route = _route_label(scope)
+        labels = {"method": scope["method"], "route": route}
+        REQUESTS.inc({**labels, "status": status})
+        REQUEST_SECONDS.observe(labels, elapsed)
+        DB_SECONDS.observe(labels, stats.db_time)
+        DB_STATEMENTS.observe(labels, stats.statements)
+
+        slow = elapsed * 1000 >= SLOW_REQUEST_MS
+        level = logging.WARNING if slow else logging.DEBUG
+        if logger.isEnabledFor(level):
+            extra = {
+                "method": scope["method"], "route": route, "status": status,
+                "duration_ms": round(elapsed * 1000, 1), "db_ms": round(stats.db_time * 1000, 1),
+                "statements": stats.statements, "slowest_ms": round(stats.slowest * 1000, 1),
+            }
+            if slow and stats.slowest_sql:
+                extra["slowest_sql"] = " ".join(stats.slowest_sql.split())[:500]
+            logger.log(level, "slow request" if slow else "request", extra=extra)
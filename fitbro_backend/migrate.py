@@ -0,0 +1,66 @@
+# fitbro_backend/migrate.py
+# Minimal migration runner (Alembic-style numbered upgrades, no extra dependency).
+#
+#   python -m fitbro_backend.migrate            # apply pending migrations
+#   python -m fitbro_backend.migrate --status   # list applied / pending
+
+import argparse
+import datetime
+import importlib
+import pkgutil
+
+from sqlalchemy import Column, DateTime, MetaData, String, Table, select
+
+from fitbro_backend.database import engine
+from fitbro_backend import migrations
+
+_meta = MetaData()
+schema_migrations = Table(
+    "schema_migrations", _meta,
+    Column("version", String(128), primary_key=True),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+def available():
+    return sorted(m.name for m in pkgutil.iter_modules(migrations.__path__) if m.name.startswith("m"))
+
+
+def applied(conn):
+    return {row.version for row in conn.execute(select(schema_migrations.c.version))}
+
+
+def upgrade(eng=engine):
+    _meta.create_all(bind=eng, checkfirst=True)
+    done = []
+    for name in available():
+        # One transaction per migration, recorded together with its version row
+        with eng.begin() as conn:
+            if name in applied(conn):
+                continue
+            module = importlib.import_module(f"{migrations.__name__}.{name}")
+            module.upgrade(conn)
+            conn.execute(schema_migrations.insert().values(version=name, applied_at=datetime.datetime.utcnow()))
+        done.append(name)
+    return done
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FitBro schema migrations")
+    parser.add_argument("--status", action="store_true", help="show applied and pending migrations")
+    args = parser.parse_args()
+
+    if args.status:
+        _meta.create_all(bind=engine, checkfirst=True)
+        with engine.connect() as conn:
+            done = applied(conn)
+        for name in available():
+            print(f"{'applied' if name in done else 'pending':8s} {name}")
+        return
+
+    done = upgrade()
+    print("Applied: " + ", ".join(done) if done else "Database is up to date.")
+
+
+if __name__ == "__main__":
+    main()
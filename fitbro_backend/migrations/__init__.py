@@ -0,0 +1,3 @@
+# Schema migrations, applied in file-name order by fitbro_backend/migrate.py.
+# Each module defines upgrade(conn); keep them idempotent so a fresh database
+# (created by 0001 from the current models) can run the later ones as no-ops.
@@ -0,0 +1,7 @@
+# Baseline: create any missing tables from the current models
+from fitbro_backend.database import Base
+import fitbro_backend.models  # noqa: F401  (registers every table on Base.metadata)
+
+
+def upgrade(conn):
+    Base.metadata.create_all(bind=conn, checkfirst=True)
@@ -0,0 +1,11 @@
+# Idempotency key for POST /workout-logs/batch
+from sqlalchemy import inspect, text
+
+
+def upgrade(conn):
+    columns = {c["name"] for c in inspect(conn).get_columns("workout_logs")}
+    if "client_key" not in columns:
+        conn.execute(text("ALTER TABLE workout_logs ADD COLUMN client_key VARCHAR(64)"))
+    conn.execute(text(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ix_workout_logs_client_key ON workout_logs (client_key)"
+    ))
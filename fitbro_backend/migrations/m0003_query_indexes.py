@@ -0,0 +1,18 @@
+# Composite indexes for the filters the routers actually use
+from sqlalchemy import text
+
+INDEXES = [
+    ("ix_workout_plan_entries_cycle_day", "workout_plan_entries", "cycle_plan_id, day_date"),
+    ("ix_cycle_plans_member_status", "cycle_plans", "member_id, status, is_deleted"),
+    ("ix_visitors_gym_mobile_created", "visitors", "gym_id, mobile, created_at"),
+    ("ix_visitors_gym_created", "visitors", "gym_id, created_at, id"),
+    ("ix_visitor_followups_visitor_created", "visitor_followups", "visitor_id, created_at"),
+    ("ix_workout_logs_member_date", "workout_logs", "member_id, workout_date"),
+    ("ix_workout_logs_entry", "workout_logs", "workout_plan_entry_id"),
+    ("ix_members_gym_id", "members", "gym_id"),
+]
+
+
+def upgrade(conn):
+    for name, table, columns in INDEXES:
+        conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})"))
@@ -0,0 +1,8 @@
+# Refresh-token revocation list
+from fitbro_backend.models.revoked_token import RevokedToken
+
+
+def upgrade(conn):
+    RevokedToken.__table__.create(bind=conn, checkfirst=True)
+    for index in RevokedToken.__table__.indexes:
+        index.create(bind=conn, checkfirst=True)
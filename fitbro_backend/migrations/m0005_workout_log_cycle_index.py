@@ -0,0 +1,8 @@
+# Server-side filtering of /workout-logs/ by cycle plan (and date)
+from sqlalchemy import text
+
+
+def upgrade(conn):
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_workout_logs_cycle_date ON workout_logs (cycle_plan_id, workout_date)"
+    ))
@@ -0,0 +1,14 @@
+# updated_at row versions on the tables behind the mobile sync endpoints; ETags are
+# hashed from (id, updated_at), so existing rows start out as NULL and get a value on
+# their next write
+from sqlalchemy import inspect, text
+
+TABLES = ("members", "cycle_plans", "workout_plan_entries", "exercises", "workout_logs")
+
+
+def upgrade(conn):
+    inspector = inspect(conn)
+    for table in TABLES:
+        columns = {c["name"] for c in inspector.get_columns(table)}
+        if "updated_at" not in columns:
+            conn.execute(text(f"ALTER TABLE {table} ADD COLUMN updated_at DATETIME"))
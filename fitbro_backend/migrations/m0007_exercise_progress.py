@@ -0,0 +1,10 @@
+# Exercise progress rollups, backfilled from the existing workout_logs
+from fitbro_backend.models.exercise_progress import ExerciseProgress
+from fitbro_backend.progress import rebuild_progress
+
+
+def upgrade(conn):
+    ExerciseProgress.__table__.create(bind=conn, checkfirst=True)
+    for index in ExerciseProgress.__table__.indexes:
+        index.create(bind=conn, checkfirst=True)
+    rebuild_progress(conn)
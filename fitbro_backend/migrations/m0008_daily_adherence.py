@@ -0,0 +1,10 @@
+# Daily plan-vs-actual adherence, backfilled from the existing plan entries and logs
+from fitbro_backend.adherence import rebuild_adherence
+from fitbro_backend.models.daily_adherence import DailyAdherence
+
+
+def upgrade(conn):
+    DailyAdherence.__table__.create(bind=conn, checkfirst=True)
+    for index in DailyAdherence.__table__.indexes:
+        index.create(bind=conn, checkfirst=True)
+    rebuild_adherence(conn)
@@ -0,0 +1,11 @@
+# Run log for the nightly rollover job, and the indexes its UPDATEs search by
+from fitbro_backend.models.cycle_plan import CyclePlan
+from fitbro_backend.models.maintenance_run import MaintenanceRun
+from fitbro_backend.models.member import Member
+
+
+def upgrade(conn):
+    MaintenanceRun.__table__.create(bind=conn, checkfirst=True)
+    for table in (MaintenanceRun.__table__, Member.__table__, CyclePlan.__table__):
+        for index in table.indexes:
+            index.create(bind=conn, checkfirst=True)
@@ -0,0 +1,8 @@
+# Background job queue
+from fitbro_backend.models.job import Job
+
+
+def upgrade(conn):
+    Job.__table__.create(bind=conn, checkfirst=True)
+    for index in Job.__table__.indexes:
+        index.create(bind=conn, checkfirst=True)
@@ -14,4 +14,9 @@ from .workout_log import WorkoutLog
 from .assessment_result import AssessmentResult
 from .announcement import Announcement
 from .visitor import Visitor
-from .visitor_followup import VisitorFollowUp
\ No newline at end of file
+from .visitor_followup import VisitorFollowUp
+from .revoked_token import RevokedToken
+from .exercise_progress import ExerciseProgress
+from .daily_adherence import DailyAdherence
+from .maintenance_run import MaintenanceRun
+from .job import Job
\ No newline at end of file
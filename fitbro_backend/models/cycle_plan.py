@@ -1,9 +1,14 @@
-from sqlalchemy import Column, Integer, Date, String, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, Date, String, Boolean, ForeignKey, Index, DateTime
 from sqlalchemy.orm import relationship
 from ..database import Base
+import datetime
 
 class CyclePlan(Base):
     __tablename__ = "cycle_plans"
+    __table_args__ = (
+        Index("ix_cycle_plans_member_status", "member_id", "status", "is_deleted"),
+        Index("ix_cycle_plans_status_dates", "status", "end_date", "start_date"),  # nightly rollover
+    )
     id = Column(Integer, primary_key=True, index=True)
     member_id = Column(Integer, ForeignKey("members.id"), nullable=False)
     cycle_number = Column(Integer, nullable=False)
@@ -12,5 +17,6 @@ class CyclePlan(Base):
     duration = Column(Integer, nullable=False, default=30)
     status = Column(String, default="Future")  # "Active", "Completed", "Terminated", "Future"
     is_deleted = Column(Boolean, default=False)
+    updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)  # row version for ETags
 
     member = relationship("Member", back_populates="cycle_plans")
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Integer, Date, Float, ForeignKey, DateTime, Index, UniqueConstraint
+from ..database import Base
+import datetime
+
+# Plan vs actual per cycle day, maintained by fitbro_backend/adherence.py
+class DailyAdherence(Base):
+    __tablename__ = "daily_adherence"
+    __table_args__ = (
+        UniqueConstraint("cycle_plan_id", "day_date", name="uq_daily_adherence_cycle_day"),
+        Index("ix_daily_adherence_member_day", "member_id", "day_date"),
+    )
+    id = Column(Integer, primary_key=True)
+    cycle_plan_id = Column(Integer, ForeignKey("cycle_plans.id"), nullable=False)
+    member_id = Column(Integer, ForeignKey("members.id"), nullable=False)
+    day_date = Column(Date, nullable=False)
+
+    planned = Column(Integer, nullable=False, default=0)    # plan entries that day
+    completed = Column(Integer, nullable=False, default=0)  # entries with a non-skipped log
+    skipped = Column(Integer, nullable=False, default=0)    # entries whose logs are all skipped
+    adherence = Column(Float, nullable=False, default=0)    # completed / planned, in %
+    streak = Column(Integer, nullable=False, default=0)     # fully completed planned days in a row, ending here
+    updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
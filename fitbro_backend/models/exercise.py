@@ -1,6 +1,7 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Boolean, Text
+from sqlalchemy import Column, Integer, String, ForeignKey, Boolean, Text, DateTime
 from sqlalchemy.orm import relationship
 from ..database import Base
+import datetime
 
 class Exercise(Base):
     __tablename__ = "exercises"
@@ -16,6 +17,7 @@ class Exercise(Base):
     parent_id = Column(Integer, ForeignKey("exercises.id"), nullable=True)
     is_enabled = Column(Boolean, default=True)
     equipment_id = Column(Integer, ForeignKey("equipment.id"), nullable=True)
+    updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)  # row version for ETags
 
     # Relationships
     workout = relationship("Workout", back_populates="exercises")
@@ -0,0 +1,27 @@
+from sqlalchemy import Column, Integer, String, Date, Float, Boolean, ForeignKey, DateTime, Index, UniqueConstraint
+from ..database import Base
+import datetime
+
+# Per member / exercise / period rollups of workout_logs, maintained by fitbro_backend/progress.py
+class ExerciseProgress(Base):
+    __tablename__ = "exercise_progress"
+    __table_args__ = (
+        UniqueConstraint("member_id", "exercise_id", "period", "period_start", name="uq_exercise_progress_bucket"),
+        Index("ix_exercise_progress_member_period", "member_id", "period", "period_start"),
+    )
+    id = Column(Integer, primary_key=True)
+    member_id = Column(Integer, ForeignKey("members.id"), nullable=False)
+    exercise_id = Column(Integer, ForeignKey("exercises.id"), nullable=False)
+    period = Column(String(8), nullable=False)  # "day", "week" (starts Monday), "month"
+    period_start = Column(Date, nullable=False)
+
+    log_count = Column(Integer, nullable=False, default=0)
+    total_sets = Column(Integer, nullable=False, default=0)
+    total_reps = Column(Integer, nullable=False, default=0)
+    volume = Column(Float, nullable=False, default=0)  # sum of sets x reps x weight
+    total_minutes = Column(Integer, nullable=False, default=0)
+    best_weight = Column(Float, nullable=True)   # best set = highest estimated 1RM
+    best_reps = Column(Integer, nullable=True)
+    best_e1rm = Column(Float, nullable=True)     # Epley
+    is_pr = Column(Boolean, nullable=False, default=False)  # best_e1rm beats every earlier period's
+    updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
@@ -0,0 +1,25 @@
+from sqlalchemy import Column, Integer, String, DateTime, Text, Index
+from ..database import Base
+import datetime
+
+# Durable background job queue (fitbro_backend/jobs.py); times are UTC
+class Job(Base):
+    __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_status_run_at", "status", "run_at"),
+        Index("ix_jobs_kind_created", "kind", "created_at"),
+    )
+    id = Column(Integer, primary_key=True)
+    kind = Column(String(64), nullable=False)
+    payload = Column(Text, nullable=False, default="{}")   # JSON string: keyword arguments of the task
+    status = Column(String(16), nullable=False, default="queued")  # queued / running / done / failed / cancelled
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False)
+    run_at = Column(DateTime, nullable=False)              # not before; pushed back on each retry
+    unique_key = Column(String(128), unique=True, nullable=True)  # e.g. one row per cron slot
+    locked_by = Column(String(128), nullable=True)
+    result = Column(Text, nullable=True)                   # JSON string returned by the task
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
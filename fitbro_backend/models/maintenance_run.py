@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, String, Date, DateTime, Text, Index
+from ..database import Base
+
+# One row per run of a scheduled maintenance job (fitbro_backend/maintenance.py)
+class MaintenanceRun(Base):
+    __tablename__ = "maintenance_runs"
+    __table_args__ = (
+        Index("ix_maintenance_runs_job_started", "job", "started_at"),
+    )
+    id = Column(Integer, primary_key=True)
+    job = Column(String(64), nullable=False)
+    as_of = Column(Date, nullable=False)                  # the day the job rolled over to
+    started_at = Column(DateTime, nullable=False)
+    finished_at = Column(DateTime, nullable=True)
+    status = Column(String(16), nullable=False, default="running")  # running / ok / failed
+    members_expired = Column(Integer, nullable=False, default=0)
+    cycles_activated = Column(Integer, nullable=False, default=0)
+    cycles_completed = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
@@ -1,9 +1,13 @@
-from sqlalchemy import Column, Integer, String, Date, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, Date, Boolean, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from ..database import Base
+import datetime
 
 class Member(Base):
     __tablename__ = "members"
+    __table_args__ = (
+        Index("ix_members_active_end", "active", "membership_end_date"),  # nightly expiry
+    )
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(128), nullable=False)
     mobile = Column(String(20), unique=True, nullable=False)
@@ -14,12 +18,13 @@ class Member(Base):
     address = Column(String(256), nullable=False)
     join_date = Column(Date, nullable=False)
     active = Column(Boolean, default=True)
-    gym_id = Column(Integer, ForeignKey("gyms.id"), nullable=False)
+    gym_id = Column(Integer, ForeignKey("gyms.id"), nullable=False, index=True)
     membership_plan_id = Column(Integer, ForeignKey("membership_plans.id"), nullable=False)
 
     # Add these fields:
     membership_start_date = Column(Date, nullable=False)
     membership_end_date = Column(Date, nullable=False)
+    updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)  # row version for ETags
 
     # Relationships
     gym = relationship("Gym", back_populates="members")
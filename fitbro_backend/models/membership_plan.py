@@ -34,3 +34,8 @@ class MembershipPlan(Base):
         secondary=membership_plan_program,
         back_populates="membership_plans"
     )
+
+    @property
+    def program_ids(self):
+        # Read by MembershipPlanRead; eager-load `programs` on list queries
+        return [p.id for p in self.programs]
@@ -0,0 +1,8 @@
+from sqlalchemy import Column, String, DateTime
+from ..database import Base
+
+# Revoked refresh-token ids (jti) and token families; rows are pruned after expires_at
+class RevokedToken(Base):
+    __tablename__ = "revoked_tokens"
+    jti = Column(String(64), primary_key=True)
+    expires_at = Column(DateTime, nullable=False, index=True)
@@ -1,10 +1,14 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Date, Text, DateTime
+from sqlalchemy import Column, Integer, String, ForeignKey, Date, Text, DateTime, Index
 from sqlalchemy.orm import relationship
 from ..database import Base
 import datetime
 
 class Visitor(Base):
     __tablename__ = "visitors"
+    __table_args__ = (
+        Index("ix_visitors_gym_mobile_created", "gym_id", "mobile", "created_at"),
+        Index("ix_visitors_gym_created", "gym_id", "created_at", "id"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     first_name = Column(String(64), nullable=False)
     last_name = Column(String(64), nullable=True)
@@ -1,10 +1,13 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Date, DateTime, Text
+from sqlalchemy import Column, Integer, String, ForeignKey, Date, DateTime, Text, Index
 from sqlalchemy.orm import relationship
 from ..database import Base
 import datetime
 
 class VisitorFollowUp(Base):
     __tablename__ = "visitor_followups"
+    __table_args__ = (
+        Index("ix_visitor_followups_visitor_created", "visitor_id", "created_at"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     visitor_id = Column(Integer, ForeignKey("visitors.id"), nullable=False)
     comment = Column(Text, nullable=True)  # Changed from String to Text for longer comments
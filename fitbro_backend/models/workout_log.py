@@ -1,9 +1,15 @@
-from sqlalchemy import Column, Integer, ForeignKey, String, Date
+from sqlalchemy import Column, Integer, ForeignKey, String, Date, Index, DateTime
 from sqlalchemy.orm import relationship
 from ..database import Base
+import datetime
 
 class WorkoutLog(Base):
     __tablename__ = "workout_logs"
+    __table_args__ = (
+        Index("ix_workout_logs_member_date", "member_id", "workout_date"),
+        Index("ix_workout_logs_entry", "workout_plan_entry_id"),
+        Index("ix_workout_logs_cycle_date", "cycle_plan_id", "workout_date"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     member_id = Column(Integer, ForeignKey("members.id"))
     cycle_plan_id = Column(Integer, ForeignKey("cycle_plans.id"))
@@ -16,6 +22,8 @@ class WorkoutLog(Base):
     actual_notes = Column(String, nullable=True)
     status = Column(String(32), nullable=True)
     workout_date = Column(Date)
+    client_key = Column(String(64), unique=True, index=True, nullable=True)  # idempotency key from offline mobile sync
+    updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)  # row version for ETags
 
     member = relationship("Member")
     cycle_plan = relationship("CyclePlan")
@@ -1,9 +1,13 @@
-from sqlalchemy import Column, Integer, ForeignKey, Date, Float, String
+from sqlalchemy import Column, Integer, ForeignKey, Date, Float, String, Index, DateTime
 from ..database import Base
+import datetime
 from sqlalchemy.orm import relationship
 
 class WorkoutPlanEntry(Base):
     __tablename__ = "workout_plan_entries"
+    __table_args__ = (
+        Index("ix_workout_plan_entries_cycle_day", "cycle_plan_id", "day_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     cycle_plan_id = Column(Integer, ForeignKey("cycle_plans.id"), nullable=False)
@@ -17,7 +21,10 @@ class WorkoutPlanEntry(Base):
     planned_minutes = Column(Integer, nullable=True)
     planned_rpe = Column(Integer, nullable=True)
     planned_notes = Column(String, nullable=True)
+    updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)  # row version for ETags
 
     cycle_plan = relationship("CyclePlan")
     workout = relationship("Workout")
     exercise = relationship("Exercise")
+    # Read-only: logs keep their own FK lifecycle, this is only for eager loading
+    logs = relationship("WorkoutLog", viewonly=True, order_by="WorkoutLog.id")
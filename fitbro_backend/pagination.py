@@ -0,0 +1,99 @@
+# fitbro_backend/pagination.py
+# Shared keyset (cursor) pagination for the list endpoints.
+# Pages are ordered by a stable key (id, or created_at + id) and the cursor is the
+# key of the last row returned, so fetching page N never scans pages 1..N-1.
+
+import base64
+import json
+from datetime import date, datetime
+from typing import Generic, List, Optional, TypeVar
+
+from fastapi import HTTPException, Query
+from pydantic import BaseModel
+from sqlalchemy import Date, DateTime, tuple_
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+
+class PageParams:
+    def __init__(
+        self,
+        cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    ):
+        self.cursor = cursor
+        self.limit = limit
+
+
+def _encode_cursor(values):
+    raw = json.dumps([v.isoformat() if isinstance(v, (date, datetime)) else v for v in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor, keys):
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError
+        decoded = []
+        for key, value in zip(keys, values):
+            if isinstance(key.type, DateTime):
+                value = datetime.fromisoformat(value)
+            elif isinstance(key.type, Date):
+                value = date.fromisoformat(value)
+            decoded.append(value)
+        return decoded
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _keyset(query, params: PageParams, keys, descending):
+    # Works for both ORM Query and select(); keys must be unique together (end with the primary key)
+    if params.cursor:
+        values = _decode_cursor(params.cursor, keys)
+        if len(keys) == 1:
+            lhs, rhs = keys[0], values[0]
+        else:
+            lhs, rhs = tuple_(*keys), tuple_(*values)
+        query = query.filter(lhs < rhs if descending else lhs > rhs)
+    order = [k.desc() for k in keys] if descending else [k.asc() for k in keys]
+    return query.order_by(*order).limit(params.limit + 1)
+
+
+def _page(rows, params: PageParams, keys):
+    next_cursor = None
+    if len(rows) > params.limit:
+        rows = rows[:params.limit]
+        last = rows[-1]
+        next_cursor = _encode_cursor([getattr(last, k.key) for k in keys])
+    return {"items": rows, "next_cursor": next_cursor}
+
+
+def paginate(query, params: PageParams, *keys, descending=False):
+    rows = _keyset(query, params, keys, descending).all()
+    return _page(rows, params, keys)
+
+
+async def paginate_async(db, stmt, params: PageParams, *keys, descending=False):
+    # stmt is a select() of a single entity, run on an AsyncSession
+    result = await db.execute(_keyset(stmt, params, keys, descending))
+    return _page(list(result.scalars()), params, keys)
+
+
+def paginate_rows(db, stmt, params: PageParams, *keys, descending=False):
+    # stmt is a select() of columns; items are Core rows, not ORM objects (see fast_json.py)
+    rows = db.execute(_keyset(stmt, params, keys, descending)).all()
+    return _page(rows, params, keys)
+
+
+async def paginate_rows_async(db, stmt, params: PageParams, *keys, descending=False):
+    result = await db.execute(_keyset(stmt, params, keys, descending))
+    return _page(result.all(), params, keys)
@@ -0,0 +1,66 @@
+# fitbro_backend/passwords.py
+# Password hashing with scrypt (stdlib hashlib, no extra dependency).
+# Stored format: scrypt$<n>$<r>$<p>$<salt b64>$<hash b64>
+# Rows that still hold a plaintext password are accepted once and re-hashed.
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from .config import PASSWORD_SCRYPT_N, PASSWORD_SCRYPT_R, PASSWORD_SCRYPT_P, PASSWORD_HASH_WORKERS
+
+PREFIX = "scrypt"
+SALT_BYTES = 16
+KEY_BYTES = 32
+
+# hashlib.scrypt releases the GIL, so these threads hash in parallel
+_executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="pwhash")
+
+
+def _b64(raw: bytes) -> str:
+    return base64.b64encode(raw).decode().rstrip("=")
+
+
+def _unb64(text: str) -> bytes:
+    return base64.b64decode(text + "=" * (-len(text) % 4))
+
+
+def _scrypt(password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+    return hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p, maxmem=2 * 128 * r * n + 1024 * 1024, dklen=KEY_BYTES)
+
+
+def hash_password(password: str, n=PASSWORD_SCRYPT_N, r=PASSWORD_SCRYPT_R, p=PASSWORD_SCRYPT_P) -> str:
+    salt = os.urandom(SALT_BYTES)
+    return f"{PREFIX}${n}${r}${p}${_b64(salt)}${_b64(_scrypt(password, salt, n, r, p))}"
+
+
+def is_hashed(stored: str) -> bool:
+    return bool(stored) and stored.startswith(PREFIX + "$")
+
+
+def verify_password(password: str, stored: str):
+    # Returns (ok, needs_rehash)
+    if not stored:
+        return False, False
+    if not is_hashed(stored):
+        # Legacy plaintext row
+        return hmac.compare_digest(password.encode(), stored.encode()), True
+    try:
+        _, n, r, p, salt, expected = stored.split("$")
+        n, r, p = int(n), int(r), int(p)
+        ok = hmac.compare_digest(_scrypt(password, _unb64(salt), n, r, p), _unb64(expected))
+    except ValueError:
+        return False, False
+    needs_rehash = (n, r, p) != (PASSWORD_SCRYPT_N, PASSWORD_SCRYPT_R, PASSWORD_SCRYPT_P)
+    return ok, needs_rehash
+
+
+async def hash_password_async(password: str) -> str:
+    return await asyncio.get_running_loop().run_in_executor(_executor, hash_password, password)
+
+
+async def verify_password_async(password: str, stored: str):
+    return await asyncio.get_running_loop().run_in_executor(_executor, verify_password, password, stored)
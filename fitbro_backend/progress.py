@@ -0,0 +1,215 @@
+# fitbro_backend/progress.py
+# Per-member exercise progress rollups (exercise_progress): one row per member,
+# exercise and day / week / month with volume, best set, estimated 1RM and a PR flag.
+#
+# Writes to workout_logs call refresh_for_logs() in the same transaction. Only the
+# buckets containing the touched dates are recomputed, from that member's logs of that
+# exercise in those periods, so a write costs a few statements however long the
+# history is. Recomputing rather than adding deltas keeps updates and deletes exact
+# (a max can't be "subtracted"); buckets are upserted on their unique key, so two
+# writers refreshing the same bucket don't collide. PR flags are then re-derived from
+# the earliest touched bucket onwards, since a backdated log can beat or lose to later
+# periods.
+#
+#   python -m fitbro_backend.progress --rebuild     # recompute every rollup
+
+import argparse
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+
+from sqlalchemy import and_, bindparam, func, or_, select, tuple_
+
+from .models import ExerciseProgress, Member, WorkoutLog, WorkoutPlanEntry
+from .upsert import upsert
+
+PERIODS = ("day", "week", "month")
+REBUILD_MEMBERS_PER_BLOCK = 500
+BUCKET_KEY = ("member_id", "exercise_id", "period", "period_start")  # uq_exercise_progress_bucket
+
+_table = ExerciseProgress.__table__
+
+
+def period_start(period, day: date):
+    if period == "week":
+        return day - timedelta(days=day.weekday())
+    if period == "month":
+        return day.replace(day=1)
+    return day
+
+
+def period_end(period, start: date):
+    # Exclusive
+    if period == "week":
+        return start + timedelta(days=7)
+    if period == "month":
+        return (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return start + timedelta(days=1)
+
+
+def estimated_1rm(weight, reps):
+    # Epley; a single is its own 1RM
+    if not weight or not reps or weight <= 0 or reps <= 0:
+        return None
+    return float(weight) if reps == 1 else weight * (1 + reps / 30)
+
+
+def _log_rows():
+    # (member_id, exercise_id, workout_date, sets, reps, weight, minutes, status)
+    return select(
+        WorkoutLog.member_id, WorkoutPlanEntry.exercise_id, WorkoutLog.workout_date,
+        WorkoutLog.actual_sets, WorkoutLog.actual_reps, WorkoutLog.actual_weight,
+        WorkoutLog.actual_minutes, WorkoutLog.status,
+    ).join(WorkoutPlanEntry, WorkoutLog.workout_plan_entry_id == WorkoutPlanEntry.id)
+
+
+def _aggregate(rows, wanted=None):
+    # -> {(member_id, exercise_id, period, period_start): bucket dict}; wanted limits (period, start)s
+    buckets = {}
+    for member_id, exercise_id, day, sets, reps, weight, minutes, status in rows:
+        if day is None or (status or "").lower() == "skipped":
+            continue
+        sets, reps, weight, minutes = sets or 0, reps or 0, weight or 0, minutes or 0
+        e1rm = estimated_1rm(weight, reps)
+        for period in PERIODS:
+            start = period_start(period, day)
+            if wanted is not None and (period, start) not in wanted:
+                continue
+            key = (member_id, exercise_id, period, start)
+            b = buckets.get(key)
+            if b is None:
+                b = buckets[key] = {
+                    "member_id": member_id, "exercise_id": exercise_id, "period": period, "period_start": start,
+                    "log_count": 0, "total_sets": 0, "total_reps": 0, "volume": 0.0, "total_minutes": 0,
+                    "best_weight": None, "best_reps": None, "best_e1rm": None, "is_pr": False,
+                }
+            b["log_count"] += 1
+            b["total_sets"] += sets
+            b["total_reps"] += sets * reps
+            b["volume"] += sets * reps * weight
+            b["total_minutes"] += minutes
+            if e1rm is not None and (b["best_e1rm"] is None or e1rm > b["best_e1rm"]):
+                b["best_weight"], b["best_reps"], b["best_e1rm"] = float(weight), reps, e1rm
+    return buckets
+
+
+def _mark_prs(buckets, prior=None):
+    # buckets of one member/exercise/period in period_start order; prior = best before the first
+    best = prior
+    for b in buckets:
+        e1rm = b["best_e1rm"]
+        b["is_pr"] = e1rm is not None and best is not None and e1rm > best
+        if e1rm is not None and (best is None or e1rm > best):
+            best = e1rm
+
+
+def _refresh_prs(conn, member_id, exercise_id, since):
+    # since: {period: first touched period_start}; the first period ever logged is the baseline, not a PR
+    mine = and_(ExerciseProgress.member_id == member_id, ExerciseProgress.exercise_id == exercise_id)
+    prior = dict(conn.execute(
+        select(ExerciseProgress.period, func.max(ExerciseProgress.best_e1rm))
+        .where(mine, or_(*(and_(ExerciseProgress.period == p, ExerciseProgress.period_start < s)
+                           for p, s in since.items())))
+        .group_by(ExerciseProgress.period)
+    ).all())
+    rows = conn.execute(
+        select(ExerciseProgress.id, ExerciseProgress.period, ExerciseProgress.best_e1rm, ExerciseProgress.is_pr)
+        .where(mine, or_(*(and_(ExerciseProgress.period == p, ExerciseProgress.period_start >= s)
+                           for p, s in since.items())))
+        .order_by(ExerciseProgress.period, ExerciseProgress.period_start)
+    ).all()
+    series = defaultdict(list)
+    for row in rows:
+        series[row.period].append({"id": row.id, "best_e1rm": row.best_e1rm, "was_pr": row.is_pr})
+    changes = []
+    for period, buckets in series.items():
+        _mark_prs(buckets, prior.get(period))
+        changes.extend({"b_id": b["id"], "b_pr": b["is_pr"]} for b in buckets if b["is_pr"] != b["was_pr"])
+    if changes:
+        conn.execute(_table.update().where(_table.c.id == bindparam("b_id")).values(is_pr=bindparam("b_pr")), changes)
+
+
+def refresh_progress(conn, touched):
+    """Recompute the rollups containing each (member_id, exercise_id, workout_date) in `touched`.
+
+    conn is a Session or Connection; the caller commits.
+    """
+    days_by_series = defaultdict(set)
+    for member_id, exercise_id, day in touched:
+        if member_id is not None and exercise_id is not None and day is not None:
+            days_by_series[(member_id, exercise_id)].add(day)
+
+    for (member_id, exercise_id), days in days_by_series.items():
+        wanted = {(p, period_start(p, d)) for d in days for p in PERIODS}
+        lo = min(start for _, start in wanted)
+        hi = max(period_end(p, start) for p, start in wanted)
+        rows = conn.execute(_log_rows().where(
+            WorkoutLog.member_id == member_id, WorkoutPlanEntry.exercise_id == exercise_id,
+            WorkoutLog.workout_date >= lo, WorkoutLog.workout_date < hi,
+        )).all()
+        buckets = _aggregate(rows, wanted)
+
+        # Upsert rather than DELETE + INSERT so concurrent writers can't collide on the bucket key
+        upsert(conn, _table, list(buckets.values()), BUCKET_KEY)
+        emptied = wanted - {(b["period"], b["period_start"]) for b in buckets.values()}
+        if emptied:
+            conn.execute(_table.delete().where(
+                _table.c.member_id == member_id, _table.c.exercise_id == exercise_id,
+                tuple_(_table.c.period, _table.c.period_start).in_(list(emptied)),
+            ))
+        since = {}
+        for period, start in wanted:
+            since[period] = min(start, since.get(period, start))
+        _refresh_prs(conn, member_id, exercise_id, since)
+
+
+def refresh_for_logs(conn, logs):
+    """refresh_progress for (member_id, workout_plan_entry_id, workout_date) triples."""
+    logs = [l for l in logs if l[1] is not None]
+    if not logs:
+        return
+    entry_ids = {entry_id for _, entry_id, _ in logs}
+    exercise_of = dict(conn.execute(
+        select(WorkoutPlanEntry.id, WorkoutPlanEntry.exercise_id).where(WorkoutPlanEntry.id.in_(entry_ids))
+    ).all())
+    refresh_progress(conn, [(member_id, exercise_of.get(entry_id), day) for member_id, entry_id, day in logs])
+
+
+def rebuild_progress(conn):
+    """Recompute every rollup from workout_logs, a block of members at a time; returns rows written."""
+    conn.execute(_table.delete())
+    member_ids = [m for (m,) in conn.execute(select(Member.id).order_by(Member.id))]
+    written = 0
+    for i in range(0, len(member_ids), REBUILD_MEMBERS_PER_BLOCK):
+        block = member_ids[i:i + REBUILD_MEMBERS_PER_BLOCK]
+        rows = conn.execute(_log_rows().where(WorkoutLog.member_id.between(block[0], block[-1]))).all()
+        series = defaultdict(list)
+        for key, bucket in _aggregate(rows).items():
+            series[key[:3]].append(bucket)
+        buckets = []
+        for key in series:
+            ordered = sorted(series[key], key=lambda b: b["period_start"])
+            _mark_prs(ordered)
+            buckets.extend(ordered)
+        if buckets:
+            conn.execute(_table.insert(), buckets)
+            written += len(buckets)
+    return written
+
+
+def main():
+    from .database import engine
+
+    parser = argparse.ArgumentParser(description="Exercise progress rollups")
+    parser.add_argument("--rebuild", action="store_true", help="recompute every rollup from workout_logs")
+    args = parser.parse_args()
+    if not args.rebuild:
+        parser.error("nothing to do (use --rebuild)")
+    start = time.perf_counter()
+    with engine.begin() as conn:
+        written = rebuild_progress(conn)
+    print(f"rebuilt {written} rollup rows in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
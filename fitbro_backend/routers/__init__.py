@@ -16,6 +16,8 @@ from .announcement import router as announcement_router
 from .auth import router as auth_router
 from .visitor_followup import router as visitor_followup_router
 from .visitor import router as visitor_router
+from .metrics import router as metrics_router
+from .jobs import router as jobs_router
 
 
 all_routers = [
@@ -37,4 +39,6 @@ all_routers = [
     auth_router,
     visitor_router,
     visitor_followup_router,
+    metrics_router,
+    jobs_router,
 ]
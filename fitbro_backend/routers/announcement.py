@@ -5,12 +5,14 @@ from ..schemas import AnnouncementCreate, AnnouncementRead
 from ..models import Announcement
 from ..database import get_db
 from ..dependencies import get_current_user
+from ..pagination import Page, PageParams, paginate
 
 router = APIRouter(prefix="/announcements", tags=["Announcements"])
 
-@router.get("/", response_model=List[AnnouncementRead])
-def list_announcements(db: Session = Depends(get_db)):
-    return db.query(Announcement).order_by(Announcement.posted_at.desc()).all()
+# Announcements are platform-wide (the table has no gym_id), so only paginated
+@router.get("/", response_model=Page[AnnouncementRead])
+def list_announcements(page: PageParams = Depends(), db: Session = Depends(get_db)):
+    return paginate(db.query(Announcement), page, Announcement.created_at, Announcement.id, descending=True)
 
 @router.post("/", response_model=AnnouncementRead)
 def create_announcement(payload: AnnouncementCreate, db: Session = Depends(get_db), user=Depends(get_current_user)):
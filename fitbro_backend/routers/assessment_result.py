@@ -1,17 +1,24 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from typing import List
 from ..schemas.assessment_result import (
     AssessmentResultRead, AssessmentResultCreate, AssessmentResultUpdate
 )
 from ..models.assessment_result import AssessmentResult
+from ..models.member import Member
 from ..database import get_db
+from ..pagination import Page, PageParams, paginate
 
 router = APIRouter(prefix="/assessment-results", tags=["AssessmentResults"])
 
-@router.get("/", response_model=List[AssessmentResultRead])
-def list_results(db: Session = Depends(get_db)):
-    return db.query(AssessmentResult).all()
+@router.get("/", response_model=Page[AssessmentResultRead])
+def list_results(
+    gym_id: int = Query(...),
+    page: PageParams = Depends(),
+    db: Session = Depends(get_db)
+):
+    q = db.query(AssessmentResult).join(Member, AssessmentResult.member_id == Member.id).filter(Member.gym_id == gym_id)
+    return paginate(q, page, AssessmentResult.id)
 
 @router.post("/", response_model=AssessmentResultRead)
 def create_result(payload: AssessmentResultCreate, db: Session = Depends(get_db)):
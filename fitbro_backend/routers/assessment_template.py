@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 from typing import List
 from ..schemas.assessment_template import (
@@ -6,12 +7,18 @@ from ..schemas.assessment_template import (
 )
 from ..models.assessment_template import AssessmentTemplate
 from ..database import get_db
+from ..pagination import Page, PageParams, paginate
 
 router = APIRouter(prefix="/assessment-templates", tags=["AssessmentTemplates"])
 
-@router.get("/", response_model=List[AssessmentTemplateRead])
-def list_templates(db: Session = Depends(get_db)):
-    return db.query(AssessmentTemplate).all()
+@router.get("/", response_model=Page[AssessmentTemplateRead])
+def list_templates(
+    gym_id: int = Query(...),
+    page: PageParams = Depends(),
+    db: Session = Depends(get_db)
+):
+    q = db.query(AssessmentTemplate).filter(or_(AssessmentTemplate.gym_id == gym_id, AssessmentTemplate.gym_id.is_(None)))
+    return paginate(q, page, AssessmentTemplate.id)
 
 @router.post("/", response_model=AssessmentTemplateRead)
 def create_template(payload: AssessmentTemplateCreate, db: Session = Depends(get_db)):
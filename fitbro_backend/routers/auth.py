@@ -2,33 +2,68 @@
 
 from fastapi import APIRouter, HTTPException, Depends
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from jose import jwt
-from datetime import datetime, timedelta
+from typing import Optional
 
 from ..models import User
-from ..database import get_db
-from ..config import SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_HOURS
+from ..database import get_db, get_async_db
+from ..config import ACCESS_TOKEN_EXPIRE_MINUTES
+from ..passwords import verify_password_async, hash_password_async
+from ..schemas.auth import TokenRefresh
+from ..jwt_handler import (
+    create_access_token, create_refresh_token, decode_refresh_token, invalidate_token, optional_oauth2_scheme,
+    revocations,
+)
 
 router = APIRouter()
 
-@router.post("/auth/login")
-def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.mobile == form_data.username).first()
-    if not user or user.password != form_data.password:
-        raise HTTPException(status_code=401, detail="Invalid mobile or password")
-    token_data = {
-        "sub": user.mobile,
-        "role": user.role.value,   # <<--- FIXED
-        "name": user.name,
-        "exp": int((datetime.utcnow() + timedelta(hours=ACCESS_TOKEN_EXPIRE_HOURS)).timestamp())
-    }
-    print("-------------------------USING SECRET KEY:", SECRET_KEY)
-    print("-------------------------USING ALGORITHM:", ALGORITHM)
-    token = jwt.encode(token_data, SECRET_KEY, algorithm=ALGORITHM)
+def _token_response(mobile, role, name, family=None):
     return {
-        "access_token": token,
+        "access_token": create_access_token(mobile, role, name),
+        "refresh_token": create_refresh_token(mobile, role, name, family),
         "token_type": "bearer",
-        "role": user.role.value,    # <<--- FIXED
-        "name": user.name
+        "expires_in": ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+        "role": role,
+        "name": name
     }
+
+@router.post("/auth/login")
+async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_async_db)):
+    user = (await db.execute(select(User).where(User.mobile == form_data.username))).scalars().first()
+    if not user:
+        raise HTTPException(status_code=401, detail="Invalid mobile or password")
+    # Hashing runs on its own bounded pool, off the event loop and the request threadpool
+    ok, needs_rehash = await verify_password_async(form_data.password, user.password)
+    if not ok:
+        raise HTTPException(status_code=401, detail="Invalid mobile or password")
+    if needs_rehash:
+        # Legacy plaintext (or old-cost) row: upgrade it transparently
+        user.password = await hash_password_async(form_data.password)
+        await db.commit()
+    # gym_id lets the web client scope its list calls (they all take ?gym_id=)
+    return {**_token_response(user.mobile, user.role.value, user.name), "gym_id": user.gym_id}
+
+# Rotate a refresh token: no password check and no users lookup, the claims travel in the token.
+# Each refresh token works once; presenting a used one revokes its whole family (likely stolen).
+@router.post("/auth/refresh")
+def refresh(payload: TokenRefresh, db: Session = Depends(get_db)):
+    claims = decode_refresh_token(payload.refresh_token)
+    jti, family, exp = claims["jti"], claims["fam"], claims["exp"]
+    if revocations.is_revoked(db, family):
+        raise HTTPException(status_code=401, detail="Refresh token revoked")
+    if revocations.is_revoked(db, jti) or not revocations.revoke(db, jti, exp):
+        revocations.revoke_family(db, family)
+        raise HTTPException(status_code=401, detail="Refresh token already used")
+    return _token_response(claims["sub"], claims["role"], claims.get("name"), family)
+
+# Log out: revoke the refresh token's family so no rotation of it can be used again,
+# and drop the caller's access token from the principal cache
+@router.post("/auth/logout")
+def logout(payload: TokenRefresh, db: Session = Depends(get_db), access_token: Optional[str] = Depends(optional_oauth2_scheme)):
+    claims = decode_refresh_token(payload.refresh_token)
+    revocations.revoke_family(db, claims["fam"])
+    if access_token:
+        invalidate_token(access_token)
+    return {"detail": "Logged out"}
@@ -1,18 +1,43 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
-from typing import List
-from ..schemas.cycle_plan import CyclePlanCreate, CyclePlanUpdate, CyclePlanRead
+from typing import List, Optional
+from collections import defaultdict
+from datetime import date, timedelta
+from sqlalchemy import exists, select
+from ..schemas.cycle_plan import CyclePlanCreate, CyclePlanUpdate, CyclePlanRead, CyclePlanGenerate
+from ..schemas.adherence import MemberAdherence
 from ..models.cycle_plan import CyclePlan
+from ..models.member import Member
+from ..models.workout_plan_entry import WorkoutPlanEntry
+from ..models.workout_log import WorkoutLog
+from ..models.daily_adherence import DailyAdherence
 from ..database import get_db
+from ..pagination import Page, PageParams, paginate_rows
+from ..fast_json import page_response, read_columns
+from ..conditional import conditional, rows_etag
+from ..adherence import refresh_cycle, summarize
+from ..clock import utc_today
+from ..dashboard import gyms_of_members, invalidate_dashboard
 
 router = APIRouter(prefix="/cycle-plans", tags=["Cycle Plans"])
 
-@router.get("/", response_model=List[CyclePlanRead])
-def list_cycle_plans(member_id: int = None, db: Session = Depends(get_db)):
-    q = db.query(CyclePlan).filter(CyclePlan.is_deleted == False)
+@router.get("/", response_model=Page[CyclePlanRead])
+def list_cycle_plans(
+    request: Request,
+    response: Response,
+    gym_id: int = Query(...),
+    member_id: int = None,
+    page: PageParams = Depends(),
+    db: Session = Depends(get_db)
+):
+    stmt = select(*read_columns(CyclePlan, CyclePlanRead, CyclePlan.updated_at)).join(
+        Member, CyclePlan.member_id == Member.id
+    ).where(Member.gym_id == gym_id, CyclePlan.is_deleted == False)
     if member_id:
-        q = q.filter(CyclePlan.member_id == member_id)
-    return q.all()
+        stmt = stmt.where(CyclePlan.member_id == member_id)
+    result = paginate_rows(db, stmt, page, CyclePlan.id)
+    etag = rows_etag(result["items"], result["next_cursor"])
+    return conditional(request, response, etag) or page_response(result, CyclePlanRead, response)
 
 @router.post("/", response_model=CyclePlanRead)
 def create_cycle_plan(payload: CyclePlanCreate, db: Session = Depends(get_db)):
@@ -27,8 +52,10 @@ def create_cycle_plan(payload: CyclePlanCreate, db: Session = Depends(get_db)):
             raise HTTPException(400, "Member already has an active cycle")
     obj = CyclePlan(**payload.dict())
     db.add(obj)
+    gyms = gyms_of_members(db, [obj.member_id])
     db.commit()
     db.refresh(obj)
+    invalidate_dashboard(*gyms)
     return obj
 
 @router.put("/{cycle_id}", response_model=CyclePlanRead)
@@ -46,10 +73,15 @@ def update_cycle_plan(cycle_id: int, payload: CyclePlanUpdate, db: Session = Dep
         ).first()
         if exists:
             raise HTTPException(400, "Member already has an active cycle")
+    old_member_id = obj.member_id
     for k, v in payload.dict().items():
         setattr(obj, k, v)
+    db.flush()
+    refresh_cycle(db, cycle_id)
+    gyms = gyms_of_members(db, [old_member_id, obj.member_id])
     db.commit()
     db.refresh(obj)
+    invalidate_dashboard(*gyms)
     return obj
 
 @router.put("/{cycle_id}/delete", response_model=CyclePlanRead)
@@ -58,6 +90,68 @@ def soft_delete_cycle_plan(cycle_id: int, db: Session = Depends(get_db)):
     if not obj:
         raise HTTPException(404, "Not found")
     obj.is_deleted = True
+    db.flush()
+    refresh_cycle(db, cycle_id)  # deleted cycles have no adherence rows
+    gyms = gyms_of_members(db, [obj.member_id])
     db.commit()
     db.refresh(obj)
+    invalidate_dashboard(*gyms)
     return obj
+
+# Expand a weekly template into every day of the cycle with one bulk INSERT
+@router.post("/{cycle_id}/generate")
+def generate_cycle_entries(cycle_id: int, payload: CyclePlanGenerate, db: Session = Depends(get_db)):
+    cycle = db.query(CyclePlan).filter(CyclePlan.id == cycle_id, CyclePlan.is_deleted == False).first()
+    if not cycle:
+        raise HTTPException(404, "Not found")
+    if cycle.end_date < cycle.start_date:
+        raise HTTPException(400, "Cycle end_date is before start_date")
+
+    by_weekday = defaultdict(list)
+    for item in payload.items:
+        by_weekday[item.weekday].append(item.dict(exclude={"weekday"}))
+
+    deleted, kept = 0, []
+    if payload.replace_existing:
+        # Entries that already have logged actuals are kept, and not generated a second time
+        has_log = exists().where(WorkoutLog.workout_plan_entry_id == WorkoutPlanEntry.id)
+        deleted = db.query(WorkoutPlanEntry).filter(
+            WorkoutPlanEntry.cycle_plan_id == cycle_id, ~has_log
+        ).delete(synchronize_session=False)
+        kept = db.query(
+            WorkoutPlanEntry.day_date, WorkoutPlanEntry.workout_id, WorkoutPlanEntry.exercise_id
+        ).filter(WorkoutPlanEntry.cycle_plan_id == cycle_id).all()
+    elif db.query(WorkoutPlanEntry.id).filter(WorkoutPlanEntry.cycle_plan_id == cycle_id).first():
+        raise HTTPException(400, "Cycle already has plan entries; set replace_existing to regenerate")
+
+    kept_keys = {tuple(k) for k in kept}
+    rows, skipped = [], 0
+    day = cycle.start_date
+    while day <= cycle.end_date:
+        for item in by_weekday.get(day.weekday(), []):
+            if (day, item["workout_id"], item["exercise_id"]) in kept_keys:
+                skipped += 1
+                continue
+            rows.append({**item, "cycle_plan_id": cycle_id, "day_date": day})
+        day += timedelta(days=1)
+
+    if rows:
+        db.execute(WorkoutPlanEntry.__table__.insert(), rows)
+    refresh_cycle(db, cycle_id)
+    gyms = gyms_of_members(db, [cycle.member_id])
+    db.commit()
+    invalidate_dashboard(*gyms)
+    # kept: logged entries left in place; skipped: template days not generated because a kept entry covers them
+    return {"cycle_plan_id": cycle_id, "created": len(rows), "deleted": deleted, "kept": len(kept), "skipped": skipped}
+
+@router.get("/{cycle_id}/adherence", response_model=MemberAdherence)
+def get_cycle_adherence(cycle_id: int, as_of: Optional[date] = None, db: Session = Depends(get_db)):
+    cycle = db.query(CyclePlan).filter(CyclePlan.id == cycle_id, CyclePlan.is_deleted == False).first()
+    if not cycle:
+        raise HTTPException(404, "Not found")
+    as_of = as_of or utc_today()
+    days = db.query(DailyAdherence).filter(
+        DailyAdherence.cycle_plan_id == cycle_id, DailyAdherence.day_date <= as_of
+    ).order_by(DailyAdherence.day_date).all()
+    return {"member_id": cycle.member_id, "cycle_plan_id": cycle_id, "as_of": as_of, "days": days,
+            **summarize(days, as_of)}
@@ -1,16 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 from typing import List
 from ..schemas import EquipmentRead, EquipmentCreate
 from ..models import Equipment
 from ..database import get_db
+from ..pagination import Page, PageParams, paginate
 from ..dependencies import get_current_user
+from ..catalog_cache import cached_page, invalidate_catalog
 
 router = APIRouter(prefix="/equipment", tags=["Equipment"])
 
-@router.get("/", response_model=List[EquipmentRead])
-def list_equipment(db: Session = Depends(get_db)):
-    return db.query(Equipment).all()
+@router.get("/", response_model=Page[EquipmentRead])
+def list_equipment(
+    request: Request,
+    gym_id: int = Query(...),
+    page: PageParams = Depends(),
+    db: Session = Depends(get_db)
+):
+    def load():
+        q = db.query(Equipment).filter(or_(Equipment.gym_id == gym_id, Equipment.gym_id.is_(None)))
+        return paginate(q, page, Equipment.id)
+    return cached_page(request, "equipment", EquipmentRead, gym_id, page, load)
 
 @router.post("/", response_model=EquipmentRead)
 def create_equipment(payload: EquipmentCreate, db: Session = Depends(get_db)):
@@ -18,4 +29,5 @@ def create_equipment(payload: EquipmentCreate, db: Session = Depends(get_db)):
     db.add(obj)
     db.commit()
     db.refresh(obj)
+    invalidate_catalog(obj.gym_id)
     return obj
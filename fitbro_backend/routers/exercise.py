@@ -1,16 +1,28 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 from typing import List
 from ..schemas import ExerciseRead, ExerciseCreate, ExerciseUpdate
 from ..models import Exercise
 from ..database import get_db
+from ..pagination import Page, PageParams, paginate
 from ..dependencies import get_current_user, require_roles
+from ..catalog_cache import cached_page, invalidate_catalog
 
 router = APIRouter(prefix="/exercises", tags=["Exercises"])
 
-@router.get("/", response_model=List[ExerciseRead])
-def list_exercises(db: Session = Depends(get_db)):
-    return db.query(Exercise).all()
+@router.get("/", response_model=Page[ExerciseRead])
+def list_exercises(
+    request: Request,
+    gym_id: int = Query(...),
+    page: PageParams = Depends(),
+    db: Session = Depends(get_db)
+):
+    # Gym's own exercises plus the FitBro master catalog (gym_id NULL)
+    def load():
+        q = db.query(Exercise).filter(or_(Exercise.gym_id == gym_id, Exercise.gym_id.is_(None)))
+        return paginate(q, page, Exercise.id)
+    return cached_page(request, "exercises", ExerciseRead, gym_id, page, load)
 
 @router.post("/", response_model=ExerciseRead, dependencies=[Depends(require_roles("FitBro Admin", "Gym Owner", "Gym Instructor"))])
 def create_exercise(payload: ExerciseCreate, db: Session = Depends(get_db)):
@@ -18,6 +30,7 @@ def create_exercise(payload: ExerciseCreate, db: Session = Depends(get_db)):
     db.add(ex)
     db.commit()
     db.refresh(ex)
+    invalidate_catalog(ex.gym_id)
     return ex
 
 @router.put("/{exercise_id}", response_model=ExerciseRead, dependencies=[Depends(require_roles("FitBro Admin", "Gym Owner", "Gym Instructor"))])
@@ -25,10 +38,12 @@ def update_exercise(exercise_id: int, payload: ExerciseCreate, db: Session = Dep
     ex = db.query(Exercise).get(exercise_id)
     if not ex:
         raise HTTPException(status_code=404, detail="Exercise not found")
+    old_gym_id = ex.gym_id
     for k, v in payload.dict(exclude_unset=True).items():
         setattr(ex, k, v)
     db.commit()
     db.refresh(ex)
+    invalidate_catalog(old_gym_id, ex.gym_id)
     return ex
 
 @router.patch("/{exercise_id}", response_model=ExerciseRead, dependencies=[Depends(require_roles("FitBro Admin", "Gym Owner", "Gym Instructor"))])
@@ -36,10 +51,12 @@ def patch_exercise(exercise_id: int, payload: ExerciseUpdate, db: Session = Depe
     ex = db.query(Exercise).get(exercise_id)
     if not ex:
         raise HTTPException(status_code=404, detail="Exercise not found")
+    old_gym_id = ex.gym_id
     for k, v in payload.dict(exclude_unset=True).items():
         setattr(ex, k, v)
     db.commit()
     db.refresh(ex)
+    invalidate_catalog(old_gym_id, ex.gym_id)
     return ex
 
 @router.delete("/{exercise_id}", status_code=204, dependencies=[Depends(require_roles("FitBro Admin", "Gym Owner", "Gym Instructor"))])
@@ -47,5 +64,7 @@ def delete_exercise(exercise_id: int, db: Session = Depends(get_db)):
     ex = db.query(Exercise).get(exercise_id)
     if not ex:
         raise HTTPException(status_code=404, detail="Exercise not found")
+    gym_id = ex.gym_id
     db.delete(ex)
     db.commit()
+    invalidate_catalog(gym_id)
@@ -1,12 +1,23 @@
 # routers/gym.py
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, Request, UploadFile, File
+from sqlalchemy import and_, func, or_
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from datetime import date
 from ..schemas.gym import GymRead, GymCreate, GymUpdate, GymAssignOwner
+from ..schemas.adherence import GymAdherence
+from ..schemas.dashboard import GymDashboard
 from ..models.gym import Gym
 from ..models.user import User, RoleEnum
+from ..models.member import Member
+from ..models.daily_adherence import DailyAdherence
 from ..database import get_db
 from ..dependencies import require_roles
+from ..passwords import hash_password
+from ..pagination import Page, PageParams, paginate
+from ..adherence import percent
+from ..clock import utc_today
+from ..dashboard import cached_dashboard
 import shutil
 import os
 
@@ -15,10 +26,10 @@ router = APIRouter(prefix="/gyms", tags=["Gyms"])
 UPLOAD_DIR = "static/logos/"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
-# List all gyms
-@router.get("/", response_model=List[GymRead], dependencies=[Depends(require_roles("FitBro Admin", "FitBro Officer"))])
-def list_gyms(db: Session = Depends(get_db)):
-    return db.query(Gym).all()
+# List all gyms (platform-level, so paginated but not gym-scoped)
+@router.get("/", response_model=Page[GymRead], dependencies=[Depends(require_roles("FitBro Admin", "FitBro Officer"))])
+def list_gyms(page: PageParams = Depends(), db: Session = Depends(get_db)):
+    return paginate(db.query(Gym), page, Gym.id)
 
 # Get gym by ID
 @router.get("/{gym_id}", response_model=GymRead, dependencies=[Depends(require_roles("FitBro Admin", "FitBro Officer", "Gym Owner"))])
@@ -59,7 +70,7 @@ def create_gym(payload: GymCreate, db: Session = Depends(get_db)):
         name=payload.owner_name,
         mobile=payload.owner_mobile,
         email=payload.owner_email,
-        password="123456",  # plain text, matches your login check
+        password=hash_password("123456"),  # default password, owner should change it
         role=RoleEnum.GYM_OWNER,
         gym_id=gym.id,
         is_active=True
@@ -108,3 +119,56 @@ def upload_logo(gym_id: int, file: UploadFile = File(...), db: Session = Depends
     db.commit()
     db.refresh(gym)
     return gym
+
+# Per-member adherence across the gym, least adherent first; two aggregate queries over daily_adherence
+@router.get("/{gym_id}/adherence", response_model=GymAdherence, dependencies=[Depends(require_roles("FitBro Admin", "FitBro Officer", "Gym Owner", "Gym Instructor"))])
+def get_gym_adherence(
+    gym_id: int,
+    date_from: Optional[date] = None,
+    as_of: Optional[date] = None,
+    db: Session = Depends(get_db)
+):
+    as_of = as_of or utc_today()
+    window = [Member.gym_id == gym_id, DailyAdherence.day_date <= as_of]
+    if date_from:
+        window.append(DailyAdherence.day_date >= date_from)
+    totals = db.query(
+        DailyAdherence.member_id, Member.name,
+        func.sum(DailyAdherence.planned), func.sum(DailyAdherence.completed),
+        func.sum(DailyAdherence.skipped), func.max(DailyAdherence.streak),
+    ).join(Member, DailyAdherence.member_id == Member.id).filter(*window).group_by(
+        DailyAdherence.member_id, Member.name
+    ).all()
+
+    # Current streak: each member's latest day up to as_of, skipping an unfinished as_of
+    latest = db.query(
+        DailyAdherence.member_id, func.max(DailyAdherence.day_date).label("day_date")
+    ).join(Member, DailyAdherence.member_id == Member.id).filter(
+        Member.gym_id == gym_id,
+        or_(DailyAdherence.day_date < as_of,
+            and_(DailyAdherence.day_date == as_of, DailyAdherence.completed >= DailyAdherence.planned))
+    ).group_by(DailyAdherence.member_id).subquery()
+    current = dict(db.query(DailyAdherence.member_id, func.max(DailyAdherence.streak)).join(
+        latest, and_(DailyAdherence.member_id == latest.c.member_id, DailyAdherence.day_date == latest.c.day_date)
+    ).group_by(DailyAdherence.member_id).all())
+
+    members = [{
+        "member_id": member_id, "member_name": name, "planned": planned, "completed": completed,
+        "skipped": skipped, "adherence": percent(completed, planned),
+        "current_streak": current.get(member_id, 0), "best_streak": best,
+    } for member_id, name, planned, completed, skipped, best in totals]
+    members.sort(key=lambda m: (m["adherence"], m["member_id"]))
+    planned = sum(m["planned"] for m in members)
+    completed = sum(m["completed"] for m in members)
+    return {
+        "gym_id": gym_id, "as_of": as_of, "members": members,
+        "planned": planned, "completed": completed, "skipped": sum(m["skipped"] for m in members),
+        "adherence": percent(completed, planned),
+        "current_streak": max((m["current_streak"] for m in members), default=0),
+        "best_streak": max((m["best_streak"] for m in members), default=0),
+    }
+
+# Owner dashboard KPIs; a handful of aggregates, cached per gym (dashboard.py)
+@router.get("/{gym_id}/dashboard", response_model=GymDashboard, dependencies=[Depends(require_roles("FitBro Admin", "FitBro Officer", "Gym Owner", "Gym Officer"))])
+def get_gym_dashboard(gym_id: int, request: Request, db: Session = Depends(get_db)):
+    return cached_dashboard(request, db, gym_id)
@@ -0,0 +1,74 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from typing import Optional
+from datetime import datetime, timezone
+from ..schemas.job import JobCreate, JobRead
+from ..models.job import Job
+from ..database import get_db
+from ..dependencies import PLATFORM_ROLES, require_roles
+from ..pagination import Page, PageParams, paginate
+from ..jobs import enqueue
+from .. import tasks  # noqa: F401  (registers the built-in tasks)
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+# Recent jobs first, optionally by status and kind
+@router.get("/", response_model=Page[JobRead], dependencies=[Depends(require_roles(*PLATFORM_ROLES))])
+def list_jobs(
+    status: Optional[str] = None,
+    kind: Optional[str] = None,
+    page: PageParams = Depends(),
+    db: Session = Depends(get_db)
+):
+    query = db.query(Job)
+    if status:
+        query = query.filter(Job.status == status)
+    if kind:
+        query = query.filter(Job.kind == kind)
+    return paginate(query, page, Job.id, descending=True)
+
+# Poll a job handed back by an endpoint that enqueued it; payloads and results are
+# platform data, so the same roles as the listing
+@router.get("/{job_id}", response_model=JobRead, dependencies=[Depends(require_roles(*PLATFORM_ROLES))])
+def get_job(job_id: int, db: Session = Depends(get_db)):
+    job = db.query(Job).get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+# Enqueue a registered task (e.g. rebuild_progress); returns at once with the queued job
+@router.post("/", response_model=JobRead, status_code=202, dependencies=[Depends(require_roles("FitBro Admin"))])
+def create_job(payload: JobCreate, db: Session = Depends(get_db)):
+    run_at = payload.run_at
+    if run_at is not None and run_at.tzinfo is not None:
+        run_at = run_at.astimezone(timezone.utc).replace(tzinfo=None)
+    try:
+        job = enqueue(db, payload.kind, payload.payload, run_at=run_at)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    db.commit()
+    db.refresh(job)
+    return job
+
+# Conditional UPDATEs so a worker claiming the job at the same moment can't be overridden
+def _transition(db: Session, job_id: int, from_status, values):
+    changed = db.query(Job).filter(Job.id == job_id, Job.status.in_(from_status)).update(
+        values, synchronize_session=False)
+    if not changed:
+        job = db.query(Job).get(job_id)
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+        raise HTTPException(status_code=409, detail=f"Job is {job.status}")
+    db.commit()
+    return db.query(Job).get(job_id)
+
+# Run a failed or cancelled job again with a fresh set of attempts
+@router.post("/{job_id}/retry", response_model=JobRead, dependencies=[Depends(require_roles("FitBro Admin"))])
+def retry_job(job_id: int, db: Session = Depends(get_db)):
+    return _transition(db, job_id, ("failed", "cancelled"), {
+        "status": "queued", "attempts": 0, "run_at": datetime.utcnow(), "finished_at": None,
+    })
+
+@router.post("/{job_id}/cancel", response_model=JobRead, dependencies=[Depends(require_roles("FitBro Admin"))])
+def cancel_job(job_id: int, db: Session = Depends(get_db)):
+    return _transition(db, job_id, ("queued",), {"status": "cancelled", "finished_at": datetime.utcnow()})
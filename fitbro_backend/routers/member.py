@@ -1,10 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from ..schemas import MemberCreate, MemberRead, MemberUpdate
-from ..models import Member, MembershipPlan
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload, load_only, selectinload
+from ..schemas import MemberCreate, MemberRead, MemberUpdate, CycleCalendar, MemberProgress, ProgressPeriod, MemberAdherence
+from ..models import Member, MembershipPlan, CyclePlan, WorkoutPlanEntry, Workout, Exercise, ExerciseProgress, DailyAdherence
 from ..database import get_db
+from ..pagination import Page, PageParams, paginate_rows
+from ..fast_json import page_response, read_columns
+from ..conditional import conditional, rows_etag
+from ..adherence import summarize
+from ..clock import utc_today
+from ..dashboard import invalidate_dashboard
 from dateutil.relativedelta import relativedelta
-from typing import List
+from datetime import date
+from typing import List, Optional
 
 router = APIRouter(
     prefix="/members",
@@ -30,6 +38,7 @@ def create_member(payload: MemberCreate, db: Session = Depends(get_db)):
     db.add(member)
     db.commit()
     db.refresh(member)
+    invalidate_dashboard(member.gym_id)
     return member
 
 @router.put("/{member_id}", response_model=MemberRead)
@@ -37,6 +46,7 @@ def update_member(member_id: int, payload: MemberUpdate, db: Session = Depends(g
     member = db.query(Member).filter(Member.id == member_id).first()
     if not member:
         raise HTTPException(status_code=404, detail="Member not found")
+    old_gym_id = member.gym_id
 
     # If plan or start_date changes, recalculate end_date
     changed = False
@@ -60,8 +70,141 @@ def update_member(member_id: int, payload: MemberUpdate, db: Session = Depends(g
     if changed:
         db.commit()
         db.refresh(member)
+        invalidate_dashboard(old_gym_id, member.gym_id)
     return member
 
-@router.get("/", response_model=List[MemberRead])
-def list_members(db: Session = Depends(get_db)):
-    return db.query(Member).all()
+@router.get("/", response_model=Page[MemberRead])
+def list_members(
+    request: Request,
+    response: Response,
+    gym_id: int = Query(...),
+    page: PageParams = Depends(),
+    db: Session = Depends(get_db)
+):
+    stmt = select(*read_columns(Member, MemberRead, Member.updated_at)).where(Member.gym_id == gym_id)
+    result = paginate_rows(db, stmt, page, Member.id)
+    etag = rows_etag(result["items"], result["next_cursor"])
+    return conditional(request, response, etag) or page_response(result, MemberRead, response)
+
+@router.get("/{member_id}/cycles/{cycle_id}/calendar", response_model=CycleCalendar)
+def get_cycle_calendar(
+    member_id: int,
+    cycle_id: int,
+    request: Request,
+    response: Response,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    db: Session = Depends(get_db)
+):
+    cycle = db.query(CyclePlan).filter(
+        CyclePlan.id == cycle_id,
+        CyclePlan.member_id == member_id,
+        CyclePlan.is_deleted == False
+    ).first()
+    if not cycle:
+        raise HTTPException(status_code=404, detail="Cycle plan not found")
+
+    # Entries with workout/exercise names joined in, logs in one extra IN query
+    q = db.query(WorkoutPlanEntry).options(
+        joinedload(WorkoutPlanEntry.workout).load_only(Workout.name),
+        joinedload(WorkoutPlanEntry.exercise).load_only(Exercise.name, Exercise.updated_at),
+        selectinload(WorkoutPlanEntry.logs),
+    ).filter(WorkoutPlanEntry.cycle_plan_id == cycle_id)
+    if date_from:
+        q = q.filter(WorkoutPlanEntry.day_date >= date_from)
+    if date_to:
+        q = q.filter(WorkoutPlanEntry.day_date <= date_to)
+
+    entries = q.order_by(WorkoutPlanEntry.day_date, WorkoutPlanEntry.id).all()
+    # Versioned by every row the calendar shows; workouts carry no row version, so their names go in as-is
+    etag = rows_etag(
+        [cycle, *entries, *dict.fromkeys(e.exercise for e in entries), *(log for e in entries for log in e.logs)],
+        date_from, date_to, *(e.workout.name for e in entries),
+    )
+    not_modified = conditional(request, response, etag)
+    if not_modified:
+        return not_modified
+
+    days = {}
+    for e in entries:
+        days.setdefault(e.day_date, []).append({
+            "id": e.id,
+            "workout_id": e.workout_id,
+            "workout_name": e.workout.name,
+            "exercise_id": e.exercise_id,
+            "exercise_name": e.exercise.name,
+            "planned_sets": e.planned_sets,
+            "planned_reps": e.planned_reps,
+            "planned_weight": e.planned_weight,
+            "planned_minutes": e.planned_minutes,
+            "planned_rpe": e.planned_rpe,
+            "planned_notes": e.planned_notes,
+            "logs": e.logs,
+        })
+    return {
+        "cycle": cycle,
+        "days": [{"day_date": d, "entries": entries} for d, entries in days.items()],
+    }
+
+# Progress charts straight from the exercise_progress rollups (see progress.py)
+@router.get("/{member_id}/progress", response_model=MemberProgress)
+def get_member_progress(
+    member_id: int,
+    request: Request,
+    response: Response,
+    period: ProgressPeriod = ProgressPeriod.week,
+    exercise_id: Optional[int] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    db: Session = Depends(get_db)
+):
+    if not db.query(Member.id).filter(Member.id == member_id).first():
+        raise HTTPException(status_code=404, detail="Member not found")
+
+    q = db.query(ExerciseProgress, Exercise.name).join(Exercise, ExerciseProgress.exercise_id == Exercise.id).filter(
+        ExerciseProgress.member_id == member_id,
+        ExerciseProgress.period == period.value
+    )
+    if exercise_id:
+        q = q.filter(ExerciseProgress.exercise_id == exercise_id)
+    if date_from:
+        q = q.filter(ExerciseProgress.period_start >= date_from)
+    if date_to:
+        q = q.filter(ExerciseProgress.period_start <= date_to)
+    rows = q.order_by(ExerciseProgress.exercise_id, ExerciseProgress.period_start).all()
+
+    not_modified = conditional(request, response, rows_etag([p for p, _ in rows], period.value, date_from, date_to))
+    if not_modified:
+        return not_modified
+
+    series = {}
+    for p, name in rows:
+        s = series.get(p.exercise_id)
+        if s is None:
+            s = series[p.exercise_id] = {"exercise_id": p.exercise_id, "exercise_name": name,
+                                         "best_e1rm": None, "prs": 0, "points": []}
+        s["points"].append(p)
+        s["prs"] += p.is_pr
+        if p.best_e1rm is not None and (s["best_e1rm"] is None or p.best_e1rm > s["best_e1rm"]):
+            s["best_e1rm"] = p.best_e1rm
+    return {"member_id": member_id, "period": period, "exercises": list(series.values())}
+
+# Plan-vs-actual from the daily_adherence rows (see adherence.py), optionally for one cycle
+@router.get("/{member_id}/adherence", response_model=MemberAdherence)
+def get_member_adherence(
+    member_id: int,
+    cycle_id: Optional[int] = None,
+    date_from: Optional[date] = None,
+    as_of: Optional[date] = None,
+    db: Session = Depends(get_db)
+):
+    if not db.query(Member.id).filter(Member.id == member_id).first():
+        raise HTTPException(status_code=404, detail="Member not found")
+    as_of = as_of or utc_today()
+    q = db.query(DailyAdherence).filter(DailyAdherence.member_id == member_id, DailyAdherence.day_date <= as_of)
+    if cycle_id:
+        q = q.filter(DailyAdherence.cycle_plan_id == cycle_id)
+    if date_from:
+        q = q.filter(DailyAdherence.day_date >= date_from)
+    days = q.order_by(DailyAdherence.day_date, DailyAdherence.cycle_plan_id).all()
+    return {"member_id": member_id, "cycle_plan_id": cycle_id, "as_of": as_of, "days": days, **summarize(days, as_of)}
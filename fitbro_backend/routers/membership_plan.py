@@ -1,16 +1,23 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session, selectinload
 from typing import List
 from ..schemas.membership_plan import MembershipPlanRead, MembershipPlanCreate
 from ..models.membership_plan import MembershipPlan
 from ..models.program import Program
 from ..database import get_db
+from ..pagination import Page, PageParams, paginate
 
 router = APIRouter(prefix="/membership-plans", tags=["Membership Plans"])
 
-@router.get("/", response_model=List[MembershipPlanRead])
-def list_plans(db: Session = Depends(get_db)):
-    return db.query(MembershipPlan).all()
+@router.get("/", response_model=Page[MembershipPlanRead])
+def list_plans(
+    gym_id: int = Query(...),
+    page: PageParams = Depends(),
+    db: Session = Depends(get_db)
+):
+    # program_ids comes from the many-to-many; batch it for the page
+    q = db.query(MembershipPlan).options(selectinload(MembershipPlan.programs)).filter(MembershipPlan.gym_id == gym_id)
+    return paginate(q, page, MembershipPlan.id)
 
 @router.post("/", response_model=MembershipPlanRead)
 def create_plan(payload: MembershipPlanCreate, db: Session = Depends(get_db)):
@@ -30,7 +37,7 @@ def create_plan(payload: MembershipPlanCreate, db: Session = Depends(get_db)):
 
 @router.get("/{plan_id}", response_model=MembershipPlanRead)
 def get_plan(plan_id: int, db: Session = Depends(get_db)):
-    plan = db.query(MembershipPlan).get(plan_id)
+    plan = db.query(MembershipPlan).options(selectinload(MembershipPlan.programs)).filter(MembershipPlan.id == plan_id).first()
     if not plan:
         raise HTTPException(status_code=404, detail="Membership plan not found")
     return plan
@@ -0,0 +1,10 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from ..metrics import render_metrics
+
+router = APIRouter(tags=["Metrics"])
+
+# Prometheus scrape endpoint (text exposition format 0.0.4)
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def metrics():
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
@@ -1,26 +1,38 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import or_
+from sqlalchemy.orm import Session, selectinload
 from typing import List
 
 from ..schemas import ProgramRead, ProgramCreate
 from ..models import Program, Workout
 from ..database import get_db
 from ..dependencies import require_roles
+from ..pagination import Page, PageParams, paginate
+from ..catalog_cache import cached_page, invalidate_catalog
 
 router = APIRouter(
     prefix="/programs",
     tags=["Programs"]
 )
 
-# List all programs
-@router.get("/", response_model=List[ProgramRead])
+# List programs for a gym (gym's own + master programs)
+@router.get("/", response_model=Page[ProgramRead])
 def list_programs(
+    request: Request,
+    gym_id: int = Query(...),
+    page: PageParams = Depends(),
     db: Session = Depends(get_db),
     current_user=Depends(require_roles(
         "FitBro Admin", "FitBro Officer", "Gym Owner", "Gym Instructor", "Gym Officer", "Gym Member"
     ))
 ):
-    return db.query(Program).all()
+    # ProgramRead lists workout ids; load them for the whole page in one IN query
+    def load():
+        q = db.query(Program).options(selectinload(Program.workouts)).filter(
+            or_(Program.gym_id == gym_id, Program.gym_id.is_(None))
+        )
+        return paginate(q, page, Program.id)
+    return cached_page(request, "programs", ProgramRead, gym_id, page, load)
 
 # Get single program
 @router.get("/{program_id}", response_model=ProgramRead)
@@ -31,7 +43,7 @@ def get_program(
         "FitBro Admin", "FitBro Officer", "Gym Owner", "Gym Instructor", "Gym Officer", "Gym Member"
     ))
 ):
-    program = db.query(Program).get(program_id)
+    program = db.query(Program).options(selectinload(Program.workouts)).filter(Program.id == program_id).first()
     if not program:
         raise HTTPException(status_code=404, detail="Program not found")
     return program
@@ -55,6 +67,7 @@ def create_program(
     db.add(obj)
     db.commit()
     db.refresh(obj)
+    invalidate_catalog(obj.gym_id)
     return obj
 
 # Update program - Correctly updates workout associations
@@ -71,6 +84,7 @@ def update_program(
 
     data = payload.dict(exclude_unset=True)
     workout_ids = data.pop("workouts", None)
+    old_gym_id = program.gym_id
 
     for k, v in data.items():
         setattr(program, k, v)
@@ -82,6 +96,7 @@ def update_program(
 
     db.commit()
     db.refresh(program)
+    invalidate_catalog(old_gym_id, program.gym_id)
     return program
 
 # Delete program
@@ -94,6 +109,8 @@ def delete_program(
     program = db.query(Program).get(program_id)
     if not program:
         raise HTTPException(status_code=404, detail="Program not found")
+    gym_id = program.gym_id
     db.delete(program)
     db.commit()
+    invalidate_catalog(gym_id)
     return {"ok": True}
@@ -1,20 +1,29 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from typing import List
 from ..schemas import UserRead, UserCreate
 from ..models import User
 from ..database import get_db
 from ..dependencies import get_current_user, require_roles
+from ..pagination import Page, PageParams, paginate
+from ..passwords import hash_password
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
-@router.get("/", response_model=List[UserRead], dependencies=[Depends(require_roles("FitBro Admin", "FitBro Officer"))])
-def list_users(db: Session = Depends(get_db)):
-    return db.query(User).all()
+@router.get("/", response_model=Page[UserRead], dependencies=[Depends(require_roles("FitBro Admin", "FitBro Officer"))])
+def list_users(
+    gym_id: int = Query(...),
+    page: PageParams = Depends(),
+    db: Session = Depends(get_db)
+):
+    q = db.query(User).filter(User.gym_id == gym_id)
+    return paginate(q, page, User.id)
 
 @router.post("/", response_model=UserRead, dependencies=[Depends(require_roles("FitBro Admin"))])
 def create_user(payload: UserCreate, db: Session = Depends(get_db)):
-    user = User(**payload.dict())
+    data = payload.dict()
+    data["password"] = hash_password(data["password"])
+    user = User(**data)
     db.add(user)
     db.commit()
     db.refresh(user)
@@ -1,25 +1,52 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from typing import List, Optional
+from datetime import date, datetime, time, timedelta
 from ..models.visitor import Visitor
 from ..schemas.visitor import VisitorRead, VisitorCreate, VisitorUpdate
 from ..models.membership_plan import MembershipPlan
-from ..database import get_db
-from ..dependencies import get_current_user
+from ..database import get_db, get_async_db
+from ..dependencies import PLATFORM_ROLES, get_current_user, require_gym_roles
+from ..pagination import Page, PageParams, paginate
+from ..export import ExportFormat, export_response
+from ..dashboard import invalidate_dashboard
 
 router = APIRouter(prefix="/visitors", tags=["Visitors"])
 
-# List all visitors (for admin/instructor)
-@router.get("/", response_model=List[VisitorRead])
+# List a gym's visitors, newest first (for admin/instructor)
+@router.get("/", response_model=Page[VisitorRead])
 def list_visitors(
     db: Session = Depends(get_db),
-    gym_id: Optional[int] = Query(None)
+    gym_id: int = Query(...),
+    page: PageParams = Depends()
 ):
-    # Optionally filter by gym_id
-    query = db.query(Visitor)
-    if gym_id:
-        query = query.filter(Visitor.gym_id == gym_id)
-    return query.order_by(Visitor.created_at.desc()).all()
+    query = db.query(Visitor).options(selectinload(Visitor.followups)).filter(Visitor.gym_id == gym_id)
+    return paginate(query, page, Visitor.created_at, Visitor.id, descending=True)
+
+# Stream a gym's visitors as NDJSON or CSV (declared before /{visitor_id})
+@router.get("/export", dependencies=[Depends(require_gym_roles(*PLATFORM_ROLES, "Gym Owner"))])
+def export_visitors(
+    gym_id: int = Query(...),
+    status: Optional[str] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    format: ExportFormat = ExportFormat.ndjson
+):
+    def build_query(db):
+        q = db.query(Visitor).filter(Visitor.gym_id == gym_id)
+        if status:
+            q = q.filter(Visitor.status == status)
+        if date_from:
+            q = q.filter(Visitor.created_at >= datetime.combine(date_from, time.min))
+        if date_to:
+            q = q.filter(Visitor.created_at < datetime.combine(date_to + timedelta(days=1), time.min))
+        return q.order_by(Visitor.id)
+
+    columns = [getattr(Visitor, c.key) for c in Visitor.__table__.columns]
+    return export_response(build_query, columns, format, "visitors")
 
 # Get visitor by ID
 @router.get("/{visitor_id}", response_model=VisitorRead)
@@ -37,9 +64,9 @@ def get_plans_for_gym(gym_id: int, db: Session = Depends(get_db)):
 
 # Register a new visitor
 @router.post("/", response_model=VisitorRead)
-def create_visitor(
+async def create_visitor(
     payload: VisitorCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     request: Request = None,
     current_user=Depends(get_current_user)  # For audit, not enforced
 ):
@@ -52,9 +79,9 @@ def create_visitor(
             gym_id = 1  # TODO: Remove hardcode for production
 
     # Duplicate check (only "Converted" is blocked)
-    existing = db.query(Visitor).filter(
+    existing = (await db.execute(select(Visitor).where(
         Visitor.gym_id == gym_id, Visitor.mobile == payload.mobile
-    ).order_by(Visitor.created_at.desc()).first()
+    ).order_by(Visitor.created_at.desc()).limit(1))).scalars().first()
     if existing:
         if existing.status == "Converted":
             raise HTTPException(status_code=400, detail=f"Mobile already registered & converted: {existing.first_name}, on {existing.created_at.date()}, goal: {existing.fitness_goal}")
@@ -77,8 +104,10 @@ def create_visitor(
         updated_by=getattr(current_user, "name", None) if current_user else None,
     )
     db.add(visitor)
-    db.commit()
-    db.refresh(visitor)
+    await db.commit()
+    invalidate_dashboard(gym_id)
+    # followups is a lazy relationship (no lazy IO under asyncio); a new visitor has none
+    set_committed_value(visitor, "followups", [])
     return visitor
 
 # Update visitor (for status, comments, followup, conversion)
@@ -97,4 +126,5 @@ def update_visitor(
     visitor.updated_by = getattr(current_user, "name", None) if current_user else None
     db.commit()
     db.refresh(visitor)
+    invalidate_dashboard(visitor.gym_id)
     return visitor
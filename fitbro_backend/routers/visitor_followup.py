@@ -7,6 +7,8 @@ from ..models.user import User
 from ..schemas.visitor_followup import VisitorFollowUpCreate, VisitorFollowUpRead
 from ..database import get_db
 from ..dependencies import get_current_user
+from ..pagination import Page, PageParams, paginate
+from ..dashboard import invalidate_dashboard
 
 router = APIRouter(prefix="/visitor-followup", tags=["Visitor FollowUp"])
 
@@ -27,9 +29,11 @@ def add_followup(visitor_id: int, payload: VisitorFollowUpCreate, db: Session =
     visitor.status = payload.status or visitor.status
     db.commit()
     db.refresh(followup)
+    invalidate_dashboard(visitor.gym_id)
     return followup
 
-@router.get("/{visitor_id}/", response_model=List[VisitorFollowUpRead])
-def list_followups(visitor_id: int, db: Session = Depends(get_db)):
-    followups = db.query(VisitorFollowUp).filter_by(visitor_id=visitor_id).order_by(VisitorFollowUp.created_at.desc()).all()
-    return followups
+@router.get("/{visitor_id}/", response_model=Page[VisitorFollowUpRead])
+def list_followups(visitor_id: int, page: PageParams = Depends(), db: Session = Depends(get_db)):
+    # Scoped by the visitor, which already belongs to a single gym
+    q = db.query(VisitorFollowUp).filter_by(visitor_id=visitor_id)
+    return paginate(q, page, VisitorFollowUp.created_at, VisitorFollowUp.id, descending=True)
@@ -1,28 +1,43 @@
-from fastapi import APIRouter, Depends, HTTPException
+import logging
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 from typing import List
 from ..schemas import WorkoutRead, WorkoutCreate
 from ..models import Workout
 from ..database import get_db
+from ..pagination import Page, PageParams, paginate
 from ..dependencies import get_current_user, require_roles
+from ..catalog_cache import cached_page, invalidate_catalog
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/workouts", tags=["Workouts"])
 
-@router.get("/", response_model=List[WorkoutRead])
-def list_workouts(db: Session = Depends(get_db)):
-    return db.query(Workout).all()
+@router.get("/", response_model=Page[WorkoutRead])
+def list_workouts(
+    request: Request,
+    gym_id: int = Query(...),
+    page: PageParams = Depends(),
+    db: Session = Depends(get_db)
+):
+    def load():
+        q = db.query(Workout).filter(or_(Workout.gym_id == gym_id, Workout.gym_id.is_(None)))
+        return paginate(q, page, Workout.id)
+    return cached_page(request, "workouts", WorkoutRead, gym_id, page, load)
 
 @router.post("/", response_model=WorkoutRead, dependencies=[Depends(require_roles("FitBro Admin", "Gym Owner", "Gym Instructor"))])
 def create_workout(payload: WorkoutCreate, db: Session = Depends(get_db)):
     try:
-        print("-------------------PAYLOAD:", payload.dict())
         workout = Workout(**payload.dict())
         db.add(workout)
         db.commit()
         db.refresh(workout)
-        print(" ------------ just created the workout", workout)
+        invalidate_catalog(workout.gym_id)
+        logger.info("workout created", extra={"workout_id": workout.id, "gym_id": workout.gym_id})
         return workout
     except Exception as e:
-        print("ERROR in create_workout:", e)
+        logger.exception("create_workout failed")
         raise HTTPException(status_code=500, detail=str(e))
 
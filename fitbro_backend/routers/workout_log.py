@@ -1,31 +1,183 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from datetime import date
 from ..schemas import WorkoutLogRead, WorkoutLogCreate, WorkoutLogUpdate
-from ..models import WorkoutLog
-from ..database import get_db
+from ..schemas.workout_log import WorkoutLogBatchItem, WorkoutLogBatchResult
+from ..models import WorkoutLog, Member, WorkoutPlanEntry, CyclePlan
+from ..database import get_db, get_async_db
+from ..dependencies import PLATFORM_ROLES, require_gym_roles
+from ..pagination import Page, PageParams, paginate_rows_async
+from ..fast_json import page_response, read_columns
+from ..conditional import conditional, rows_etag
+from ..export import ExportFormat, export_response
+from ..progress import refresh_for_logs
+from ..adherence import refresh_for_entries
+from ..dashboard import gyms_of_members, invalidate_dashboard
 
 router = APIRouter(prefix="/workout-logs", tags=["WorkoutLogs"])
 
-@router.get("/", response_model=List[WorkoutLogRead])
-def list_logs(db: Session = Depends(get_db)):
-    return db.query(WorkoutLog).all()
+# Progress and adherence rollups are updated in the same transaction as the logs;
+# returns the gyms whose dashboards to invalidate once the write commits
+def _refresh_rollups(db: Session, logs):
+    # logs: (member_id, workout_plan_entry_id, workout_date) as they were before and after the write
+    refresh_for_logs(db, logs)
+    refresh_for_entries(db, [entry_id for _, entry_id, _ in logs])
+    return gyms_of_members(db, [member_id for member_id, _, _ in logs])
+
+# Filtered slice of a gym's logs; every filter is served by a workout_logs index
+@router.get("/", response_model=Page[WorkoutLogRead])
+async def list_logs(
+    request: Request,
+    response: Response,
+    gym_id: int = Query(...),
+    member_id: Optional[int] = None,
+    cycle_plan_id: Optional[int] = None,
+    workout_plan_entry_id: Optional[int] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_async_db)
+):
+    stmt = select(*read_columns(WorkoutLog, WorkoutLogRead, WorkoutLog.updated_at)).join(
+        Member, WorkoutLog.member_id == Member.id
+    ).where(Member.gym_id == gym_id)
+    if member_id:
+        stmt = stmt.where(WorkoutLog.member_id == member_id)
+    if cycle_plan_id:
+        stmt = stmt.where(WorkoutLog.cycle_plan_id == cycle_plan_id)
+    if workout_plan_entry_id:
+        stmt = stmt.where(WorkoutLog.workout_plan_entry_id == workout_plan_entry_id)
+    if date_from:
+        stmt = stmt.where(WorkoutLog.workout_date >= date_from)
+    if date_to:
+        stmt = stmt.where(WorkoutLog.workout_date <= date_to)
+    result = await paginate_rows_async(db, stmt, page, WorkoutLog.id)
+    etag = rows_etag(result["items"], result["next_cursor"])
+    return conditional(request, response, etag) or page_response(result, WorkoutLogRead, response)
+
+# Stream a gym's log history as NDJSON or CSV
+@router.get("/export", dependencies=[Depends(require_gym_roles(*PLATFORM_ROLES, "Gym Owner"))])
+def export_logs(
+    gym_id: int = Query(...),
+    member_id: Optional[int] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    format: ExportFormat = ExportFormat.ndjson
+):
+    def build_query(db):
+        q = db.query(WorkoutLog).join(Member, WorkoutLog.member_id == Member.id).filter(Member.gym_id == gym_id)
+        if member_id:
+            q = q.filter(WorkoutLog.member_id == member_id)
+        if date_from:
+            q = q.filter(WorkoutLog.workout_date >= date_from)
+        if date_to:
+            q = q.filter(WorkoutLog.workout_date <= date_to)
+        return q.order_by(WorkoutLog.id)
+
+    columns = [getattr(WorkoutLog, c.key) for c in WorkoutLog.__table__.columns]
+    return export_response(build_query, columns, format, "workout_logs")
 
 @router.post("/", response_model=WorkoutLogRead)
-def create_log(payload: WorkoutLogCreate, db: Session = Depends(get_db)):
+async def create_log(payload: WorkoutLogCreate, db: AsyncSession = Depends(get_async_db)):
     log = WorkoutLog(**payload.dict())
     db.add(log)
-    db.commit()
-    db.refresh(log)
+    await db.flush()
+    gyms = await db.run_sync(_refresh_rollups, [(log.member_id, log.workout_plan_entry_id, log.workout_date)])
+    await db.commit()  # no refresh needed: the async session does not expire on commit
+    invalidate_dashboard(*gyms)
     return log
 
+MAX_BATCH_SIZE = 500
+
+def _insert_batch(db: Session, items: List[WorkoutLogBatchItem]):
+    results, gyms = {}, set()
+    keys = [i.client_key for i in items]
+    # Replays: keys that were already stored by an earlier sync
+    for key, log_id in db.query(WorkoutLog.client_key, WorkoutLog.id).filter(WorkoutLog.client_key.in_(keys)):
+        results[key] = WorkoutLogBatchResult(client_key=key, status="duplicate", id=log_id)
+
+    member_ids = {i.member_id for i in items}
+    entry_ids = {i.workout_plan_entry_id for i in items}
+    known_members = {m for (m,) in db.query(Member.id).filter(Member.id.in_(member_ids))}
+    # entry id -> (cycle_plan_id, member_id) of the cycle the entry belongs to
+    known_entries = {
+        e: (cycle_id, owner)
+        for e, cycle_id, owner in db.query(WorkoutPlanEntry.id, CyclePlan.id, CyclePlan.member_id)
+        .join(CyclePlan, WorkoutPlanEntry.cycle_plan_id == CyclePlan.id)
+        .filter(WorkoutPlanEntry.id.in_(entry_ids))
+    }
+
+    rows = []
+    for item in items:
+        if item.client_key in results:
+            continue
+        if item.member_id not in known_members:
+            results[item.client_key] = WorkoutLogBatchResult(client_key=item.client_key, status="rejected", detail="Member not found")
+        elif item.workout_plan_entry_id not in known_entries:
+            results[item.client_key] = WorkoutLogBatchResult(client_key=item.client_key, status="rejected", detail="Plan entry not found")
+        elif known_entries[item.workout_plan_entry_id][0] != item.cycle_plan_id:
+            results[item.client_key] = WorkoutLogBatchResult(client_key=item.client_key, status="rejected", detail="Plan entry is not in this cycle plan")
+        elif known_entries[item.workout_plan_entry_id][1] != item.member_id:
+            results[item.client_key] = WorkoutLogBatchResult(client_key=item.client_key, status="rejected", detail="Cycle plan belongs to another member")
+        else:
+            rows.append(item.dict())
+            results[item.client_key] = None
+
+    if rows:
+        db.execute(WorkoutLog.__table__.insert(), rows)
+        gyms = _refresh_rollups(db, [(r["member_id"], r["workout_plan_entry_id"], r["workout_date"]) for r in rows])
+        new_keys = [r["client_key"] for r in rows]
+        for key, log_id in db.query(WorkoutLog.client_key, WorkoutLog.id).filter(WorkoutLog.client_key.in_(new_keys)):
+            results[key] = WorkoutLogBatchResult(client_key=key, status="created", id=log_id)
+    db.commit()
+    invalidate_dashboard(*gyms)
+    return results
+
+# Flush an offline queue of logs in one transaction; replays are reported as duplicates
+@router.post("/batch", response_model=List[WorkoutLogBatchResult])
+def create_logs_batch(payload: List[WorkoutLogBatchItem], db: Session = Depends(get_db)):
+    if len(payload) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=413, detail=f"At most {MAX_BATCH_SIZE} logs per batch")
+    # Same key twice in one request: the first occurrence wins
+    unique = {}
+    for item in payload:
+        unique.setdefault(item.client_key, item)
+    try:
+        results = _insert_batch(db, list(unique.values()))
+    except IntegrityError:
+        # A concurrent sync stored some of these keys first; re-check and retry once
+        db.rollback()
+        try:
+            results = _insert_batch(db, list(unique.values()))
+        except IntegrityError:
+            # Still conflicting (another sync racing again, or a row deleted under us)
+            db.rollback()
+            raise HTTPException(status_code=409, detail="Batch conflicts with a concurrent write; retry the sync")
+
+    out, seen = [], set()
+    for item in payload:
+        res = results[item.client_key]
+        if item.client_key in seen:
+            res = WorkoutLogBatchResult(client_key=item.client_key, status="duplicate", id=res.id)
+        seen.add(item.client_key)
+        out.append(res)
+    return out
+
 @router.patch("/{log_id}", response_model=WorkoutLogRead)
 def update_log(log_id: int, payload: WorkoutLogUpdate, db: Session = Depends(get_db)):
     log = db.query(WorkoutLog).get(log_id)
     if not log:
         raise HTTPException(status_code=404, detail="Not found")
+    before = (log.member_id, log.workout_plan_entry_id, log.workout_date)
     for k, v in payload.dict(exclude_unset=True).items():
         setattr(log, k, v)
+    db.flush()
+    gyms = _refresh_rollups(db, [before, (log.member_id, log.workout_plan_entry_id, log.workout_date)])
     db.commit()
     db.refresh(log)
+    invalidate_dashboard(*gyms)
     return log
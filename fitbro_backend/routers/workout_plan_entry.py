@@ -1,12 +1,24 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import case, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Dict, List, Optional
+from datetime import date, timedelta
 
 from ..schemas.workout_plan_entry import (
-    WorkoutPlanEntryCreate, WorkoutPlanEntryRead, WorkoutPlanEntryUpdate
+    WorkoutPlanEntryCreate, WorkoutPlanEntryRead, WorkoutPlanEntryUpdate,
+    ReorderDays, ReorderResult, ShiftDays
 )
 from ..models.workout_plan_entry import WorkoutPlanEntry
-from ..database import get_db
+from ..models.cycle_plan import CyclePlan
+from ..models.member import Member
+from ..models.workout_log import WorkoutLog
+from ..database import get_db, get_async_db
+from ..pagination import Page, PageParams, paginate_rows_async
+from ..fast_json import page_response, read_columns
+from ..conditional import conditional, rows_etag
+from ..progress import refresh_progress
+from ..adherence import refresh_adherence
 
 router = APIRouter(
     prefix="/workout-plan-entries",
@@ -17,23 +29,53 @@ router = APIRouter(
 def create_entry(payload: WorkoutPlanEntryCreate, db: Session = Depends(get_db)):
     obj = WorkoutPlanEntry(**payload.dict())
     db.add(obj)
+    db.flush()
+    refresh_adherence(db, [(obj.cycle_plan_id, obj.day_date)])
     db.commit()
     db.refresh(obj)
     return obj
 
-@router.get("/", response_model=List[WorkoutPlanEntryRead])
-def list_entries(
+MAX_BATCH_SIZE = 1000
+
+# Create many entries in one transaction (single flush, single commit)
+@router.post("/batch", response_model=List[WorkoutPlanEntryRead])
+def create_entries_batch(payload: List[WorkoutPlanEntryCreate], db: Session = Depends(get_db)):
+    if len(payload) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=413, detail=f"At most {MAX_BATCH_SIZE} entries per batch")
+    cycle_ids = {p.cycle_plan_id for p in payload}
+    found = {cid for (cid,) in db.query(CyclePlan.id).filter(CyclePlan.id.in_(cycle_ids))}
+    if cycle_ids - found:
+        raise HTTPException(status_code=404, detail=f"Cycle plan(s) not found: {sorted(cycle_ids - found)}")
+    objs = [WorkoutPlanEntry(**p.dict()) for p in payload]
+    db.add_all(objs)
+    db.flush()
+    refresh_adherence(db, [(o.cycle_plan_id, o.day_date) for o in objs])
+    # Serialize before commit so the rows are not expired and re-SELECTed one by one
+    result = [WorkoutPlanEntryRead.model_validate(o, from_attributes=True) for o in objs]
+    db.commit()
+    return result
+
+@router.get("/", response_model=Page[WorkoutPlanEntryRead])
+async def list_entries(
+    request: Request,
+    response: Response,
+    gym_id: int = Query(...),
     member_id: Optional[int] = None,
     cycle_plan_id: Optional[int] = None,
-    db: Session = Depends(get_db)
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    q = db.query(WorkoutPlanEntry)
+    columns = read_columns(WorkoutPlanEntry, WorkoutPlanEntryRead, WorkoutPlanEntry.updated_at)
+    stmt = select(*columns).join(CyclePlan, WorkoutPlanEntry.cycle_plan_id == CyclePlan.id).join(
+        Member, CyclePlan.member_id == Member.id
+    ).where(Member.gym_id == gym_id)
     if cycle_plan_id:
-        q = q.filter(WorkoutPlanEntry.cycle_plan_id == cycle_plan_id)
+        stmt = stmt.where(WorkoutPlanEntry.cycle_plan_id == cycle_plan_id)
     if member_id:
-        from ..models.cycle_plan import CyclePlan
-        q = q.join(CyclePlan, WorkoutPlanEntry.cycle_plan_id == CyclePlan.id).filter(CyclePlan.member_id == member_id)
-    return q.all()
+        stmt = stmt.where(CyclePlan.member_id == member_id)
+    result = await paginate_rows_async(db, stmt, page, WorkoutPlanEntry.id)
+    etag = rows_etag(result["items"], result["next_cursor"])
+    return conditional(request, response, etag) or page_response(result, WorkoutPlanEntryRead, response)
 
 @router.get("/{entry_id}", response_model=WorkoutPlanEntryRead)
 def get_entry(entry_id: int, db: Session = Depends(get_db)):
@@ -47,8 +89,16 @@ def update_entry(entry_id: int, payload: WorkoutPlanEntryUpdate, db: Session = D
     entry = db.query(WorkoutPlanEntry).filter(WorkoutPlanEntry.id == entry_id).first()
     if not entry:
         raise HTTPException(status_code=404, detail="Entry not found")
+    old_exercise_id, old_day = entry.exercise_id, entry.day_date
     for field, value in payload.dict(exclude_unset=True).items():
         setattr(entry, field, value)
+    db.flush()
+    refresh_adherence(db, [(entry.cycle_plan_id, old_day), (entry.cycle_plan_id, entry.day_date)])
+    if entry.exercise_id != old_exercise_id:
+        # The entry's logs now count towards another exercise's progress
+        logged = db.query(WorkoutLog.member_id, WorkoutLog.workout_date).filter(
+            WorkoutLog.workout_plan_entry_id == entry_id).all()
+        refresh_progress(db, [(m, e, d) for m, d in logged for e in (old_exercise_id, entry.exercise_id)])
     db.commit()
     db.refresh(entry)
     return entry
@@ -58,28 +108,78 @@ def delete_entry(entry_id: int, db: Session = Depends(get_db)):
     entry = db.query(WorkoutPlanEntry).filter(WorkoutPlanEntry.id == entry_id).first()
     if not entry:
         raise HTTPException(status_code=404, detail="Entry not found")
+    logged = db.query(WorkoutLog.member_id, WorkoutLog.workout_date).filter(
+        WorkoutLog.workout_plan_entry_id == entry_id).all()
     db.delete(entry)
+    db.flush()
+    refresh_adherence(db, [(entry.cycle_plan_id, entry.day_date)])
+    refresh_progress(db, [(m, entry.exercise_id, d) for m, d in logged])
     db.commit()
     return {"ok": True}
 
-# In your FastAPI backend
-@router.post("/swap-workout-day")
-def swap_workout_day(cycle_plan_id: int, from_date: str, to_date: str, db: Session = Depends(get_db)):
-    # Fetch all entries for from_date and to_date (for this cycle_plan_id)
-    entries_from = db.query(WorkoutPlanEntry).filter(
-        WorkoutPlanEntry.cycle_plan_id == cycle_plan_id,
-        WorkoutPlanEntry.day_date == from_date
-    ).all()
-    entries_to = db.query(WorkoutPlanEntry).filter(
-        WorkoutPlanEntry.cycle_plan_id == cycle_plan_id,
-        WorkoutPlanEntry.day_date == to_date
-    ).all()
-    # Swap the dates
-    for e in entries_from:
-        e.day_date = "__SWAP_TEMP__"
-    for e in entries_to:
-        e.day_date = from_date
-    for e in entries_from:
-        e.day_date = to_date
+# ===== DAY RESHUFFLES =====
+# Every reshuffle is one UPDATE ... SET day_date = CASE day_date WHEN <old> THEN <new> ... END,
+# so it costs the same few statements however many entries a day has, and all days move
+# atomically (a swap needs no placeholder date).
+def _reorder_days(db: Session, cycle_plan_id: int, moves: Dict[date, date]):
+    cycle = db.query(CyclePlan).filter(CyclePlan.id == cycle_plan_id, CyclePlan.is_deleted == False).first()
+    if not cycle:
+        raise HTTPException(status_code=404, detail="Cycle plan not found")
+    moves = {old: new for old, new in moves.items() if old != new}
+    targets = list(moves.values())
+    if len(set(targets)) != len(targets):
+        raise HTTPException(status_code=400, detail="Two days can't move to the same date")
+
+    occupied = {d for (d,) in db.query(WorkoutPlanEntry.day_date).filter(
+        WorkoutPlanEntry.cycle_plan_id == cycle_plan_id).distinct()}
+    moves = {old: new for old, new in moves.items() if old in occupied}
+    # A target that keeps its own entries would silently merge two days
+    taken = sorted(str(new) for new in moves.values() if new in occupied and new not in moves)
+    if taken:
+        raise HTTPException(status_code=409, detail=f"Target day(s) already have entries: {taken}")
+
+    updated = 0
+    if moves:
+        updated = db.execute(
+            update(WorkoutPlanEntry)
+            .where(WorkoutPlanEntry.cycle_plan_id == cycle_plan_id, WorkoutPlanEntry.day_date.in_(list(moves)))
+            .values(day_date=case(moves, value=WorkoutPlanEntry.day_date))
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        refresh_adherence(db, [(cycle_plan_id, d) for move in moves.items() for d in move])
+        # Moving days past either end stretches the cycle rather than leaving entries outside it
+        first, last = min(moves.values()), max(moves.values())
+        if first < cycle.start_date:
+            cycle.duration += (cycle.start_date - first).days
+            cycle.start_date = first
+        if last > cycle.end_date:
+            cycle.duration += (last - cycle.end_date).days
+            cycle.end_date = last
     db.commit()
+    return {"cycle_plan_id": cycle_plan_id, "moved_days": len(moves), "updated": updated, "end_date": cycle.end_date}
+
+# Response kept as it was for existing clients; reorder-days reports the counts
+@router.post("/swap-workout-day")
+def swap_workout_day(cycle_plan_id: int, from_date: date, to_date: date, db: Session = Depends(get_db)):
+    _reorder_days(db, cycle_plan_id, {from_date: to_date, to_date: from_date})
     return {"status": "success"}
+
+# Move any set of days to new dates at once, e.g. a day to a free date or a three-way rotation
+@router.post("/reorder-days", response_model=ReorderResult)
+def reorder_days(payload: ReorderDays, db: Session = Depends(get_db)):
+    moves = {}
+    for m in payload.moves:
+        if m.from_date in moves:
+            raise HTTPException(status_code=400, detail=f"{m.from_date} is moved twice")
+        moves[m.from_date] = m.to_date
+    return _reorder_days(db, payload.cycle_plan_id, moves)
+
+# Move from_date and the rest of the cycle by `days` (e.g. +1 after a missed session)
+@router.post("/shift-days", response_model=ReorderResult)
+def shift_days(payload: ShiftDays, db: Session = Depends(get_db)):
+    days = db.query(WorkoutPlanEntry.day_date).filter(
+        WorkoutPlanEntry.cycle_plan_id == payload.cycle_plan_id,
+        WorkoutPlanEntry.day_date >= payload.from_date
+    ).distinct()
+    delta = timedelta(days=payload.days)
+    return _reorder_days(db, payload.cycle_plan_id, {d: d + delta for (d,) in days})
@@ -7,11 +7,15 @@ from .program import ProgramCreate, ProgramRead, ProgramUpdate
 from .workout import WorkoutCreate, WorkoutRead, WorkoutUpdate
 from .membership_plan import MembershipPlanCreate, MembershipPlanRead, MembershipPlanUpdate
 from .member import MemberCreate, MemberRead, MemberUpdate
-from .cycle_plan import CyclePlanCreate, CyclePlanRead, CyclePlanUpdate
+from .cycle_plan import CyclePlanCreate, CyclePlanRead, CyclePlanUpdate, CycleCalendar
 from .assessment_template import AssessmentTemplateCreate, AssessmentTemplateRead, AssessmentTemplateUpdate
 from .workout_plan_entry import WorkoutPlanEntryCreate, WorkoutPlanEntryRead, WorkoutPlanEntryUpdate
 from .workout_log import WorkoutLogCreate, WorkoutLogRead, WorkoutLogUpdate
 from .assessment_result import AssessmentResultCreate, AssessmentResultRead, AssessmentResultUpdate
 from .announcement import AnnouncementCreate, AnnouncementRead, AnnouncementUpdate
 from .visitor import VisitorCreate, VisitorRead, VisitorUpdate
-from .visitor_followup import VisitorFollowUpCreate, VisitorFollowUpRead, VisitorFollowUpUpdate
\ No newline at end of file
+from .visitor_followup import VisitorFollowUpCreate, VisitorFollowUpRead, VisitorFollowUpUpdate
+from .progress import MemberProgress, ProgressPeriod
+from .adherence import MemberAdherence, GymAdherence
+from .dashboard import GymDashboard
+from .job import JobCreate, JobRead
\ No newline at end of file
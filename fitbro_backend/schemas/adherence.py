@@ -0,0 +1,39 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import date
+
+class AdherenceDay(BaseModel):
+    cycle_plan_id: int
+    day_date: date
+    planned: int
+    completed: int
+    skipped: int
+    adherence: float
+    streak: int
+
+    class Config:
+        orm_mode = True
+
+# Totals are over planned days up to as_of; later days haven't been missed yet
+class AdherenceSummary(BaseModel):
+    planned: int = 0
+    completed: int = 0
+    skipped: int = 0
+    adherence: float = 0.0
+    current_streak: int = 0
+    best_streak: int = 0
+
+class MemberAdherence(AdherenceSummary):
+    member_id: int
+    cycle_plan_id: Optional[int] = None
+    as_of: date
+    days: List[AdherenceDay]
+
+class GymMemberAdherence(AdherenceSummary):
+    member_id: int
+    member_name: str
+
+class GymAdherence(AdherenceSummary):
+    gym_id: int
+    as_of: date
+    members: List[GymMemberAdherence]
@@ -0,0 +1,4 @@
+from pydantic import BaseModel
+
+class TokenRefresh(BaseModel):
+    refresh_token: str
@@ -1,6 +1,7 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import Optional, List
 from datetime import date
+from .workout_log import WorkoutLogRead
 
 class CyclePlanBase(BaseModel):
     member_id: int
@@ -21,3 +22,42 @@ class CyclePlanRead(CyclePlanBase):
     is_deleted: Optional[bool] = False
     class Config:
         orm_mode = True
+
+# Weekly template used to generate a cycle's WorkoutPlanEntry rows
+class WeeklyTemplateItem(BaseModel):
+    weekday: int = Field(..., ge=0, le=6)  # 0 = Monday ... 6 = Sunday
+    workout_id: int
+    exercise_id: int
+    planned_sets: Optional[int] = None
+    planned_reps: Optional[int] = None
+    planned_weight: Optional[float] = None
+    planned_minutes: Optional[int] = None
+    planned_rpe: Optional[int] = None
+    planned_notes: Optional[str] = None
+
+class CyclePlanGenerate(BaseModel):
+    items: List[WeeklyTemplateItem]
+    replace_existing: bool = False  # drop un-logged entries before generating; logged ones are kept as they are
+
+# Day view for the workout calendar: plan entries grouped by day with their logs
+class CalendarEntry(BaseModel):
+    id: int
+    workout_id: int
+    workout_name: str
+    exercise_id: int
+    exercise_name: str
+    planned_sets: Optional[int] = None
+    planned_reps: Optional[int] = None
+    planned_weight: Optional[float] = None
+    planned_minutes: Optional[int] = None
+    planned_rpe: Optional[int] = None
+    planned_notes: Optional[str] = None
+    logs: List[WorkoutLogRead] = []
+
+class CalendarDay(BaseModel):
+    day_date: date
+    entries: List[CalendarEntry]
+
+class CycleCalendar(BaseModel):
+    cycle: CyclePlanRead
+    days: List[CalendarDay]
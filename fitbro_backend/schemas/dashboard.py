@@ -0,0 +1,42 @@
+from pydantic import BaseModel
+from datetime import date, datetime
+
+# Membership counts; expiring_* are current members whose membership ends within the window,
+# lapsed ones are still flagged active past their end date
+class DashboardMembers(BaseModel):
+    total: int
+    active: int
+    expiring_7d: int
+    expiring_30d: int
+    lapsed: int
+    joined_30d: int
+
+class DashboardVisitors(BaseModel):
+    new_7d: int
+    new_30d: int
+    converted_30d: int
+    conversion_rate_30d: float
+
+class DashboardCycles(BaseModel):
+    active: int
+    ending_7d: int
+
+# sessions = members who logged today
+class DashboardToday(BaseModel):
+    sessions: int
+    logs: int
+
+class DashboardAdherence(BaseModel):
+    planned: int
+    completed: int
+    adherence: float
+
+class GymDashboard(BaseModel):
+    gym_id: int
+    as_of: date
+    generated_at: datetime
+    members: DashboardMembers
+    visitors: DashboardVisitors
+    cycles: DashboardCycles
+    today: DashboardToday
+    adherence_7d: DashboardAdherence
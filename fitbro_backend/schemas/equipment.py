@@ -5,8 +5,8 @@ from datetime import date
 
 class EquipmentBase(BaseModel):
     name: str
-    category: Optional[str]
-    manufacturer: Optional[str]
+    category: Optional[str] = None
+    manufacturer: Optional[str] = None
 
 class EquipmentCreate(EquipmentBase):
     pass
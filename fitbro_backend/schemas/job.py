@@ -0,0 +1,26 @@
+from pydantic import BaseModel, Json
+from typing import Any, Dict, Optional
+from datetime import datetime
+
+class JobCreate(BaseModel):
+    kind: str
+    payload: Dict[str, Any] = {}
+    run_at: Optional[datetime] = None  # default: now
+
+# payload / result are stored as JSON strings and returned decoded
+class JobRead(BaseModel):
+    id: int
+    kind: str
+    payload: Json[Any]
+    status: str  # queued / running / done / failed / cancelled
+    attempts: int
+    max_attempts: int
+    run_at: datetime
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    result: Optional[Json[Any]] = None
+    last_error: Optional[str] = None
+
+    class Config:
+        orm_mode = True
@@ -0,0 +1,36 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import date
+from enum import Enum
+
+class ProgressPeriod(str, Enum):
+    day = "day"
+    week = "week"
+    month = "month"
+
+class ProgressPoint(BaseModel):
+    period_start: date
+    log_count: int
+    total_sets: int
+    total_reps: int
+    volume: float
+    total_minutes: int
+    best_weight: Optional[float] = None
+    best_reps: Optional[int] = None
+    best_e1rm: Optional[float] = None
+    is_pr: bool = False
+
+    class Config:
+        orm_mode = True
+
+class ExerciseProgressSeries(BaseModel):
+    exercise_id: int
+    exercise_name: str
+    best_e1rm: Optional[float] = None  # best of the returned points
+    prs: int = 0
+    points: List[ProgressPoint]
+
+class MemberProgress(BaseModel):
+    member_id: int
+    period: ProgressPeriod
+    exercises: List[ExerciseProgressSeries]
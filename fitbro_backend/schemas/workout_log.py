@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import Optional, List
 from datetime import date
 
 class WorkoutLogBase(BaseModel):
@@ -20,6 +20,7 @@ class WorkoutLogCreate(WorkoutLogBase):
 
 class WorkoutLogRead(WorkoutLogBase):
     id: int
+    client_key: Optional[str] = None
 
     class Config:
         orm_mode = True
@@ -36,3 +37,13 @@ class WorkoutLogUpdate(BaseModel):
     actual_notes: Optional[str] = None
     status: Optional[str] = None
     workout_date: Optional[date] = None
+
+# Offline mobile sync: each item carries a client-generated idempotency key
+class WorkoutLogBatchItem(WorkoutLogBase):
+    client_key: str = Field(..., min_length=1, max_length=64)
+
+class WorkoutLogBatchResult(BaseModel):
+    client_key: str
+    status: str  # "created", "duplicate" or "rejected"
+    id: Optional[int] = None
+    detail: Optional[str] = None
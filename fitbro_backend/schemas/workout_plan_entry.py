@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional
 from datetime import date
 
 class WorkoutPlanEntryBase(BaseModel):
@@ -34,3 +34,23 @@ class WorkoutPlanEntryRead(WorkoutPlanEntryBase):
     class Config:
         orm_mode = True
 
+
+# Day reshuffles: every entry on from_date moves to to_date, all moves applied at once
+class DayMove(BaseModel):
+    from_date: date
+    to_date: date
+
+class ReorderDays(BaseModel):
+    cycle_plan_id: int
+    moves: List[DayMove] = Field(..., min_length=1)
+
+class ShiftDays(BaseModel):
+    cycle_plan_id: int
+    from_date: date  # this day and every later one move
+    days: int        # negative moves them earlier
+
+class ReorderResult(BaseModel):
+    cycle_plan_id: int
+    moved_days: int
+    updated: int
+    end_date: date
@@ -0,0 +1,32 @@
+# fitbro_backend/tasks.py
+# Built-in background tasks (see jobs.py). Each is fn(db, **payload); the worker
+# commits db after it returns. Schedules are cron expressions in UTC (clock.py).
+
+import datetime
+
+from .adherence import rebuild_adherence
+from .config import JOB_RETENTION_DAYS, NIGHTLY_ROLLOVER_CRON
+from .jobs import prune, task
+from .maintenance import run_rollover
+from .progress import rebuild_progress
+
+
+@task("nightly_rollover", schedule=NIGHTLY_ROLLOVER_CRON)
+def nightly_rollover(db, date=None):
+    # run_rollover commits on its own and keeps its own run log (maintenance_runs)
+    return run_rollover(db.get_bind(), datetime.date.fromisoformat(date) if date else None)
+
+
+@task("rebuild_progress", max_attempts=1)
+def rebuild_progress_task(db):
+    return {"rows": rebuild_progress(db)}
+
+
+@task("rebuild_adherence", max_attempts=1)
+def rebuild_adherence_task(db):
+    return {"rows": rebuild_adherence(db)}
+
+
+@task("prune_jobs", schedule="30 3 * * *")
+def prune_jobs(db, days=JOB_RETENTION_DAYS):
+    return {"deleted": prune(db, days=days)}
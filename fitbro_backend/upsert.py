@@ -0,0 +1,31 @@
+# fitbro_backend/upsert.py
+# INSERT ... ON CONFLICT (key) DO UPDATE for the rollup tables (exercise_progress,
+# daily_adherence). Two requests refreshing the same rollup row both succeed: under
+# PostgreSQL READ COMMITTED a DELETE + INSERT lets both DELETEs pass and the second
+# INSERT hits the unique key, whereas the upsert waits for the first writer and then
+# updates its row.
+
+from sqlalchemy.dialects import postgresql, sqlite
+
+_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def _dialect(conn):
+    # conn is a Session or Connection
+    bind = conn if hasattr(conn, "dialect") else conn.get_bind()
+    return bind.dialect.name
+
+
+def upsert(conn, table, rows, keys):
+    """Insert `rows` (dicts) into `table`, updating the other given columns on a `keys` conflict."""
+    if not rows:
+        return
+    insert = _INSERTS.get(_dialect(conn))
+    if insert is None:
+        raise NotImplementedError(f"upsert is not supported on {_dialect(conn)}")
+    stmt = insert(table)
+    columns = [c for c in rows[0] if c not in keys]
+    if "updated_at" in table.c:
+        columns.append("updated_at")  # onupdate doesn't fire for ON CONFLICT; excluded carries the insert default
+    stmt = stmt.on_conflict_do_update(index_elements=list(keys), set_={c: stmt.excluded[c] for c in columns})
+    conn.execute(stmt, rows)
@@ -0,0 +1,161 @@
+# fitbro_backend/worker.py
+# Runs background jobs (jobs.py): runner threads claim and run due jobs one at a time,
+# and a scheduler thread enqueues cron slots and re-queues jobs orphaned by a dead
+# worker. Started with the app (FITBRO_JOB_WORKERS threads, see main.py) or standalone:
+#
+#   python -m fitbro_backend.worker --threads 2
+#   python -m fitbro_backend.worker --once        # run whatever is due, then exit
+
+import argparse
+import datetime
+import json
+import logging
+import os
+import signal
+import socket
+import threading
+import time
+import traceback
+
+from sqlalchemy.orm import sessionmaker
+
+from . import tasks  # noqa: F401  (registers the built-in tasks)
+from .clock import utc_now
+from .config import JOB_POLL_INTERVAL, JOB_WORKERS
+from .database import engine
+from .jobs import claim, enqueue_cron_slot, fail, finish, registered, requeue_stale, wake
+
+logger = logging.getLogger(__name__)
+
+CRON_CATCH_UP = datetime.timedelta(days=1)  # on start, run the latest slot missed within this window
+HOUSEKEEPING_EVERY = 60  # seconds between stale-lock sweeps
+
+
+class Worker:
+    def __init__(self, eng=None, threads=JOB_WORKERS, poll=JOB_POLL_INTERVAL):
+        self.engine = eng or engine
+        self.sessions = sessionmaker(bind=self.engine, autoflush=False)
+        self.threads = threads
+        self.poll = poll
+        self.id = f"{socket.gethostname()}:{os.getpid()}"
+        self._stop = threading.Event()
+        self._threads = []
+
+    # ===== RUNNING JOBS =====
+    def run_one(self):
+        """Claim and run one due job; returns False when none was due."""
+        with self.engine.begin() as conn:
+            job = claim(conn, f"{self.id}:{threading.current_thread().name}")
+        if job is None:
+            return False
+        start = time.perf_counter()
+        fields = {"job_id": job.id, "kind": job.kind, "attempt": job.attempts}
+        try:
+            with self.sessions() as db:
+                result = registered()[job.kind].fn(db, **json.loads(job.payload))
+                db.commit()
+        except Exception:
+            with self.engine.begin() as conn:
+                status = fail(conn, job, traceback.format_exc())
+            logger.warning("job failed", exc_info=True, extra={**fields, "status": status})
+        else:
+            with self.engine.begin() as conn:
+                finish(conn, job.id, result)
+            logger.info("job done", extra={**fields, "duration_ms": round((time.perf_counter() - start) * 1000, 1)})
+        return True
+
+    def run_pending(self):
+        """Run due jobs until none is left; returns how many ran."""
+        ran = 0
+        while self.run_one():
+            ran += 1
+        return ran
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                if self.run_one():
+                    continue
+            except Exception:
+                logger.exception("job runner error")
+            wake.wait(self.poll)
+            wake.clear()
+
+    # ===== SCHEDULER =====
+    def enqueue_due(self, slots, now):
+        # slots: {kind: next UTC slot}; enqueues the latest slot <= now per kind
+        for kind, slot in slots.items():
+            cron, due = registered()[kind].schedule, None
+            while slot <= now:
+                due, slot = slot, cron.next_after(slot)
+            slots[kind] = slot
+            if due is not None and enqueue_cron_slot(self.engine, kind, due):
+                logger.info("cron job enqueued", extra={"kind": kind, "slot": due.isoformat()})
+
+    def _schedule(self):
+        start = utc_now() - CRON_CATCH_UP
+        slots = {kind: t.schedule.next_after(start) for kind, t in registered().items() if t.schedule}
+        last_sweep = 0.0
+        while not self._stop.is_set():
+            try:
+                self.enqueue_due(slots, utc_now())
+                if time.monotonic() - last_sweep >= HOUSEKEEPING_EVERY:
+                    with self.engine.begin() as conn:
+                        if requeue_stale(conn):
+                            wake.set()
+                    last_sweep = time.monotonic()
+            except Exception:
+                logger.exception("job scheduler error")
+            self._stop.wait(self.poll)
+
+    # ===== LIFECYCLE =====
+    def start(self):
+        targets = [self._schedule] + [self._run] * self.threads
+        for n, target in enumerate(targets):
+            t = threading.Thread(target=target, name=f"job-{n}" if n else "job-scheduler", daemon=True)
+            t.start()
+            self._threads.append(t)
+        logger.info("job worker started", extra={"worker": self.id, "threads": self.threads})
+        return self
+
+    def stop(self, timeout=10):
+        # A job still running after the timeout is re-queued by a later sweep (JOB_LOCK_TIMEOUT)
+        self._stop.set()
+        wake.set()
+        for t in self._threads:
+            t.join(timeout)
+        self._threads = []
+
+
+def start_in_app():
+    """Start the app's worker threads unless FITBRO_JOB_WORKERS is 0; returns the Worker or None."""
+    if JOB_WORKERS <= 0:
+        return None
+    return Worker().start()
+
+
+def main():
+    from .logs import configure_logging
+
+    parser = argparse.ArgumentParser(description="FitBro background job worker")
+    parser.add_argument("--threads", type=int, default=max(JOB_WORKERS, 1), help="jobs run at once")
+    parser.add_argument("--once", action="store_true", help="run the jobs that are due now, then exit")
+    args = parser.parse_args()
+    configure_logging()
+
+    worker = Worker(threads=args.threads)
+    if args.once:
+        print(f"ran {worker.run_pending()} jobs")
+        return
+    done = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: done.set())
+    worker.start()
+    try:
+        done.wait()
+    except KeyboardInterrupt:
+        pass
+    worker.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,17 @@ import React, { useEffect, useState } from "react";
 import {
     Paper, Stack, Typography, TextField, Select, MenuItem, Button, Snackbar, Alert, Divider, Box, CircularProgress
 } from "@mui/material";
+import { usePagedList } from "./usePagedList";
+import LoadMoreButton from "./LoadMoreButton";
 
 const API_BASE = "http://localhost:8000";
 const GYM_ID = 1; // Replace with logic for logged-in gym
 
 export default function AssessmentEntry_Pro() {
-    const [members, setMembers] = useState([]);
-    const [templates, setTemplates] = useState([]);
+    const memberList = usePagedList();
+    const templateList = usePagedList();
+    const members = memberList.items;
+    const templates = templateList.items;
     const [selectedMember, setSelectedMember] = useState("");
     const [selectedTemplate, setSelectedTemplate] = useState("");
     const [attrs, setAttrs] = useState([]);
@@ -22,9 +26,7 @@ export default function AssessmentEntry_Pro() {
     useEffect(() => {
         async function fetchMembers() {
             try {
-                const res = await fetch(`${API_BASE}/members?gym_id=${GYM_ID}`);
-                const data = await res.json();
-                setMembers(data);
+                await memberList.load("/members/", { gym_id: GYM_ID });
             } catch (e) {
                 setSnack({ open: true, message: "Failed to load members: " + e.message, severity: "error" });
             }
@@ -36,9 +38,7 @@ export default function AssessmentEntry_Pro() {
     useEffect(() => {
         async function fetchTemplates() {
             try {
-                const res = await fetch(`${API_BASE}/assessment-templates?gym_id=${GYM_ID}&is_master=false`);
-                const data = await res.json();
-                setTemplates(data);
+                await templateList.load("/assessment-templates/", { gym_id: GYM_ID, is_master: false });
             } catch (e) {
                 setSnack({ open: true, message: "Failed to load templates: " + e.message, severity: "error" });
             }
@@ -109,12 +109,14 @@ export default function AssessmentEntry_Pro() {
                         onChange={e => setSelectedMember(e.target.value)}
                         options={members.map(m => ({ value: m.id, label: `${m.name} (${m.mobile})` }))}
                     />
+                    <LoadMoreButton list={memberList} label="More members" />
                     <FormField
                         label="Assessment Template"
                         value={selectedTemplate}
                         onChange={e => setSelectedTemplate(e.target.value)}
                         options={templates.map(t => ({ value: t.id, label: t.name }))}
                     />
+                    <LoadMoreButton list={templateList} label="More templates" />
                     <TextField
                         label="Assessment Date"
                         type="date"
@@ -2,12 +2,16 @@ import React, { useEffect, useState } from "react";
 import {
     Paper, Typography, TextField, Checkbox, Button, Stack, Snackbar, Alert, Divider, Box, CircularProgress, MenuItem
 } from "@mui/material";
+import { fetchPage } from "./api";
+import { usePagedList } from "./usePagedList";
+import LoadMoreButton from "./LoadMoreButton";
 
 const API_BASE = "http://localhost:8000";
 const GYM_ID = 1; // Replace with actual logic for current gym
 
 export default function AssessmentTemplateDesigner() {
-    const [templates, setTemplates] = useState([]);
+    const templateList = usePagedList();
+    const templates = templateList.items;
     const [attrs, setAttrs] = useState([]);
     const [loading, setLoading] = useState(true);
     const [snack, setSnack] = useState({ open: false, message: "", severity: "success" });
@@ -20,9 +24,7 @@ export default function AssessmentTemplateDesigner() {
         async function fetchTemplates() {
             setLoading(true);
             try {
-                const res = await fetch(`${API_BASE}/assessment-templates?gym_id=${GYM_ID}&is_master=false`);
-                const data = await res.json();
-                setTemplates(data);
+                await templateList.load("/assessment-templates/", { gym_id: GYM_ID, is_master: false });
             } catch (e) {
                 setSnack({ open: true, message: "Failed to load templates: " + e.message, severity: "error" });
             } finally {
@@ -38,8 +40,7 @@ export default function AssessmentTemplateDesigner() {
         setTemplateName("");
         setLoading(true);
         try {
-            const res = await fetch(`${API_BASE}/assessment-templates?gym_id=${GYM_ID}&name=Gym Attribute Pool`);
-            const data = await res.json();
+            const { items: data } = await fetchPage("/assessment-templates/", { gym_id: GYM_ID, name: "Gym Attribute Pool", limit: 1 });
             if (!data.length) throw new Error("No gym attribute pool found. Ask admin to set up.");
             const attrArr = JSON.parse(data[0].template_json || "[]");
             setAttrs(attrArr.map(attr => ({ ...attr, selected: true, required: !!attr.required })));
@@ -134,6 +135,7 @@ export default function AssessmentTemplateDesigner() {
                                     <Button size="small" variant="outlined" onClick={() => editTemplate(tmpl)}>Edit</Button>
                                 </Box>
                             ))}
+                            <LoadMoreButton list={templateList} />
                         </Stack>
                     )}
                 </Stack>
@@ -11,6 +11,8 @@ import AddIcon from "@mui/icons-material/Add";
 import dayjs from "dayjs";
 import isSameOrAfter from "dayjs/plugin/isSameOrAfter";
 import isSameOrBefore from "dayjs/plugin/isSameOrBefore";
+import { usePagedList } from "./usePagedList";
+import LoadMoreButton from "./LoadMoreButton";
 dayjs.extend(isSameOrBefore);
 dayjs.extend(isSameOrAfter);
 
@@ -31,7 +33,8 @@ function getStatus(start, end) {
 }
 
 export default function CycleConfigManager({ open, onClose, member }) {
-  const [cycles, setCycles] = useState([]);
+  const cycleList = usePagedList();
+  const { items: cycles, setItems: setCycles } = cycleList;
   const [editIdx, setEditIdx] = useState(null);
   const [editRow, setEditRow] = useState(null);
   const [error, setError] = useState("");
@@ -46,15 +49,10 @@ export default function CycleConfigManager({ open, onClose, member }) {
       setLoading(true);
       setError("");
       try {
-        const response = await fetch(`${API_BASE}/cycle-plans/?member_id=${member.id}`, {
-          headers: getAuthHeaders()
-        });
-        if (!response.ok) throw new Error(`HTTP error! status: ${response.status}`);
-        const data = await response.json();
-        setCycles(Array.isArray(data) ? data : []);
+        await cycleList.load("/cycle-plans/", { member_id: member.id, gym_id: member.gym_id });
       } catch (err) {
         setError(`Failed to load cycles: ${err.message}`);
-        setCycles([]);
+        cycleList.clear();
       } finally {
         setLoading(false);
       }
@@ -334,6 +332,7 @@ export default function CycleConfigManager({ open, onClose, member }) {
           </TableBody>
         </Table>
       </TableContainer>
+      <LoadMoreButton list={cycleList} />
       <Box sx={{ mt: 2, textAlign: "right" }}>
         <Button variant="contained" onClick={onClose}>Close</Button>
       </Box>
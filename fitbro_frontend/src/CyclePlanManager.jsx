@@ -7,6 +7,8 @@ import {
 import EditIcon from "@mui/icons-material/Edit";
 import DeleteIcon from "@mui/icons-material/Delete";
 import AddIcon from "@mui/icons-material/Add";
+import { usePagedList } from "./usePagedList";
+import LoadMoreButton from "./LoadMoreButton";
 
 const API_BASE = "http://localhost:8000";
 function getAuthHeaders() {
@@ -15,9 +17,12 @@ function getAuthHeaders() {
 }
 
 export default function CyclePlanManager() {
-    const [cycles, setCycles] = useState([]);
-    const [members, setMembers] = useState([]);
-    const [plans, setPlans] = useState([]);
+    const cycleList = usePagedList();
+    const memberList = usePagedList();
+    const planList = usePagedList();
+    const cycles = cycleList.items.filter(c => !c.is_deleted); // active only
+    const members = memberList.items;
+    const plans = planList.items;
     const [loading, setLoading] = useState(true);
     const [formOpen, setFormOpen] = useState(false);
     const [form, setForm] = useState({
@@ -40,14 +45,11 @@ export default function CyclePlanManager() {
     async function fetchAll() {
         setLoading(true);
         // Fetch members
-        const mems = await fetch(`${API_BASE}/members/`, { headers: getAuthHeaders() }).then(res => res.json());
-        setMembers(mems);
+        await memberList.load("/members/");
         // Fetch membership plans
-        const mp = await fetch(`${API_BASE}/membership-plans/`, { headers: getAuthHeaders() }).then(res => res.json());
-        setPlans(mp);
-        // Fetch cycles (active only)
-        const cycles = await fetch(`${API_BASE}/cycle-plans/`, { headers: getAuthHeaders() }).then(res => res.json());
-        setCycles(cycles.filter(c => !c.is_deleted));
+        await planList.load("/membership-plans/");
+        // Fetch cycles
+        await cycleList.load("/cycle-plans/");
         setLoading(false);
     }
 
@@ -227,6 +229,7 @@ export default function CyclePlanManager() {
                     ))}
                 </TableBody>
             </Table>
+            <LoadMoreButton list={cycleList} />
 
             {/* Add/Edit Cycle Dialog */}
             <Dialog open={formOpen} onClose={() => setFormOpen(false)} maxWidth="xs" fullWidth>
@@ -251,6 +254,7 @@ export default function CyclePlanManager() {
                         ) : (
                             <TextField label="Member" value={getMemberName(form.member_id)} InputProps={{ readOnly: true }} fullWidth />
                         )}
+                        {formMode === "add" && <LoadMoreButton list={memberList} label="More members" />}
                         <TextField
                             label="Membership Plan"
                             value={getMemberPlan(form.member_id)}
@@ -4,38 +4,31 @@ import {
   TableContainer, TableHead, TableRow, Paper, Button, Stack, Dialog, Alert
 } from "@mui/material";
 import CycleConfigManager from "./CycleConfigManager";
-
-const API_BASE = "http://localhost:8000";
-
-function getAuthHeaders() {
-  const token = sessionStorage.getItem("token");
-  return token ? { Authorization: `Bearer ${token}` } : {};
-}
+import { usePagedList } from "./usePagedList";
+import LoadMoreButton from "./LoadMoreButton";
 
 export default function CyclePlanManagerLanding() {
-  const [members, setMembers] = useState([]);
-  const [plans, setPlans] = useState([]);
+  const memberList = usePagedList();
+  const planList = usePagedList();
+  const members = memberList.items;
+  const plans = planList.items;
   const [search, setSearch] = useState("");
   const [selectedMember, setSelectedMember] = useState(null);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState("");
 
-  // Fetch paginated members
+  // Fetch the first page of members; "Load more" fetches the rest
   useEffect(() => {
     setLoading(true);
     setError("");
-    fetch(`${API_BASE}/members/?page=1&page_size=50`, { headers: getAuthHeaders() })
-      .then(r => r.json())
-      .then(data => setMembers(Array.isArray(data) ? data : []))
+    memberList.load("/members/")
       .catch(e => setError("Failed to load members: " + e.message))
       .finally(() => setLoading(false));
   }, []);
 
-  // Fetch all membership plans for lookup
+  // Fetch membership plans for lookup
   useEffect(() => {
-    fetch(`${API_BASE}/membership-plans/`, { headers: getAuthHeaders() })
-      .then(r => r.json())
-      .then(data => setPlans(Array.isArray(data) ? data : []))
+    planList.load("/membership-plans/")
       .catch(e => setError("Failed to load plans: " + e.message));
   }, []);
 
@@ -105,6 +98,8 @@ export default function CyclePlanManagerLanding() {
           </TableBody>
         </Table>
       </TableContainer>
+      <LoadMoreButton list={memberList} label="More members" />
+      <LoadMoreButton list={planList} label="More plans" />
       {/* Pop-up for cycle config */}
       <Dialog open={!!selectedMember} onClose={() => setSelectedMember(null)} maxWidth="md" fullWidth>
         {selectedMember && (
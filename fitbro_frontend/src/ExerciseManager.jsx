@@ -8,12 +8,12 @@ import FitnessCenterIcon from "@mui/icons-material/FitnessCenter";
 import AddIcon from "@mui/icons-material/Add";
 import EditIcon from "@mui/icons-material/Edit";
 import ClearIcon from "@mui/icons-material/Clear";
+import { usePagedList } from "./usePagedList";
+import LoadMoreButton from "./LoadMoreButton";
 import SearchIcon from "@mui/icons-material/Search";
 import DeleteIcon from "@mui/icons-material/Delete";
 
 const EXERCISE_API = "http://localhost:8000/exercises";
-const WORKOUT_API = "http://localhost:8000/workouts";
-const EQUIPMENT_API = "http://localhost:8000/equipment/";
 
 function getAuthHeaders() {
     const token = sessionStorage.getItem("token");
@@ -21,9 +21,12 @@ function getAuthHeaders() {
 }
 
 export default function ExerciseManager() {
-    const [exercises, setExercises] = useState([]);
-    const [workouts, setWorkouts] = useState([]);
-    const [equipments, setEquipments] = useState([]);
+    const exerciseList = usePagedList();
+    const workoutList = usePagedList();
+    const equipmentList = usePagedList();
+    const { items: exercises, setItems: setExercises } = exerciseList;
+    const workouts = workoutList.items;
+    const equipments = equipmentList.items;
     const [loading, setLoading] = useState(true);
     const [showForm, setShowForm] = useState(false);
     const [editing, setEditing] = useState(null);
@@ -44,12 +47,9 @@ export default function ExerciseManager() {
         setLoading(true);
         setError("");
         try {
-            const resEx = await fetch(EXERCISE_API + "/", { headers: getAuthHeaders() });
-            setExercises(await resEx.json());
-            const resWo = await fetch(WORKOUT_API + "/", { headers: getAuthHeaders() });
-            setWorkouts(await resWo.json());
-            const resEq = await fetch(EQUIPMENT_API, { headers: getAuthHeaders() });
-            setEquipments(await resEq.json());
+            await exerciseList.load("/exercises/");
+            await workoutList.load("/workouts/");
+            await equipmentList.load("/equipment/");
         } catch {
             setError("Could not fetch exercises, workouts, or equipments.");
         }
@@ -275,6 +275,7 @@ export default function ExerciseManager() {
             {loading ? (
                 <Box display="flex" justifyContent="center" mt={5}><CircularProgress /></Box>
             ) : (
+                <>
                 <Grid container spacing={2}>
                     {filteredExercises.map(ex => (
                         <Grid item xs={12} sm={6} md={4} key={ex.id}>
@@ -282,6 +283,8 @@ export default function ExerciseManager() {
                         </Grid>
                     ))}
                 </Grid>
+                <LoadMoreButton list={exerciseList} />
+                </>
             )}
 
             <Zoom in={!loading}>
@@ -329,6 +332,7 @@ export default function ExerciseManager() {
                                 ))}
                             </Select>
                         </FormControl>
+                        <LoadMoreButton list={workoutList} label="More workouts" />
                         <TextField
                             name="name"
                             label="Exercise Name"
@@ -388,6 +392,7 @@ export default function ExerciseManager() {
                                 ))}
                             </Select>
                         </FormControl>
+                        <LoadMoreButton list={equipmentList} label="More equipment" />
                     </DialogContent>
                     <DialogActions sx={{ px: 3, pb: 2 }}>
                         <Button onClick={handleCloseForm} disabled={formLoading}>Cancel</Button>
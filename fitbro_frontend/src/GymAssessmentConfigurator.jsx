@@ -1,6 +1,7 @@
 import React, { useEffect, useState } from "react";
 import { Paper, Typography, TextField, Checkbox, Button, IconButton, Stack, Snackbar, Alert, Divider, Box, CircularProgress } from "@mui/material";
 import { Add, Delete } from "@mui/icons-material";
+import { fetchPage } from "./api";
 
 const API_BASE = "http://localhost:8000";
 const GYM_ID = 1; // Replace with logged-in user's gym_id!
@@ -20,13 +21,11 @@ export default function GymAssessmentConfigurator() {
             setLoading(true);
             try {
                 // 1. Get standard attributes
-                const stdRes = await fetch(`${API_BASE}/assessment-templates?master_only=1`);
-                const stdData = await stdRes.json();
+                const { items: stdData } = await fetchPage("/assessment-templates/", { master_only: 1, limit: 1 });
                 const stdList = JSON.parse((stdData[0] && stdData[0].template_json) || "[]");
                 setStdAttrs(stdList);
                 // 2. Get gym-level template (attribute pool for this gym, is_master=false, gym_id=this gym)
-                const gymRes = await fetch(`${API_BASE}/assessment-templates?gym_id=${GYM_ID}`);
-                const gymData = await gymRes.json();
+                const { items: gymData } = await fetchPage("/assessment-templates/", { gym_id: GYM_ID, limit: 1 });
                 if (gymData.length) {
                     setTemplateId(gymData[0].id);
                     const gymAttrs = JSON.parse(gymData[0].template_json || "[]");
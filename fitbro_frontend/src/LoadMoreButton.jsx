@@ -0,0 +1,25 @@
+// src/LoadMoreButton.jsx
+import React from "react";
+import { Box, Button, CircularProgress } from "@mui/material";
+
+// "Load more" for a usePagedList list; renders nothing once the last page is in
+export default function LoadMoreButton({ list, label = "Load more", sx }) {
+    if (!list.hasMore) return null;
+
+    async function handleClick() {
+        try {
+            await list.loadMore();
+        } catch (e) {
+            alert("Failed to load more: " + (e?.message || e));
+        }
+    }
+
+    return (
+        <Box sx={{ display: "flex", justifyContent: "center", my: 2, ...sx }}>
+            <Button variant="outlined" onClick={handleClick} disabled={list.loadingMore}
+                startIcon={list.loadingMore ? <CircularProgress size={16} /> : null}>
+                {label}
+            </Button>
+        </Box>
+    );
+}
@@ -1,4 +1,4 @@
-import React, { useEffect, useState, useRef, useCallback } from "react";
+import React, { useEffect, useState, useRef, useCallback, useMemo } from "react";
 import {
   Box, Typography, Card, CardContent, Button, Select, MenuItem, Snackbar, Alert,
   IconButton, Chip, Stack, CircularProgress, TextField, Divider, Dialog, DialogTitle,
@@ -9,6 +9,8 @@ import ArrowForwardIosIcon from "@mui/icons-material/ArrowForwardIos";
 import DoneAllIcon from "@mui/icons-material/DoneAll";
 import SwapHorizIcon from "@mui/icons-material/SwapHoriz";
 import dayjs from "dayjs";
+import { usePagedList } from "./usePagedList";
+import LoadMoreButton from "./LoadMoreButton";
 
 const API_BASE = "http://localhost:8000";
 
@@ -30,16 +32,16 @@ function getDateArray(startDate, endDate) {
 
 export default function LogWorkoutPro() {
   // --- State ---
-  const [members, setMembers] = useState([]);
-  const [cycles, setCycles] = useState([]);
+  const memberList = usePagedList();
+  const cycleList = usePagedList();
   const [selectedMember, setSelectedMember] = useState("");
   const [selectedCycle, setSelectedCycle] = useState("");
-  const [workouts, setWorkouts] = useState([]);
-  const [exercises, setExercises] = useState([]);
+  const workoutList = usePagedList();
+  const exerciseList = usePagedList();
   const [dates, setDates] = useState([]);
   const [activeDateIdx, setActiveDateIdx] = useState(0);
-  const [plan, setPlan] = useState([]);
-  const [logs, setLogs] = useState({});
+  const entryList = usePagedList();
+  const logList = usePagedList();
   const [actuals, setActuals] = useState({});
   const [notes, setNotes] = useState({});
   const [msg, setMsg] = useState("");
@@ -54,30 +56,27 @@ export default function LogWorkoutPro() {
 
   const dateStripRef = useRef();
 
+  const members = memberList.items;
+  const cycles = cycleList.items;
+  const workouts = workoutList.items;
+  const exercises = exerciseList.items;
+
   // --- Fetch Members, Cycles, Workouts, Exercises ---
   useEffect(() => {
-    fetch(`${API_BASE}/members/`, { headers: getAuthHeaders() })
-      .then(res => res.json())
-      .then(setMembers)
+    memberList.load("/members/")
       .catch(() => setError("Failed to fetch members"));
-    fetch(`${API_BASE}/workouts/`, { headers: getAuthHeaders() })
-      .then(res => res.json())
-      .then(setWorkouts);
-    fetch(`${API_BASE}/exercises/`, { headers: getAuthHeaders() })
-      .then(res => res.json())
-      .then(setExercises);
+    workoutList.load("/workouts/");
+    exerciseList.load("/exercises/");
   }, []);
 
   useEffect(() => {
     if (!selectedMember) {
-      setCycles([]);
+      cycleList.clear();
       setSelectedCycle("");
       return;
     }
-    fetch(`${API_BASE}/cycle-plans/?member_id=${selectedMember}`, { headers: getAuthHeaders() })
-      .then(res => res.json())
+    cycleList.load("/cycle-plans/", { member_id: selectedMember })
       .then(data => {
-        setCycles(data || []);
         if (data.length > 0) setSelectedCycle(data[0].id);
         else setSelectedCycle("");
       });
@@ -87,7 +86,7 @@ export default function LogWorkoutPro() {
   useEffect(() => {
     if (!selectedCycle) {
       setDates([]);
-      setPlan([]);
+      entryList.clear();
       setActiveDateIdx(0);
       return;
     }
@@ -100,56 +99,53 @@ export default function LogWorkoutPro() {
       return todayIdx >= 0 ? todayIdx : 0;
     });
 
-    fetch(`${API_BASE}/workout-plan-entries/?member_id=${cycle.member_id}&cycle_plan_id=${cycle.id}`, {
-      headers: getAuthHeaders()
-    })
-      .then(res => res.json())
-      .then(data => {
-        const byDate = {};
-        for (const entry of data) {
-          if (!entry.day_date) continue;
-          let exerciseName = entry.exercise_name;
-          if (!exerciseName && Array.isArray(exercises)) {
-            const exObj = exercises.find(ex => ex.id === entry.exercise_id);
-            if (exObj) exerciseName = exObj.name;
-          }
-          let workoutName = entry.workout_name;
-          if (!workoutName && Array.isArray(workouts)) {
-            const wkObj = workouts.find(wk => wk.id === entry.workout_id);
-            if (wkObj) workoutName = wkObj.name;
-          }
-          const fixedEntry = { ...entry, exercise_name: exerciseName, workout_name: workoutName };
-          if (!byDate[entry.day_date]) byDate[entry.day_date] = [];
-          byDate[entry.day_date].push(fixedEntry);
-        }
-        setPlan(ds.map(date => ({
-          date,
-          exercises: (byDate[date] || []).map(e => ({ ...e }))
-        })));
-      })
+    entryList.load("/workout-plan-entries/", { member_id: cycle.member_id, cycle_plan_id: cycle.id })
       .catch(() => setError("Failed to load workout plan"));
-  }, [selectedCycle, cycles, exercises, workouts]);
+  }, [selectedCycle, cycles]);
+
+  // Entries loaded so far, by day; "Load more" fills in the later days
+  const plan = useMemo(() => {
+    const byDate = {};
+    for (const entry of entryList.items) {
+      if (!entry.day_date) continue;
+      let exerciseName = entry.exercise_name;
+      if (!exerciseName && Array.isArray(exercises)) {
+        const exObj = exercises.find(ex => ex.id === entry.exercise_id);
+        if (exObj) exerciseName = exObj.name;
+      }
+      let workoutName = entry.workout_name;
+      if (!workoutName && Array.isArray(workouts)) {
+        const wkObj = workouts.find(wk => wk.id === entry.workout_id);
+        if (wkObj) workoutName = wkObj.name;
+      }
+      const fixedEntry = { ...entry, exercise_name: exerciseName, workout_name: workoutName };
+      if (!byDate[entry.day_date]) byDate[entry.day_date] = [];
+      byDate[entry.day_date].push(fixedEntry);
+    }
+    return dates.map(date => ({
+      date,
+      exercises: (byDate[date] || []).map(e => ({ ...e }))
+    }));
+  }, [entryList.items, dates, exercises, workouts]);
 
   // --- Fetch Logs for member/cycle, day_date only ---
   const fetchLogs = useCallback(() => {
     if (!selectedMember || !selectedCycle) {
-      setLogs({});
+      logList.clear();
       return;
     }
-    fetch(`${API_BASE}/workout-logs/`, { headers: getAuthHeaders() })
-      .then(res => res.json())
-      .then(data => {
-        const byDate = {};
-        data.filter(
-          l => l.member_id === Number(selectedMember) && l.cycle_plan_id === Number(selectedCycle)
-        ).forEach(l => {
-          if (!byDate[l.workout_date]) byDate[l.workout_date] = {};
-          byDate[l.workout_date][l.exercise_id] = l;
-        });
-        setLogs(byDate);
-      });
+    logList.load("/workout-logs/", { member_id: selectedMember, cycle_plan_id: selectedCycle });
   }, [selectedMember, selectedCycle, plan.length]);
 
+  const logs = useMemo(() => {
+    const byDate = {};
+    logList.items.forEach(l => {
+      if (!byDate[l.workout_date]) byDate[l.workout_date] = {};
+      byDate[l.workout_date][l.exercise_id] = l;
+    });
+    return byDate;
+  }, [logList.items]);
+
   useEffect(() => {
     fetchLogs();
   }, [fetchLogs, reloadLogsKey]);
@@ -337,6 +333,7 @@ export default function LogWorkoutPro() {
             <MenuItem key={m.id} value={m.id}>{m.name}</MenuItem>
           ))}
         </Select>
+        <LoadMoreButton list={memberList} label="More members" sx={{ my: 0 }} />
         <Select
           value={selectedCycle}
           onChange={e => setSelectedCycle(e.target.value)}
@@ -351,6 +348,7 @@ export default function LogWorkoutPro() {
             </MenuItem>
           ))}
         </Select>
+        <LoadMoreButton list={cycleList} label="More cycles" sx={{ my: 0 }} />
         {cycle && (
           <Chip
             label={`Status: ${cycle.status}`}
@@ -633,6 +631,8 @@ export default function LogWorkoutPro() {
             No exercises planned for this day.
           </Typography>
         )}
+        <LoadMoreButton list={entryList} label="Load more of the plan" />
+        <LoadMoreButton list={logList} label="Load more logs" />
 
         {/* SWAP DAY DIALOG */}
         <Dialog open={swapOpen} onClose={() => setSwapOpen(false)}>
@@ -1,6 +1,7 @@
 import React, { useState } from "react";
 import { TextField, Button, Box, Typography, Alert } from "@mui/material";
 import { useNavigate, useLocation } from "react-router-dom";
+import { saveSession } from "./auth";
 
 export default function Login({ onLogin }) {
     const [mobile, setMobile] = useState("");
@@ -23,9 +24,7 @@ export default function Login({ onLogin }) {
             });
             if (!res.ok) throw new Error("Invalid mobile or password");
             const data = await res.json();
-            sessionStorage.setItem("token", data.access_token);
-            sessionStorage.setItem("role", data.role);
-            sessionStorage.setItem("name", data.name);
+            saveSession(data);
             onLogin && onLogin(data);
             const redirectTo = location.state?.from?.pathname || "/";
             navigate(redirectTo, { replace: true });
@@ -9,10 +9,10 @@ import EditIcon from "@mui/icons-material/Edit";
 import DeleteIcon from "@mui/icons-material/Delete";
 import AddIcon from "@mui/icons-material/Add";
 import dayjs from "dayjs";
+import { usePagedList } from "./usePagedList";
+import LoadMoreButton from "./LoadMoreButton";
 
 const MEMBER_API = "http://localhost:8000/members/";
-const GYM_API = "http://localhost:8000/gyms/";
-const PLAN_API = "http://localhost:8000/membership-plans/";
 
 function getAuthHeaders() {
     const token = sessionStorage.getItem("token");
@@ -20,9 +20,12 @@ function getAuthHeaders() {
 }
 
 export default function MemberManager() {
-    const [members, setMembers] = useState([]);
-    const [gyms, setGyms] = useState([]);
-    const [plans, setPlans] = useState([]);
+    const memberList = usePagedList();
+    const gymList = usePagedList();
+    const planList = usePagedList();
+    const { items: members, setItems: setMembers } = memberList;
+    const gyms = gymList.items;
+    const plans = planList.items;
     const [loading, setLoading] = useState(true);
     const [open, setOpen] = useState(false);
     const [editing, setEditing] = useState(null);
@@ -38,35 +41,10 @@ export default function MemberManager() {
         setLoading(true);
         setError("");
         try {
-            // Fetch members
-            const res = await fetch(MEMBER_API, { headers: getAuthHeaders() });
-            if (!res.ok) {
-                const msg = `Members API failed: ${res.status}`;
-                setError(msg);
-                alert(msg);
-            } else {
-                setMembers(await res.json());
-            }
-
-            // Fetch gyms
-            const gres = await fetch(GYM_API, { headers: getAuthHeaders() });
-            if (!gres.ok) {
-                const msg = `Gyms API failed: ${gres.status}`;
-                setError(msg);
-                alert(msg);
-            } else {
-                setGyms(await gres.json());
-            }
-
-            // Fetch membership plans
-            const pres = await fetch(PLAN_API, { headers: getAuthHeaders() });
-            if (!pres.ok) {
-                const msg = `Plans API failed: ${pres.status}`;
-                setError(msg);
-                alert(msg);
-            } else {
-                setPlans(await pres.json());
-            }
+            // Fetch members, gyms (not gym-scoped) and membership plans
+            await memberList.load("/members/");
+            await gymList.load("/gyms/", { gym_id: null });
+            await planList.load("/membership-plans/");
         } catch (e) {
             setError("Failed to fetch data: " + (e?.message || e));
             alert("Failed to fetch data: " + (e?.message || e));
@@ -217,6 +195,7 @@ export default function MemberManager() {
                 </Snackbar>
             )}
             {loading ? <CircularProgress sx={{ mt: 5 }} /> : (
+                <>
                 <Grid container spacing={2}>
                     {members.map((member) => (
                         <Grid item xs={12} sm={6} md={4} key={member.id}>
@@ -259,6 +238,8 @@ export default function MemberManager() {
                         </Grid>
                     ))}
                 </Grid>
+                <LoadMoreButton list={memberList} />
+                </>
             )}
 
             <Dialog open={open} onClose={() => setOpen(false)} maxWidth="sm" fullWidth>
@@ -345,6 +326,7 @@ export default function MemberManager() {
                                 ))}
                             </Select>
                         </FormControl>
+                        <LoadMoreButton list={gymList} label="More gyms" />
                         <FormControl required>
                             <InputLabel>Membership Plan</InputLabel>
                             <Select
@@ -360,6 +342,7 @@ export default function MemberManager() {
                                 ))}
                             </Select>
                         </FormControl>
+                        <LoadMoreButton list={planList} label="More plans" />
                         <TextField
                             label="Membership Start Date"
                             name="membership_start_date"
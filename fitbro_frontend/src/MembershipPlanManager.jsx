@@ -8,9 +8,10 @@ import GroupIcon from "@mui/icons-material/Group";
 import EditIcon from "@mui/icons-material/Edit";
 import DeleteIcon from "@mui/icons-material/Delete";
 import AddIcon from "@mui/icons-material/Add";
+import { usePagedList } from "./usePagedList";
+import LoadMoreButton from "./LoadMoreButton";
 
 const PLAN_API = "http://localhost:8000/membership-plans/";
-const PROGRAM_API = "http://localhost:8000/programs/";
 
 function getAuthHeaders() {
     const token = sessionStorage.getItem("token");
@@ -18,8 +19,10 @@ function getAuthHeaders() {
 }
 
 export default function MembershipPlanManager() {
-    const [plans, setPlans] = useState([]);
-    const [programs, setPrograms] = useState([]);
+    const planList = usePagedList();
+    const programList = usePagedList();
+    const { items: plans, setItems: setPlans } = planList;
+    const programs = programList.items;
     const [loading, setLoading] = useState(true);
     const [open, setOpen] = useState(false);
     const [editing, setEditing] = useState(null);
@@ -35,11 +38,9 @@ export default function MembershipPlanManager() {
         setLoading(true);
         try {
             // Fetch plans
-            const res = await fetch(PLAN_API, { headers: getAuthHeaders() });
-            setPlans(await res.json());
+            await planList.load("/membership-plans/");
             // Fetch programs
-            const pres = await fetch(PROGRAM_API, { headers: getAuthHeaders() });
-            setPrograms(await pres.json());
+            await programList.load("/programs/");
         } catch {
             setError("Failed to fetch data");
         }
@@ -166,6 +167,7 @@ export default function MembershipPlanManager() {
                 </Snackbar>
             )}
             {loading ? <CircularProgress sx={{ mt: 5 }} /> : (
+                <>
                 <Grid container spacing={2}>
                     {plans.map((plan) => (
                         <Grid item xs={12} sm={6} md={4} key={plan.id}>
@@ -219,6 +221,8 @@ export default function MembershipPlanManager() {
                         </Grid>
                     ))}
                 </Grid>
+                <LoadMoreButton list={planList} />
+                </>
             )}
 
             <Dialog open={open} onClose={() => setOpen(false)} maxWidth="sm" fullWidth>
@@ -261,6 +265,7 @@ export default function MembershipPlanManager() {
                                 ))}
                             </Select>
                         </FormControl>
+                        <LoadMoreButton list={programList} label="More programs" />
                         <FormControl>
                             <InputLabel>Type</InputLabel>
                             <Select
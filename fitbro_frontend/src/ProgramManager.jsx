@@ -16,6 +16,8 @@ import ClearIcon from "@mui/icons-material/Clear";
 import CheckCircleIcon from "@mui/icons-material/CheckCircle";
 import ArchiveIcon from "@mui/icons-material/Archive";
 import DraftsIcon from "@mui/icons-material/Drafts";
+import { usePagedList } from "./usePagedList";
+import LoadMoreButton from "./LoadMoreButton";
 
 const API_BASE = "http://localhost:8000/programs";
 
@@ -28,8 +30,10 @@ const ROLE = "FitBro Admin"; // Replace with actual role from auth context
 const MY_GYM_ID = "XYZ_GYM_ID"; // Replace with real gym_id from user context
 
 export default function ProgramManager() {
-    const [programs, setPrograms] = useState([]);
-    const [allWorkouts, setAllWorkouts] = useState([]);
+    const programList = usePagedList();
+    const workoutList = usePagedList();
+    const { items: programs, setItems: setPrograms } = programList;
+    const allWorkouts = workoutList.items;
     const [loading, setLoading] = useState(false);
     const [showForm, setShowForm] = useState(false);
     const [editing, setEditing] = useState(null);
@@ -60,15 +64,7 @@ export default function ProgramManager() {
         setLoading(true);
         setError("");
         try {
-            const res = await fetch(API_BASE + "/", {
-                headers: {
-                    "Content-Type": "application/json",
-                    ...getAuthHeaders()
-                }
-            });
-            if (!res.ok) throw new Error();
-            const data = await res.json();
-            setPrograms(data);
+            await programList.load("/programs/");
         } catch {
             setError("Could not fetch programs. Please try again.");
         }
@@ -77,15 +73,7 @@ export default function ProgramManager() {
 
     async function fetchWorkouts() {
         try {
-            const res = await fetch("http://localhost:8000/workouts/", {
-                headers: {
-                    "Content-Type": "application/json",
-                    ...getAuthHeaders()
-                }
-            });
-            if (!res.ok) throw new Error();
-            const data = await res.json();
-            setAllWorkouts(data); // Each workout: {id, name, ...}
+            await workoutList.load("/workouts/"); // Each workout: {id, name, ...}
         } catch {
             setError("Could not fetch workouts.");
         }
@@ -485,6 +473,7 @@ export default function ProgramManager() {
                             ))}
                         </Grid>
                     )}
+                    <LoadMoreButton list={programList} />
                 </>
             )}
 
@@ -570,6 +559,7 @@ export default function ProgramManager() {
                                     />
                                 )}
                             />
+                            <LoadMoreButton list={workoutList} label="More workouts" />
                             <TextField
                                 select
                                 name="status"
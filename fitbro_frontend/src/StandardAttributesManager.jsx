@@ -1,6 +1,7 @@
 import React, { useEffect, useState } from "react";
 import { Paper, Typography, TextField, Checkbox, Button, IconButton, Stack, Snackbar, Alert, Divider, Box, CircularProgress } from "@mui/material";
 import { Add, Delete } from "@mui/icons-material";
+import { fetchPage } from "./api";
 
 const API_BASE = "http://localhost:8000";
 
@@ -16,8 +17,7 @@ export default function StandardAttributesManager() {
         async function fetchAttrs() {
             setLoading(true);
             try {
-                const res = await fetch(`${API_BASE}/assessment-templates?master_only=1`);
-                const data = await res.json();
+                const { items: data } = await fetchPage("/assessment-templates/", { master_only: 1, limit: 1 });
                 if (!data.length) {
                     // Auto-create master template!
                     await fetch(`${API_BASE}/assessment-templates`, {
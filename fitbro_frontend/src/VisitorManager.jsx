@@ -3,9 +3,11 @@ import {
     Box, Typography, Grid, Card, CardContent, Button, TextField, Dialog,
     DialogTitle, DialogContent, DialogActions, Snackbar, Alert, MenuItem, Select, InputLabel, FormControl
 } from "@mui/material";
+import { getGymId } from "./api";
+import { usePagedList } from "./usePagedList";
+import LoadMoreButton from "./LoadMoreButton";
 
 const VISITOR_API = "http://localhost:8000/visitors/";
-const MEMBERSHIP_API = "http://localhost:8000/membership-plans/";
 const VISITOR_FOLLOWUP_API = "http://localhost:8000/visitor-followup/";
 
 function getAuthHeaders() {
@@ -13,18 +15,11 @@ function getAuthHeaders() {
     return token ? { Authorization: `Bearer ${token}` } : {};
 }
 
-function getGymId() {
-    try {
-        const user = JSON.parse(sessionStorage.getItem("user"));
-        return user?.gym_id || 1;
-    } catch {
-        return 1;
-    }
-}
-
 export default function VisitorManager() {
-    const [visitors, setVisitors] = useState([]);
-    const [plans, setPlans] = useState([]);
+    const visitorList = usePagedList();
+    const planList = usePagedList();
+    const visitors = visitorList.items;
+    const plans = planList.items;
     const [loading, setLoading] = useState(true);
     const [open, setOpen] = useState(false);
     const [form, setForm] = useState({});
@@ -39,6 +34,11 @@ export default function VisitorManager() {
     const gymId = getGymId();
 
     useEffect(() => {
+        if (!gymId) {
+            setError("Your login is not linked to a gym, so there are no visitors to show.");
+            setLoading(false);
+            return;
+        }
         fetchVisitors();
         fetchPlans();
     }, []);
@@ -46,8 +46,7 @@ export default function VisitorManager() {
     async function fetchVisitors() {
         setLoading(true);
         try {
-            const res = await fetch(VISITOR_API + `?gym_id=${gymId}`, { headers: getAuthHeaders() });
-            setVisitors(await res.json());
+            await visitorList.load("/visitors/", { gym_id: gymId });
         } catch {
             setError("Failed to load visitors.");
         }
@@ -56,10 +55,9 @@ export default function VisitorManager() {
 
     async function fetchPlans() {
         try {
-            const res = await fetch(MEMBERSHIP_API + `?gym_id=${gymId}`, { headers: getAuthHeaders() });
-            setPlans(await res.json());
+            await planList.load("/membership-plans/", { gym_id: gymId });
         } catch {
-            setPlans([]);
+            planList.clear();
         }
     }
 
@@ -212,8 +210,9 @@ export default function VisitorManager() {
                     </Grid>
                 ))}
             </Grid>
+            <LoadMoreButton list={planList} label="More plans" />
 
-            <Button variant="contained" sx={{ mb: 2 }} onClick={() => handleOpen()}>
+            <Button variant="contained" sx={{ mb: 2 }} onClick={() => handleOpen()} disabled={!gymId}>
                 + Add Visitor
             </Button>
 
@@ -283,6 +282,7 @@ export default function VisitorManager() {
                     </Grid>
                 ))}
             </Grid>
+            <LoadMoreButton list={visitorList} />
 
             {/* Add/Edit Visitor Dialog */}
             <Dialog open={open} onClose={handleClose} maxWidth="xs" fullWidth>
@@ -17,6 +17,8 @@ import ClearIcon from "@mui/icons-material/Clear";
 import CheckCircleIcon from "@mui/icons-material/CheckCircle";
 import ArchiveIcon from "@mui/icons-material/Archive";
 import DraftsIcon from "@mui/icons-material/Drafts";
+import { usePagedList } from "./usePagedList";
+import LoadMoreButton from "./LoadMoreButton";
 
 const API_BASE = "http://localhost:8000/workouts";
 
@@ -29,7 +31,8 @@ const ROLE = "FitBro Admin"; // Replace with actual role from auth context
 const MY_GYM_ID = 1; // Replace with actual gym_id from context
     
 export default function WorkoutManager() {
-    const [workouts, setWorkouts] = useState([]);
+    const workoutList = usePagedList();
+    const { items: workouts, setItems: setWorkouts } = workoutList;
     const [loading, setLoading] = useState(false);
     const [showForm, setShowForm] = useState(false);
     const [editing, setEditing] = useState(null);
@@ -50,10 +53,7 @@ export default function WorkoutManager() {
         setLoading(true);
         setError("");
         try {
-            const res = await fetch(API_BASE + "/", { headers: getAuthHeaders() });
-            if (!res.ok) throw new Error();
-            const data = await res.json();
-            setWorkouts(data);
+            await workoutList.load("/workouts/");
         } catch {
             setError("Could not fetch workouts. Please try again.");
         }
@@ -132,11 +132,10 @@ export default function WorkoutManager() {
             formFields.program_id && !isNaN(Number(formFields.program_id))
         );
     }
-    const [programs, setPrograms] = useState([]);
+    const programList = usePagedList();
+    const programs = programList.items;
     useEffect(() => {
-        fetch("http://localhost:8000/programs/", { headers: getAuthHeaders() })
-            .then(res => res.json())
-            .then(data => setPrograms(data));
+        programList.load("/programs/");
     }, []);
     async function handleSave(e) {
         e.preventDefault();
@@ -447,6 +446,7 @@ export default function WorkoutManager() {
                             ))}
                         </Grid>
                     )}
+                    <LoadMoreButton list={workoutList} />
                 </>
             )}
 
@@ -531,6 +531,7 @@ export default function WorkoutManager() {
                                 </MenuItem>
                             ))}
                         </TextField> 
+                        <LoadMoreButton list={programList} label="More programs" />
                         <FormControlLabel
                             control={
                                 <Switch
@@ -4,6 +4,8 @@ import {
     TableBody, TableCell, TableContainer, TableHead, TableRow, Paper, Dialog,
     DialogTitle, DialogContent, DialogActions, Select, MenuItem, Checkbox, TextField, Divider, Alert
 } from "@mui/material";
+import { usePagedList } from "./usePagedList";
+import LoadMoreButton from "./LoadMoreButton";
 
 const API_BASE = "http://localhost:8000";
 
@@ -24,41 +26,42 @@ function getDateArray(startDate, endDate) {
 }
 
 export default function WorkoutPlanManager() {
-    const [members, setMembers] = useState([]);
+    const memberList = usePagedList();
     const [selectedMember, setSelectedMember] = useState("");
-    const [cycles, setCycles] = useState([]);
+    const cycleList = usePagedList();
     const [selectedCycle, setSelectedCycle] = useState("");
-    const [workouts, setWorkouts] = useState([]);
-    const [exercises, setExercises] = useState([]);
-    const [plan, setPlan] = useState([]);
+    const workoutList = usePagedList();
+    const exerciseList = usePagedList();
+    const entryList = usePagedList();
     const [editDayIdx, setEditDayIdx] = useState(null);
     const [popupSelections, setPopupSelections] = useState([]);
     const [popupWorkouts, setPopupWorkouts] = useState([]);
     const [cycleAlert, setCycleAlert] = useState("");
     const [datesForCycle, setDatesForCycle] = useState([]);
+    const members = memberList.items;
+    const cycles = cycleList.items;
+    const workouts = workoutList.items;
+    const exercises = exerciseList.items;
+    // Re-mapped on every render, so names resolve as more workouts/exercises load
+    const plan = convertEntriesToPlan(entryList.items, datesForCycle, exercises, workouts);
 
     // Load members, workouts, exercises on mount
     useEffect(() => {
-        fetch(`${API_BASE}/members/`, { headers: getAuthHeaders() })
-            .then(res => res.json()).then(setMembers);
-        fetch(`${API_BASE}/workouts/`, { headers: getAuthHeaders() })
-            .then(res => res.json()).then(setWorkouts);
-        fetch(`${API_BASE}/exercises/`, { headers: getAuthHeaders() })
-            .then(res => res.json()).then(setExercises);
+        memberList.load("/members/");
+        workoutList.load("/workouts/");
+        exerciseList.load("/exercises/");
     }, []);
 
     // When member is selected, load cycles for that member only
     useEffect(() => {
         if (!selectedMember) {
-            setCycles([]);
+            cycleList.clear();
             setSelectedCycle("");
             setDatesForCycle([]);
             return;
         }
-        fetch(`${API_BASE}/cycle-plans/?member_id=${selectedMember}`, { headers: getAuthHeaders() })
-            .then(res => res.json())
+        cycleList.load("/cycle-plans/", { member_id: selectedMember })
             .then(data => {
-                setCycles(data);
                 setCycleAlert(`Fetched ${data.length} cycle(s) for this member`);
                 setTimeout(() => setCycleAlert(""), 2500);
                 if (data.length > 0) setSelectedCycle(data[0].id);
@@ -70,25 +73,20 @@ export default function WorkoutPlanManager() {
     useEffect(() => {
         if (!selectedCycle || !selectedMember) {
             setDatesForCycle([]);
-            setPlan([]);
+            entryList.clear();
             return;
         }
         const cycle = cycles.find(c => c.id === Number(selectedCycle));
         if (!cycle) {
             setDatesForCycle([]);
-            setPlan([]);
+            entryList.clear();
             return;
         }
         const dates = getDateArray(cycle.start_date, cycle.end_date);
         setDatesForCycle(dates);
 
-        fetch(`${API_BASE}/workout-plan-entries/?member_id=${selectedMember}&cycle_plan_id=${selectedCycle}`, {
-            headers: getAuthHeaders()
-        })
-            .then(res => res.json())
-            .then(data => setPlan(convertEntriesToPlan(data, dates, exercises, workouts)));
-    // rerun mapping when exercises or workouts change (for name lookup)
-    }, [selectedCycle, cycles, selectedMember, exercises, workouts]);
+        entryList.load("/workout-plan-entries/", { member_id: selectedMember, cycle_plan_id: selectedCycle });
+    }, [selectedCycle, cycles, selectedMember]);
 
     // === Fallback name mapping fix here ===
     function convertEntriesToPlan(entries, dates, exercises, workouts) {
@@ -217,11 +215,7 @@ export default function WorkoutPlanManager() {
         });
         Promise.all(savePromises).then(() => {
             // Refresh plan
-            fetch(`${API_BASE}/workout-plan-entries/?member_id=${memberId}&cycle_plan_id=${cyclePlanId}`, {
-                headers: getAuthHeaders()
-            })
-                .then(res => res.json())
-                .then(data => setPlan(convertEntriesToPlan(data, datesForCycle, exercises, workouts)));
+            entryList.load("/workout-plan-entries/", { member_id: memberId, cycle_plan_id: cyclePlanId });
             handlePopupClose();
         });
     }
@@ -250,6 +244,8 @@ export default function WorkoutPlanManager() {
                         </MenuItem>
                     ))}
                 </Select>
+                <LoadMoreButton list={memberList} label="More members" sx={{ my: 0 }} />
+                <LoadMoreButton list={cycleList} label="More cycles" sx={{ my: 0 }} />
             </Stack>
             {cycleAlert && <Alert severity="info" sx={{ mb: 2 }}>{cycleAlert}</Alert>}
 
@@ -342,6 +338,7 @@ export default function WorkoutPlanManager() {
                             </TableBody>
                         </Table>
                     </TableContainer>
+                    <LoadMoreButton list={entryList} label="More plan entries" />
                 </CardContent>
             </Card>
             {/* Pop-up Dialog */}
@@ -365,6 +362,8 @@ export default function WorkoutPlanManager() {
                                 </Button>
                             ))}
                         </Stack>
+                        <LoadMoreButton list={workoutList} label="More workouts" />
+                        <LoadMoreButton list={exerciseList} label="More exercises" />
                         {popupWorkouts.map(wkName => {
                             const wk = workouts.find(w => w.name === wkName);
                             if (!wk) return null;
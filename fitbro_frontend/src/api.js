@@ -0,0 +1,37 @@
+// src/api.js
+import { API_BASE } from "./constants";
+import { getAuthHeaders, refreshSession } from "./auth";
+
+const PAGE_LIMIT = 50;
+
+// The logged-in user's gym (from the login response); null for platform users
+export function getGymId() {
+    return Number(sessionStorage.getItem("gym_id")) || null;
+}
+
+export class NoGymError extends Error {
+    constructor() {
+        super("This login is not linked to a gym. Log in with a gym account.");
+    }
+}
+
+// List endpoints return { items, next_cursor } pages scoped to a gym.
+// Fetches one page; pass the previous page's next_cursor for the one after it,
+// and gym_id: null for unscoped lists (gyms). Without an explicit gym_id the
+// logged-in user's gym is used, and a user without one gets a NoGymError.
+export async function fetchPage(path, params = {}, cursor = null) {
+    if (!("gym_id" in params) && !getGymId()) throw new NoGymError();
+    const query = new URLSearchParams({ gym_id: getGymId(), limit: PAGE_LIMIT });
+    for (const [key, value] of Object.entries(params)) {
+        if (value === null || value === undefined) query.delete(key);
+        else query.set(key, value);
+    }
+    if (cursor) query.set("cursor", cursor);
+    let res = await fetch(`${API_BASE}${path}?${query}`, { headers: getAuthHeaders() });
+    if (res.status === 401 && await refreshSession()) {
+        // The access token expired before its scheduled renewal (e.g. a sleeping laptop)
+        res = await fetch(`${API_BASE}${path}?${query}`, { headers: getAuthHeaders() });
+    }
+    if (!res.ok) throw new Error(`GET ${path} failed: ${res.status}`);
+    return res.json();
+}
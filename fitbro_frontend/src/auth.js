@@ -1,4 +1,12 @@
 // src/auth.js
+import { API_BASE } from "./constants";
+
+// Access tokens are short-lived; the session renews itself with the refresh token
+// shortly before the access token expires, so every fetch that reads the token from
+// sessionStorage keeps working without handling expiry itself.
+const RENEW_BEFORE_MS = 60 * 1000;
+let renewTimer = null;
+let renewing = null;
 
 export function getAuthHeaders() {
     const token = sessionStorage.getItem("token");
@@ -21,8 +29,77 @@ export function isLoggedIn() {
     return !!getToken();
 }
 
+// Store a /auth/login or /auth/refresh response and schedule the next renewal
+export function saveSession(data) {
+    sessionStorage.setItem("token", data.access_token);
+    sessionStorage.setItem("refresh_token", data.refresh_token);
+    sessionStorage.setItem("token_expires_at", Date.now() + data.expires_in * 1000);
+    sessionStorage.setItem("role", data.role);
+    sessionStorage.setItem("name", data.name);
+    if ("gym_id" in data) {
+        // Refresh responses don't carry gym_id; platform users have none
+        if (data.gym_id === null) sessionStorage.removeItem("gym_id");
+        else sessionStorage.setItem("gym_id", data.gym_id);
+    }
+    scheduleRenewal();
+}
+
+export function scheduleRenewal() {
+    clearTimeout(renewTimer);
+    const expiresAt = Number(sessionStorage.getItem("token_expires_at"));
+    if (!expiresAt || !sessionStorage.getItem("refresh_token")) return;
+    renewTimer = setTimeout(refreshSession, Math.max(0, expiresAt - Date.now() - RENEW_BEFORE_MS));
+}
+
+// Each refresh token works once (presenting it twice revokes the session), so
+// concurrent callers share a single in-flight renewal. Resolves to false when the
+// session is gone and the user has to log in again.
+export function refreshSession() {
+    if (!renewing) {
+        renewing = renew().finally(() => { renewing = null; });
+    }
+    return renewing;
+}
+
+async function renew() {
+    const refreshToken = sessionStorage.getItem("refresh_token");
+    if (!refreshToken) return false;
+    try {
+        const res = await fetch(`${API_BASE}/auth/refresh`, {
+            method: "POST",
+            headers: { "Content-Type": "application/json" },
+            body: JSON.stringify({ refresh_token: refreshToken })
+        });
+        if (res.ok) {
+            saveSession(await res.json());
+            return true;
+        }
+    } catch {
+        // Offline: keep the session and try again shortly
+        clearTimeout(renewTimer);
+        renewTimer = setTimeout(refreshSession, RENEW_BEFORE_MS / 2);
+        return false;
+    }
+    clearSession();
+    window.location.assign("/login");
+    return false;
+}
+
+function clearSession() {
+    clearTimeout(renewTimer);
+    for (const key of ["token", "refresh_token", "token_expires_at", "role", "name", "gym_id"]) {
+        sessionStorage.removeItem(key);
+    }
+}
+
 export function logout() {
-    sessionStorage.removeItem("token");
-    sessionStorage.removeItem("role");
-    sessionStorage.removeItem("name");
+    const refreshToken = sessionStorage.getItem("refresh_token");
+    if (refreshToken) {
+        fetch(`${API_BASE}/auth/logout`, {
+            method: "POST",
+            headers: { "Content-Type": "application/json", ...getAuthHeaders() },
+            body: JSON.stringify({ refresh_token: refreshToken })
+        }).catch(() => {});
+    }
+    clearSession();
 }
@@ -2,8 +2,12 @@
 import React from "react";
 import ReactDOM from "react-dom/client";
 import App from "./App";
+import { scheduleRenewal } from "./auth";
 import "./index.css"; // If you have global styles
 
+// Resume renewing the access token after a page reload
+scheduleRenewal();
+
 ReactDOM.createRoot(document.getElementById("root")).render(
   <React.StrictMode>
     <App />